@@ -0,0 +1,165 @@
+import random
+import unittest
+import numpy as np
+from Model.GameOfLifeModel import GameOfLifeModel
+from Model.BitboardGameOfLifeModel import BitboardGameOfLifeModel, BAND_WORDS
+from Model.NumpyGameOfLifeModel import NumpyGameOfLifeModel
+
+
+class BitboardGameOfLifeModelTests(unittest.TestCase):
+    """ A class used to run tests for the BitboardGameOfLifeModel. """
+
+    def test_constructor(self):
+        m = BitboardGameOfLifeModel(10, 20)
+        self.assertEqual(m.get_width(), 10)
+        self.assertEqual(m.get_height(), 20)
+        self.assertEqual(len(m.get_grid()), 20)
+        self.assertEqual(len(m.get_grid()[0]), 10)
+        self.assertEqual(m.get_grid()[19][9], False)
+        with self.assertRaises(ValueError):
+            BitboardGameOfLifeModel(0, 10)
+        with self.assertRaises(ValueError):
+            BitboardGameOfLifeModel(10, -2)
+
+    def test_toggle_cell(self):
+        m = BitboardGameOfLifeModel(5, 5)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(3, 4)
+        self.assertIs(m.get_grid()[0][0], True)
+        self.assertIs(m.get_grid()[4][3], True)
+        m.toggle_cell(0, 0)
+        self.assertIs(m.get_grid()[0][0], False)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(-1, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(5, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(4, 5)
+
+    def test_update_state_edges(self):
+        m = BitboardGameOfLifeModel(3, 3)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(0, 1)
+        m.toggle_cell(1, 0)
+        m.update_state()
+        self.assertEqual(m.get_grid(), [[True, True, False],
+                                        [True, True, False],
+                                        [False, False, False]])
+
+    def test_matches_reference_model(self):
+        rng = random.Random(7)
+        for width, height in [(1, 1), (2, 7), (13, 5), (40, 31), (64, 3), (130, 9)]:
+            reference = GameOfLifeModel(width, height)
+            m = BitboardGameOfLifeModel(width, height)
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(15):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_step_matches_update_state(self):
+        rng = random.Random(11)
+        stepped = BitboardGameOfLifeModel(70, 20)
+        updated = BitboardGameOfLifeModel(70, 20)
+        for i in range(500):
+            x = rng.randrange(70)
+            y = rng.randrange(20)
+            stepped.toggle_cell(x, y)
+            updated.toggle_cell(x, y)
+        stepped.step(25)
+        for i in range(25):
+            updated.update_state()
+        self.assertEqual(stepped.get_grid(), updated.get_grid())
+        with self.assertRaises(ValueError):
+            stepped.step(-1)
+
+    def test_torus_matches_reference_model(self):
+        rng = random.Random(13)
+        for width, height in [(1, 1), (2, 7), (13, 5), (64, 4), (70, 9)]:
+            reference = GameOfLifeModel(width, height, 'torus')
+            m = BitboardGameOfLifeModel(width, height, 'torus')
+            self.assertEqual(m.get_topology(), 'torus')
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(12):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+
+    def test_rules_match_reference_model(self):
+        rng = random.Random(17)
+        for rule in ['B36/S23', 'B2/S', 'B1357/S1357', 'B0/S8', 'B01/S0123']:
+            for topology in ['bounded', 'torus']:
+                reference = GameOfLifeModel(70, 6, topology, rule)
+                m = BitboardGameOfLifeModel(70, 6, topology, rule)
+                self.assertEqual(m.get_rule(), reference.get_rule())
+                for y in range(6):
+                    for x in range(70):
+                        if rng.random() < 0.4:
+                            reference.toggle_cell(x, y)
+                            m.toggle_cell(x, y)
+                for i in range(8):
+                    reference.update_state()
+                    m.update_state()
+                    self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_bands_match_reference_model(self):
+        # a board of three bands, the last of which is only a few rows high
+        height = 2 * BAND_WORDS + 8
+        cells = np.argwhere(np.random.default_rng(19).random((height, 64)) < 0.4)[:, ::-1]
+        for topology in ['bounded', 'torus']:
+            reference = NumpyGameOfLifeModel(64, height, topology)
+            m = BitboardGameOfLifeModel(64, height, topology)
+            reference.set_cells(cells)
+            m.set_cells(cells)
+            for i in range(4):
+                reference.update_state()
+                m.update_state()
+            self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_bulk_operations(self):
+        reference = GameOfLifeModel(70, 9)
+        m = BitboardGameOfLifeModel(70, 9)
+        glider = [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]
+        for model in (reference, m):
+            model.stamp(glider, 60, 1)
+            model.set_cells([(0, 0), (63, 8), (64, 8), (0, 0)])
+            model.set_cells([(62, 3)], False)
+            self.assertRaises(ValueError, model.set_cells, [(1, 1), (70, 0)])
+        for i in range(6):
+            self.assertEqual(m.get_grid(), reference.get_grid())
+            reference.update_state()
+            m.update_state()
+        m.clear()
+        self.assertEqual(m.get_grid(), [[False] * 70 for i in range(9)])
+
+
+    def test_population_and_bounding_box(self):
+        reference = GameOfLifeModel(130, 9)
+        m = BitboardGameOfLifeModel(130, 9, 'torus')
+        self.assertEqual((m.population(), m.bounding_box()), (0, None))
+        # the cells span three words, and the torus fills the padding rows
+        for model in (reference, m):
+            model.set_cells([(65, 0), (66, 0), (67, 0), (129, 4), (0, 8), (63, 8)])
+        self.assertEqual((m.population(), m.bounding_box()), (6, (0, 0, 129, 8)))
+        m.update_state()
+        reference = GameOfLifeModel(130, 9, 'torus')
+        reference.set_cells([(x, y) for y, row in enumerate(m.get_grid()) for x, cell in enumerate(row) if cell])
+        self.assertEqual((m.population(), m.bounding_box()), (reference.population(), reference.bounding_box()))
+        view = m.get_grid_view()
+        self.assertEqual(view.shape, (9, 130))
+        self.assertEqual(view.astype(bool).tolist(), m.get_grid())
+        with self.assertRaises(ValueError):
+            view[0, 0] = 1
+
+
+if __name__ == '__main__':
+    unittest.main()
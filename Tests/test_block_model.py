@@ -0,0 +1,122 @@
+import random
+import unittest
+from Model.GameOfLifeModel import GameOfLifeModel
+from Model.BlockGameOfLifeModel import BlockGameOfLifeModel
+
+
+class BlockGameOfLifeModelTests(unittest.TestCase):
+    """ A class used to run tests for the BlockGameOfLifeModel. """
+
+    def test_constructor(self):
+        m = BlockGameOfLifeModel(10, 20)
+        self.assertEqual(m.get_width(), 10)
+        self.assertEqual(m.get_height(), 20)
+        self.assertEqual(len(m.get_grid()), 20)
+        self.assertEqual(len(m.get_grid()[0]), 10)
+        self.assertEqual(m.get_grid()[19][9], False)
+        with self.assertRaises(ValueError):
+            BlockGameOfLifeModel(0, 10)
+        with self.assertRaises(ValueError):
+            BlockGameOfLifeModel(10, -2)
+
+    def test_toggle_cell(self):
+        m = BlockGameOfLifeModel(5, 5)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(3, 4)
+        self.assertIs(m.get_grid()[0][0], True)
+        self.assertIs(m.get_grid()[4][3], True)
+        m.toggle_cell(0, 0)
+        self.assertIs(m.get_grid()[0][0], False)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(-1, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(5, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(4, 5)
+
+    def test_update_state_edges(self):
+        m = BlockGameOfLifeModel(3, 3)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(0, 1)
+        m.toggle_cell(1, 0)
+        m.update_state()
+        self.assertEqual(m.get_grid(), [[True, True, False],
+                                        [True, True, False],
+                                        [False, False, False]])
+
+    def test_matches_reference_model(self):
+        rng = random.Random(7)
+        for width, height in [(1, 1), (2, 7), (13, 5), (40, 31), (6, 8)]:
+            reference = GameOfLifeModel(width, height)
+            m = BlockGameOfLifeModel(width, height)
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(15):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_rules_match_reference_model(self):
+        rng = random.Random(17)
+        for rule in ['B36/S23', 'B2/S', 'B1357/S1357', 'B3/S012345678', 'B0/S8', 'B01/S0123']:
+            reference = GameOfLifeModel(13, 7, rule=rule)
+            m = BlockGameOfLifeModel(13, 7, rule)
+            self.assertEqual(m.get_rule(), reference.get_rule())
+            for y in range(7):
+                for x in range(13):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(8):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+
+    def test_bulk_operations(self):
+        reference = GameOfLifeModel(9, 7)
+        m = BlockGameOfLifeModel(9, 7)
+        glider = [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]
+        for model in (reference, m):
+            model.stamp(glider, 5, 1)
+            model.set_cells([(0, 0), (8, 6), (7, 6), (0, 0)])
+            model.set_cells([(6, 2), (1, 1)], False)
+            self.assertRaises(ValueError, model.set_cells, [(1, 1), (9, 0)])
+        for i in range(6):
+            self.assertEqual(m.get_grid(), reference.get_grid())
+            reference.update_state()
+            m.update_state()
+        m.clear()
+        self.assertEqual(m.get_grid(), [[False] * 9 for i in range(7)])
+
+
+    def test_grid_view_population_and_bounding_box(self):
+        m = BlockGameOfLifeModel(9, 7)
+        view = m.get_grid_view()
+        self.assertEqual((m.population(), m.bounding_box()), (0, None))
+        # the outermost cells lie in every position of a block
+        for (x, y, box) in [(4, 3, (4, 3, 4, 3)), (1, 5, (1, 3, 4, 5)), (8, 0, (1, 0, 8, 5)), (0, 6, (0, 0, 8, 6))]:
+            m.toggle_cell(x, y)
+            self.assertEqual(m.bounding_box(), box)
+            self.assertEqual(view[y][x], 1)
+        self.assertEqual(m.population(), 4)
+        m.toggle_cell(0, 6)
+        self.assertEqual(m.bounding_box(), (1, 0, 8, 5))
+        m.set_cells([(2, 5), (3, 5)])
+        m.update_state()
+        reference = GameOfLifeModel(9, 7)
+        reference.set_cells([(1, 5), (2, 5), (3, 5), (4, 3), (8, 0)])
+        reference.update_state()
+        self.assertEqual([[bool(cell) for cell in row] for row in view], reference.get_grid())
+        self.assertEqual((m.population(), m.bounding_box()), (reference.population(), reference.bounding_box()))
+        self.assertEqual(len(view), 7)
+        self.assertEqual(len(view[0]), 9)
+        m.clear()
+        self.assertFalse(any(1 in row for row in view))
+
+
+if __name__ == '__main__':
+    unittest.main()
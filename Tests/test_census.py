@@ -0,0 +1,131 @@
+import time
+import unittest
+import numpy as np
+from Model.Census import Census, KNOWN_OBJECTS, canonical_form, label_components, parse_rows
+from Model.NumpyGameOfLifeModel import NumpyGameOfLifeModel
+
+
+def draw(rows: [str]) -> np.ndarray:
+    """
+    :return: array of the cells of a pattern drawn row by row
+    """
+    return np.array([[c == 'o' for c in row] for row in rows], dtype=np.uint8)
+
+
+class CensusTests(unittest.TestCase):
+    """ A class used to run tests for the Census. """
+
+    census = Census()
+
+    def test_label_components(self):
+        cells = draw(['oo...o',
+                      'o.....',
+                      '......',
+                      '..o...',
+                      '...o.o'])
+        labels, count = label_components(cells)
+        self.assertEqual(count, 4)
+        self.assertEqual(labels[0, 0], labels[1, 0])
+        self.assertEqual(labels[3, 2], labels[4, 3])
+        self.assertNotEqual(labels[4, 3], labels[4, 5])
+        self.assertEqual(labels[2, 2], -1)
+        self.assertEqual(sorted(set(labels[cells == 1].tolist())), [0, 1, 2, 3])
+        # cells two apart are joined with a reach of 2
+        self.assertEqual(label_components(cells, 2)[1], 2)
+        self.assertEqual(label_components(np.zeros((3, 3)))[1], 0)
+        # a long winding group
+        spiral = np.zeros((40, 40), dtype=np.uint8)
+        spiral[::2, :] = 1
+        spiral[1::4, -1] = 1
+        spiral[3::4, 0] = 1
+        self.assertEqual(label_components(spiral)[1], 1)
+        with self.assertRaises(ValueError):
+            label_components(cells, 0)
+
+    def test_canonical_form(self):
+        cells = draw(['oo.',
+                      'o.o',
+                      '.o.'])
+        form = canonical_form(cells)
+        for turns in range(4):
+            self.assertEqual(canonical_form(np.rot90(cells, turns)), form)
+            self.assertEqual(canonical_form(np.rot90(cells.T, turns)), form)
+        self.assertEqual(canonical_form(np.pad(cells, ((2, 1), (0, 3)))), form)
+        self.assertNotEqual(canonical_form(draw(['oo.', 'o.o', '.oo'])), form)
+
+    def test_identify_phases(self):
+        # every built-in object is recognized in every orientation and in later phases
+        for (name, rows) in KNOWN_OBJECTS.items():
+            m = NumpyGameOfLifeModel(40, 40)
+            m.stamp(parse_rows(rows), 14, 14)
+            for generation in range(4):
+                cells = m.get_grid_view()
+                self.assertEqual(self.census.identify(cells), name)
+                self.assertEqual(self.census.identify(np.rot90(cells.T, generation)), name)
+                m.update_state()
+        self.assertTrue(self.census.identify(draw(['oo.o', 'o..o'])).startswith('unknown (5 cells) '))
+
+    def test_count(self):
+        board = np.zeros((30, 40), dtype=np.uint8)
+        board[1:3, 1:3] = draw(['oo', 'oo'])
+        # two blocks one cell apart are counted separately
+        board[1:3, 4:6] = draw(['oo', 'oo'])
+        board[6:9, 1:5] = draw(['oo..', 'o..o', '..oo'])
+        board[6:10, 10:14] = draw(['oo..', 'o...', '...o', '..oo'])
+        board[15:16, 20:23] = draw(['ooo'])
+        board[20:24, 30:33] = np.rot90(draw(['.oo.', 'o..o', '.oo.']))
+        board[25:28, 2:5] = draw(['oo.', 'o.o', '.o.'])
+        board[25:27, 10:13] = draw(['ooo', 'o..'])
+        census = self.census.count(board)
+        unknown = [name for name in census if name.startswith('unknown')]
+        self.assertEqual(len(unknown), 1)
+        self.assertEqual(census, {'block': 2, 'aircraft carrier': 1, 'beacon': 1, 'blinker': 1, 'beehive': 1,
+                                  'boat': 1, unknown[0]: 1})
+        self.assertEqual(self.census.count(np.zeros((5, 5))), {})
+
+    def test_footprint(self):
+        traffic_light = np.zeros((20, 20), dtype=np.uint8)
+        traffic_light[5:12, 5:12] = draw(KNOWN_OBJECTS['traffic light'])
+        m = NumpyGameOfLifeModel(20, 20)
+        m.set_cells(np.argwhere(traffic_light)[:, ::-1])
+        m.update_state()
+        footprint = traffic_light | m.get_grid_view()
+        self.assertEqual(self.census.count(m.get_grid_view(), footprint), {'traffic light': 1})
+        # parts of the footprint without living cells hold no object
+        footprint[15:18, 15:18] = 1
+        self.assertEqual(self.census.count(m.get_grid_view(), footprint), {'traffic light': 1})
+
+    def test_library(self):
+        census = Census(file_path='test_resources.txt')
+        heart = [(2, 0), (3, 0), (8, 0), (9, 0), (1, 1), (4, 1), (7, 1), (10, 1), (0, 2), (5, 2), (6, 2), (11, 2),
+                 (0, 3), (11, 3), (1, 4), (10, 4), (2, 5), (9, 5), (3, 6), (8, 6), (4, 7), (7, 7), (5, 8), (6, 8)]
+        cells = np.zeros((9, 12), dtype=np.uint8)
+        cells[[y for (x, y) in heart], [x for (x, y) in heart]] = 1
+        self.assertEqual(census.identify(np.fliplr(cells)), 'Heart')
+        # built-in names are kept
+        self.assertEqual(census.identify(draw(['.o.', '..o', 'ooo'])), 'glider')
+        # the bookend is a reflection of the eater
+        census.add_object('bookend', parse_rows(['..oo', '.o.o', '.o..', 'oo..']))
+        self.assertEqual(census.identify(draw(['oo..', 'o.o.', '..o.', '..oo'])), 'eater 1')
+        with self.assertRaises(ValueError):
+            census.add_object('nothing', [])
+
+    def test_speed(self):
+        # tens of thousands of objects are counted well under a second
+        board = np.zeros((1000, 1000), dtype=np.uint8)
+        names = list(KNOWN_OBJECTS.keys())
+        expected = {}
+        for (i, (y, x)) in enumerate((y, x) for y in range(0, 990, 7) for x in range(0, 990, 8)):
+            name = names[i % 12]
+            pattern = draw(KNOWN_OBJECTS[name])
+            board[y:y + pattern.shape[0], x:x + pattern.shape[1]] = pattern
+            expected[name] = expected.get(name, 0) + 1
+        start = time.perf_counter()
+        census = self.census.count(board)
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(census, expected)
+        self.assertGreater(sum(census.values()), 15000)
+
+
+if __name__ == '__main__':
+    unittest.main()
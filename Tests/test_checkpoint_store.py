@@ -0,0 +1,84 @@
+import os
+import random
+import tempfile
+import unittest
+from Model.CheckpointStore import CheckpointStore
+from Model.GameOfLifeModel import GameOfLifeModel
+from Model.NumpyGameOfLifeModel import NumpyGameOfLifeModel
+
+
+class CheckpointStoreTests(unittest.TestCase):
+    """ A class used to run tests for the CheckpointStore. """
+
+    @staticmethod
+    def __boards(model_class, generations: int) -> [[[bool]]]:
+        """
+        :return: a seeded random model and the boards of its first generations, computed independently
+        """
+        rng = random.Random(29)
+        cells = [(x, y) for y in range(15) for x in range(24) if rng.random() < 0.35]
+        model = model_class(24, 15)
+        reference = model_class(24, 15)
+        model.set_cells(cells)
+        reference.set_cells(cells)
+        boards = [reference.get_grid()]
+        for i in range(generations):
+            reference.update_state()
+            boards.append(reference.get_grid())
+        return model, boards
+
+    def test_seek(self):
+        # the reference model reports its changes, the NumPy model is compared board by board
+        for model_class in (GameOfLifeModel, NumpyGameOfLifeModel):
+            m, boards = self.__boards(model_class, 80)
+            s = CheckpointStore(m, interval=8)
+            s.advance(50)
+            self.assertEqual(s.get_latest(), 50)
+            self.assertEqual(m.get_grid(), boards[50])
+            for generation in [3, 4, 0, 17, 23, 16, 50, 49, 12, 80, 64, 70]:
+                s.seek(generation)
+                self.assertEqual(s.get_generation(), generation)
+                self.assertEqual(m.get_grid(), boards[generation])
+            self.assertEqual(s.get_latest(), 80)
+            # advancing from a recorded generation replays it
+            s.seek(30)
+            s.advance(2)
+            self.assertEqual(m.get_grid(), boards[32])
+            with self.assertRaises(ValueError):
+                s.seek(-1)
+            with self.assertRaises(ValueError):
+                s.advance(-1)
+
+    def test_memory_budget(self):
+        m, boards = self.__boards(GameOfLifeModel, 60)
+        s = CheckpointStore(m, interval=5, max_bytes=800)
+        s.advance(60)
+        self.assertLessEqual(s.get_memory_size(), 800)
+        self.assertGreater(s.get_first(), 0)
+        self.assertEqual(s.get_first() % 5, 0)
+        with self.assertRaises(ValueError):
+            s.seek(s.get_first() - 1)
+        s.seek(s.get_first())
+        self.assertEqual(m.get_grid(), boards[s.get_first()])
+
+    def test_disk_budget(self):
+        m, boards = self.__boards(GameOfLifeModel, 60)
+        with tempfile.TemporaryDirectory() as directory:
+            s = CheckpointStore(m, interval=5, max_bytes=800, directory=directory, max_disk_bytes=2000)
+            s.advance(60)
+            self.assertLessEqual(s.get_memory_size(), 800)
+            self.assertLessEqual(s.get_disk_size(), 2000)
+            self.assertGreater(s.get_disk_size(), 0)
+            self.assertEqual(sum(os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory)),
+                             s.get_disk_size())
+            # generations of segments written to disk are restored from their files
+            for generation in range(s.get_first(), 61, 3):
+                s.seek(generation)
+                self.assertEqual(m.get_grid(), boards[generation])
+            s.close()
+            self.assertEqual(os.listdir(directory), [])
+            self.assertEqual(s.get_disk_size(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
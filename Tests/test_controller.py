@@ -2,6 +2,8 @@ import unittest
 from Controller.Controller import Controller
 from Model.GameOfLifeModel import GameOfLifeModel
 from Model.MockModel import MockModel
+from Model.UnboundedGameOfLifeModel import UnboundedGameOfLifeModel
+from Resources.GameUtils import GameUtils
 from View.GameOfLifeView import GameOfLifeView
 from View.MockView import MockView
 
@@ -35,11 +37,11 @@ class ControllerTests(unittest.TestCase):
         self.assertEqual(v.get_call_log(), "")
 
         c = Controller(m, v)
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; ")
 
         c.execute()
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
     def test_fake_action(self):
@@ -49,7 +51,7 @@ class ControllerTests(unittest.TestCase):
         c.execute()
         with self.assertRaises(ValueError):
             c.action_performed("fake command")
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
     def test_action_toggle_play(self):
@@ -58,30 +60,102 @@ class ControllerTests(unittest.TestCase):
         v = MockView(m)
         c = Controller(m, v)
         c.execute()
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
+        # the board of the mock model is empty, so playing stops after a single generation
         c.action_performed("toggle play")
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;update_state called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;'
+                                           'update_state called;get_changes called;'
+                                           'get_cycle called;population called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
-                                           "update called; update called; ")
+                                           "show_cycle called: None; update called; "
+                                           "toggle_start_stop_button called: False; update called; ")
 
+    def test_play_until_toggled(self):
+        m = GameOfLifeModel(5, 5)
+        v = MockView(m)
+        c = Controller(m, v)
+        c.execute()
+        for (x, y) in [(1, 2), (2, 2), (3, 2)]:
+            m.toggle_cell(x, y)
         c.action_performed("toggle play")
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;update_state called;'
-                                           'update_state called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
-                                           "update called; update called; update called; update called; ")
+                                           "show_cycle called: None; update called; "
+                                           "toggle_start_stop_button called: True; update called; ")
+        c.action_performed("toggle play")
+        self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
+                                           "show_cycle called: None; update called; "
+                                           "toggle_start_stop_button called: True; update called; update called; "
+                                           "toggle_start_stop_button called: False; update called; ")
+
+    def test_play_stops_on_empty_board(self):
+        # without cycle detection the controller still stops once every cell died
+        m = GameOfLifeModel(5, 5)
+        v = MockView(m)
+        c = Controller(m, v)
+        c.execute()
+        m.toggle_cell(2, 2)
+        c.action_performed("toggle play")
+        self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
+                                           "show_cycle called: None; update called; "
+                                           "toggle_start_stop_button called: False; update called; ")
+
+    def test_play_stops_on_unbounded_still_life(self):
+        m = UnboundedGameOfLifeModel(6, 6, cycle_history=8)
+        v = MockView(m)
+        c = Controller(m, v)
+        c.execute()
+        # the block reaches past the window, which the plane hash still covers
+        for (x, y) in [(-1, 1), (-1, 2), (0, 1), (0, 2)]:
+            m.set_cells([(x, y)])
+        c.action_performed("toggle play")
+        self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
+                                           "show_cycle called: None; update called; "
+                                           "toggle_start_stop_button called: False; show_cycle called: (1, 1); "
+                                           "update called; ")
+
+    def test_play_stops_on_static_board(self):
+        m = GameOfLifeModel(6, 6, cycle_history=8)
+        v = MockView(m)
+        c = Controller(m, v)
+        c.execute()
+        for (x, y) in [(1, 1), (1, 2), (2, 1), (2, 2)]:
+            m.toggle_cell(x, y)
+        c.action_performed("toggle play")
+        self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
+                                           "show_cycle called: None; update called; "
+                                           "toggle_start_stop_button called: False; show_cycle called: (1, 1); "
+                                           "update called; ")
+        # a second start plays a single generation before stopping again
+        c.action_performed("toggle play")
+        self.assertEqual(m.get_cycle(), (1, 2))
 
     def test_action_next(self):
         m = MockModel()
         v = MockView(m)
         c = Controller(m, v)
         c.execute()
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
         c.action_performed("next")
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;update_state called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;'
+                                           'update_state called;get_changes called;')
+        self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called;"
+                                           " update called; update called; ")
+
+    def test_action_fast_forward(self):
+        m = MockModel()
+        v = MockView(m)
+        c = Controller(m, v)
+        c.execute()
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
+        self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
+
+        c.action_performed("fast forward", 10)
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;'
+                                           'step called (n:10);get_changes called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called;"
                                            " update called; update called; ")
 
@@ -90,13 +164,12 @@ class ControllerTests(unittest.TestCase):
         v = MockView(m)
         c = Controller(m, v)
         c.execute()
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
         c.action_performed("reset")
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;'
-                                           'get_grid called;get_height called;get_width called;'
-                                           'get_width called;get_height called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;'
+                                           'bounding_box called;clear called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
                                            "update called; ")
 
@@ -105,11 +178,11 @@ class ControllerTests(unittest.TestCase):
         v = MockView(m)
         c = Controller(m, v)
         c.execute()
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
         c.action_performed("set speed")
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called;"
                                            " update called; ")
 
@@ -118,16 +191,16 @@ class ControllerTests(unittest.TestCase):
         v = MockView(m)
         c = Controller(m, v)
         c.execute()
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
         c.action_performed("change view mode", "light")
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
                                            "change_style called: light; update called; ")
 
         c.action_performed("change view mode", "dark")
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
                                            "change_style called: light; update called; "
                                            "change_style called: dark; update called; ")
@@ -138,12 +211,13 @@ class ControllerTests(unittest.TestCase):
         c = Controller(m, v, "test_resources.txt", "test_backup_resources.txt")
 
         c.execute()
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
         c.action_performed("toggle cell", Coordinates(7, 7))
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;get_width called;'
-                                           'get_height called;toggle_cell called (x:0, y:0);')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;get_width called;'
+                                           'get_height called;toggle_cell called (x:0, y:0);get_grid_view called;'
+                                           'get_width called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
                                            "update called; update called; ")
 
@@ -153,27 +227,32 @@ class ControllerTests(unittest.TestCase):
         c = Controller(m, v, "test_resources.txt", "test_backup_resources.txt")
 
         c.execute()
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
         c.action_performed("toggle cell", Coordinates(7, 7))
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;get_width called;'
-                                           'get_height called;toggle_cell called (x:0, y:0);')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;get_width called;'
+                                           'get_height called;toggle_cell called (x:0, y:0);get_grid_view called;'
+                                           'get_width called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
                                            "update called; update called; ")
 
         c.action_performed("toggle cell", Coordinates(34, 72))
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;'
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;'
                                            'get_width called;get_height called;toggle_cell called (x:0, y:0);'
-                                           'get_width called;get_height called;toggle_cell called (x:1, y:4);')
+                                           'get_grid_view called;get_width called;'
+                                           'get_width called;get_height called;toggle_cell called (x:1, y:4);'
+                                           'get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
                                            "update called; update called; update called; update called; ")
 
         # coordinates out of bounds with the current canvas padding; should not toggle any cells
         c.action_performed("toggle cell", Coordinates(2, 2))
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;'
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;'
                                            'get_width called;get_height called;toggle_cell called (x:0, y:0);'
-                                           'get_width called;get_height called;toggle_cell called (x:1, y:4);')
+                                           'get_grid_view called;get_width called;'
+                                           'get_width called;get_height called;toggle_cell called (x:1, y:4);'
+                                           'get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
                                            "update called; update called; update called; update called;"
                                            " update called; ")
@@ -184,14 +263,14 @@ class ControllerTests(unittest.TestCase):
         c = Controller(m, v, "test_resources.txt", "test_backup_resources.txt")
 
         c.execute()
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
         c.action_performed("generate", 'Dot')
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;'
-                                           'get_width called;get_height called;get_grid called;'
-                                           'get_height called;get_width called;get_width called;get_height called;'
-                                           'get_width called;get_height called;toggle_cell called (x:0, y:0);')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;'
+                                           'get_width called;get_height called;bounding_box called;clear called;'
+                                           'get_width called;get_height called;stamp called (x:0, y:0);'
+                                           'get_width called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
                                            "update called; update called; ")
 
@@ -201,19 +280,13 @@ class ControllerTests(unittest.TestCase):
         c = Controller(m, v, "test_resources.txt", "test_backup_resources.txt")
 
         c.execute()
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; ")
 
         c.action_performed("generate", 'Glider')
-        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid called;get_width called;'
-                                           'get_height called;get_grid called;get_height called;get_width called;'
-                                           'get_width called;get_width called;get_width called;get_height called;'
-                                           'get_width called;get_width called;get_width called;get_width called;'
-                                           'get_height called;get_width called;get_width called;get_width called;'
-                                           'get_width called;get_height called;get_width called;get_height called;'
-                                           'toggle_cell called (x:2, y:0);toggle_cell called (x:0, y:1);'
-                                           'toggle_cell called (x:2, y:1);toggle_cell called (x:1, y:2);'
-                                           'toggle_cell called (x:2, y:2);')
+        self.assertEqual(m.get_call_log(), 'get_height called;get_width called;get_grid_view called;get_width called;'
+                                           'get_height called;bounding_box called;clear called;get_width called;'
+                                           'get_height called;stamp called (x:0, y:0);get_width called;')
         self.assertEqual(v.get_call_log(), "get_model_hash called; set_button_listener called; render called; "
                                            "update called; update called; ")
 
@@ -236,6 +309,78 @@ class ControllerTests(unittest.TestCase):
 
         self.assertEqual(contents, new_contents)
 
+    def test_undo_redo(self):
+        m = GameOfLifeModel(5, 5)
+        v = MockView(m)
+        c = Controller(m, v)
+        c.execute()
+        cell_length = GameUtils().cell_length
+        padding = GameUtils().canvas_padding
+        for x in (1, 2, 3):
+            c.action_performed("toggle cell", Coordinates(padding + x * cell_length, padding + 2 * cell_length))
+        horizontal = m.get_grid()
+        c.action_performed("next")
+        vertical = m.get_grid()
+        c.action_performed("fast forward", 3)
+        self.assertEqual(m.get_grid(), horizontal)
+        c.undo()
+        self.assertEqual(m.get_grid(), vertical)
+        c.action_performed("undo")
+        self.assertEqual(m.get_grid(), horizontal)
+        c.undo()
+        c.undo()
+        self.assertEqual(m.population(), 1)
+        c.undo()
+        c.undo()
+        self.assertEqual(m.population(), 0)
+        c.redo()
+        c.action_performed("redo")
+        c.redo()
+        self.assertEqual(m.get_grid(), horizontal)
+        c.action_performed("reset")
+        c.undo()
+        self.assertEqual(m.get_grid(), horizontal)
+        c.redo()
+        self.assertEqual(m.population(), 0)
+
+    def test_reset_unbounded_plane(self):
+        m = UnboundedGameOfLifeModel(5, 5)
+        v = MockView(m)
+        c = Controller(m, v)
+        c.execute()
+        # a glider which travelled out of the window is cleared as well
+        m.stamp([(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)], 1, 1)
+        m.step(40)
+        m.toggle_cell(0, 0)
+        self.assertEqual(m.population(), 6)
+        cells = sorted(m.live_cells())
+        c.action_performed("reset")
+        self.assertEqual(m.population(), 0)
+        self.assertEqual(m.bounding_box(), None)
+        # the cells outside the window are restored by undo as well
+        c.undo()
+        self.assertEqual(sorted(m.live_cells()), cells)
+        self.assertEqual(m.population(), 6)
+
+
+    def test_undo_next_unbounded_plane(self):
+        m = UnboundedGameOfLifeModel(5, 5)
+        v = MockView(m)
+        c = Controller(m, v)
+        c.execute()
+        cell_length = GameUtils().cell_length
+        padding = GameUtils().canvas_padding
+        # a blinker on the top edge reaches above the window
+        for x in (1, 2, 3):
+            c.action_performed("toggle cell", Coordinates(padding + x * cell_length, padding))
+        horizontal = sorted(m.live_cells())
+        c.action_performed("next")
+        self.assertEqual(sorted(m.live_cells()), [(2, -1), (2, 0), (2, 1)])
+        c.undo()
+        self.assertEqual(sorted(m.live_cells()), horizontal)
+        c.redo()
+        self.assertEqual(sorted(m.live_cells()), [(2, -1), (2, 0), (2, 1)])
+
 
 if __name__ == '__main__':
     unittest.main()
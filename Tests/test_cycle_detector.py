@@ -0,0 +1,44 @@
+import unittest
+from Model.CycleDetector import CycleDetector
+
+
+class CycleDetectorTests(unittest.TestCase):
+    """ A class used to run tests for the CycleDetector. """
+
+    def test_hash(self):
+        c = CycleDetector(4, 3)
+        self.assertEqual(c.get_hash(), 0)
+        c.flip(5)
+        self.assertEqual(c.get_hash(), c.get_key(5))
+        c.apply(c.get_key(5) ^ c.get_key(7))
+        self.assertEqual(c.get_hash(), c.get_key(7))
+        self.assertEqual([CycleDetector(4, 3).get_key(i) for i in range(12)], [c.get_key(i) for i in range(12)])
+        self.assertEqual(len(set(c.get_key(i) for i in range(12))), 12)
+        self.assertNotEqual(CycleDetector(4, 3, seed=1).get_key(5), c.get_key(5))
+        # the keys are not stored, so huge boards cost nothing
+        self.assertLess(CycleDetector(100000, 100000).get_key(10 ** 10 - 1), 1 << 64)
+        with self.assertRaises(ValueError):
+            CycleDetector(4, 3, 0)
+
+    def test_period(self):
+        c = CycleDetector(4, 3, history=4)
+        # the empty board is a still life
+        self.assertEqual(c.record(), (1, 1))
+        keys = [c.get_key(i) for i in range(12)]
+        c.flip(1)
+        c.forget()
+        # three boards visited in turn
+        for generation in range(2, 9):
+            c.apply(c.get_hash() ^ keys[generation % 3])
+            self.assertEqual(c.record(), (3, generation) if generation >= 4 else None)
+            self.assertEqual(c.get_cycle(), (3, generation) if generation >= 4 else None)
+        # a period longer than the history is not detected
+        c.forget()
+        for generation in range(9, 30):
+            c.apply(c.get_hash() ^ keys[generation % 6])
+            self.assertEqual(c.record(), None)
+        self.assertEqual(c.get_generation(), 29)
+
+
+if __name__ == '__main__':
+    unittest.main()
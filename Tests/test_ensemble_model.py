@@ -0,0 +1,129 @@
+import unittest
+import numpy as np
+from Model.EnsembleGameOfLifeModel import EnsembleGameOfLifeModel
+from Model.GameOfLifeModel import GameOfLifeModel
+
+
+class EnsembleGameOfLifeModelTests(unittest.TestCase):
+    """ A class used to run tests for the EnsembleGameOfLifeModel. """
+
+    def test_constructor(self):
+        m = EnsembleGameOfLifeModel(3, 10, 20)
+        self.assertEqual(m.get_count(), 3)
+        self.assertEqual(m.get_width(), 10)
+        self.assertEqual(m.get_height(), 20)
+        self.assertEqual(m.get_grid_view().shape, (3, 20, 10))
+        self.assertEqual(m.get_grid(2)[19][9], False)
+        self.assertEqual(m.population().tolist(), [0, 0, 0])
+        with self.assertRaises(ValueError):
+            EnsembleGameOfLifeModel(0, 10, 10)
+        with self.assertRaises(ValueError):
+            EnsembleGameOfLifeModel(2, 10, -2)
+        with self.assertRaises(ValueError):
+            EnsembleGameOfLifeModel(2, 10, 10, 'sphere')
+        with self.assertRaises(ValueError):
+            EnsembleGameOfLifeModel(2, 10, 10, cycle_history=0)
+
+    def test_edits(self):
+        m = EnsembleGameOfLifeModel(2, 5, 4)
+        m.toggle_cell(1, 3, 2)
+        m.set_cells(0, [(0, 0), (4, 3)])
+        self.assertIs(m.get_grid(1)[2][3], True)
+        self.assertIs(m.get_grid(0)[3][4], True)
+        self.assertEqual(m.population().tolist(), [2, 1])
+        m.clear(0)
+        self.assertEqual(m.population().tolist(), [0, 1])
+        m.set_boards(np.ones((2, 4, 5)))
+        self.assertEqual(m.population().tolist(), [20, 20])
+        m.clear()
+        self.assertEqual(m.population().tolist(), [0, 0])
+        with self.assertRaises(ValueError):
+            m.toggle_cell(2, 0, 0)
+        with self.assertRaises(ValueError):
+            m.set_cells(0, [(5, 0)])
+        with self.assertRaises(ValueError):
+            m.set_boards(np.ones((2, 5, 4)))
+        with self.assertRaises(ValueError):
+            m.get_grid(-1)
+        with self.assertRaises(ValueError):
+            m.get_grid_view()[0, 0, 0] = 1
+
+    def test_matches_reference_model(self):
+        for topology in ('bounded', 'torus'):
+            for rule in ('B3/S23', 'B36/S23'):
+                m = EnsembleGameOfLifeModel(4, 13, 9, topology, rule)
+                m.randomize(0.4, seed=3)
+                references = []
+                for board in range(4):
+                    reference = GameOfLifeModel(13, 9, topology, rule)
+                    reference.set_cells([(x, y) for y in range(9) for x in range(13)
+                                         if m.get_grid_view()[board, y, x]])
+                    references.append(reference)
+                for i in range(12):
+                    m.update_state()
+                    for board in range(4):
+                        references[board].update_state()
+                        self.assertEqual(m.get_grid(board), references[board].get_grid())
+                self.assertEqual(m.population().tolist(),
+                                 [sum(map(sum, r.get_grid())) for r in references])
+
+    def test_randomize(self):
+        m = EnsembleGameOfLifeModel(2, 20, 20)
+        m.randomize(0.5, seed=11)
+        n = EnsembleGameOfLifeModel(2, 20, 20)
+        n.randomize(0.5, seed=11)
+        self.assertTrue((m.get_grid_view() == n.get_grid_view()).all())
+        self.assertFalse((m.get_grid_view()[0] == m.get_grid_view()[1]).all())
+        with self.assertRaises(ValueError):
+            m.randomize(1.5)
+
+    def test_stabilization(self):
+        m = EnsembleGameOfLifeModel(4, 8, 8)
+        # block, blinker, a pre-block that settles after one generation and a glider
+        m.set_cells(0, [(1, 1), (2, 1), (1, 2), (2, 2)])
+        m.set_cells(1, [(3, 2), (3, 3), (3, 4)])
+        m.set_cells(2, [(1, 1), (2, 1), (1, 2)])
+        m.set_cells(3, [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)])
+        m.step(3)
+        self.assertEqual(m.get_periods().tolist(), [1, 2, 1, 0])
+        self.assertEqual(m.get_settled_generations().tolist(), [0, 0, 1, -1])
+        self.assertEqual(m.get_stabilized().tolist(), [True, True, True, False])
+        # the glider becomes a block in the corner of the bounded board
+        self.assertLess(m.run(100), 100)
+        self.assertTrue(m.get_stabilized().all())
+        self.assertEqual(m.population().tolist()[3], 4)
+        # editing a board forgets its stabilization
+        m.toggle_cell(0, 5, 5)
+        self.assertEqual(m.get_periods().tolist()[0], 0)
+        m.step(1)
+        self.assertEqual(m.get_periods().tolist()[0], 0)
+        m.step(1)
+        self.assertEqual(m.get_periods().tolist()[0], 1)
+        with self.assertRaises(ValueError):
+            m.step(-1)
+
+
+    def test_edits_forget_history(self):
+        m = EnsembleGameOfLifeModel(2, 6, 6, cycle_history=4)
+        blinker = [(2, 1), (2, 2), (2, 3)]
+        m.set_cells(0, blinker)
+        m.set_cells(1, blinker)
+        m.step(3)
+        self.assertEqual(m.get_periods().tolist(), [2, 2])
+        # the edited board is back in a recorded state, but only the generations after the edit are searched
+        m.toggle_cell(0, 0, 0)
+        m.toggle_cell(0, 0, 0)
+        m.step(1)
+        self.assertEqual(m.get_periods().tolist(), [0, 2])
+        m.step(1)
+        self.assertEqual(m.get_periods().tolist(), [2, 2])
+        self.assertEqual(m.get_settled_generations().tolist(), [3, 0])
+        # periods longer than the history are not detected
+        m = EnsembleGameOfLifeModel(1, 6, 6, cycle_history=1)
+        m.set_cells(0, blinker)
+        m.step(4)
+        self.assertEqual(m.get_periods().tolist(), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
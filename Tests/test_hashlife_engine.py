@@ -0,0 +1,76 @@
+import random
+import unittest
+from collections import Counter
+from Model.HashLifeEngine import HashLifeEngine
+from Resources.GameUtils import GameUtils
+
+
+def plane_step(cells: set, birth: () = (3,), survival: () = (2, 3)) -> set:
+    """ Advances a set of living cells on an unbounded plane by one generation. """
+    counts = Counter((x + dx, y + dy) for (x, y) in cells
+                     for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy)
+    if 0 in survival:
+        counts.update({c: 0 for c in cells})
+    return set(c for c, n in counts.items() if n in (survival if c in cells else birth))
+
+
+class HashLifeEngineTests(unittest.TestCase):
+    """ A class used to run tests for the HashLifeEngine. """
+
+    def test_round_trip(self):
+        e = HashLifeEngine()
+        self.assertEqual(e.get_coordinates(), [])
+        e.set_coordinates([(0, 0), (5, -3), (-40, 17)])
+        self.assertEqual(e.get_coordinates(), [(5, -3), (0, 0), (-40, 17)])
+        self.assertEqual(e.get_coordinates(normalize=True), [(45, 0), (40, 3), (0, 20)])
+        self.assertEqual(e.get_population(), 3)
+
+    def test_glider_from_library(self):
+        glider = GameUtils("test_resources.txt").get_struct_coordinates("Glider")
+        e = HashLifeEngine()
+        e.set_coordinates(glider)
+        e.advance(4)
+        self.assertEqual(e.get_coordinates(), sorted([(x + 1, y + 1) for (x, y) in glider],
+                                                     key=lambda c: (c[1], c[0])))
+        e.advance(1 << 30)
+        shift = 1 << 28
+        self.assertEqual(e.get_coordinates(), sorted([(x + 1 + shift, y + 1 + shift) for (x, y) in glider],
+                                                     key=lambda c: (c[1], c[0])))
+        self.assertEqual(e.get_generation(), 4 + (1 << 30))
+        self.assertEqual(e.get_coordinates(normalize=True), sorted(glider, key=lambda c: (c[1], c[0])))
+
+    def test_matches_plane_simulation(self):
+        rng = random.Random(3)
+        cells = set((rng.randrange(12), rng.randrange(12)) for i in range(60))
+        e = HashLifeEngine(cache_size=64)
+        e.set_coordinates(list(cells))
+        for generations in [1, 2, 3, 7, 16, 21]:
+            e.advance(generations)
+            for i in range(generations):
+                cells = plane_step(cells)
+            self.assertEqual(set(e.get_coordinates()), cells)
+            self.assertEqual(e.get_population(), len(cells))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            HashLifeEngine(0)
+        with self.assertRaises(ValueError):
+            HashLifeEngine().advance(-1)
+
+
+    def test_highlife(self):
+        rng = random.Random(5)
+        cells = set((rng.randrange(12), rng.randrange(12)) for i in range(60))
+        e = HashLifeEngine(rule='B36/S23')
+        self.assertEqual(e.get_rule(), 'B36/S23')
+        e.set_coordinates(list(cells))
+        e.advance(13)
+        for i in range(13):
+            cells = plane_step(cells, (3, 6), (2, 3))
+        self.assertEqual(set(e.get_coordinates()), cells)
+        with self.assertRaises(ValueError):
+            HashLifeEngine(rule='B03/S23')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from Model.History import History
+
+
+class HistoryTests(unittest.TestCase):
+    """ A class used to run tests for the History. """
+
+    def test_undo_redo(self):
+        h = History(10)
+        self.assertFalse(h.can_undo())
+        self.assertEqual(h.undo(), None)
+        h.record([(1, 2), (9, 0)], [(3, 4)])
+        h.record([], [(0, 0)])
+        h.record([], [])
+        self.assertEqual(h.get_size(), 16)
+        self.assertEqual(h.undo(), ([], [(0, 0)]))
+        self.assertTrue(h.can_redo())
+        self.assertEqual(h.undo(), ([(1, 2), (9, 0)], [(3, 4)]))
+        self.assertFalse(h.can_undo())
+        self.assertEqual(h.redo(), ([(1, 2), (9, 0)], [(3, 4)]))
+        # a new change discards the undone changes
+        h.record([(5, 5)], [])
+        self.assertFalse(h.can_redo())
+        self.assertEqual(h.redo(), None)
+        self.assertEqual(h.get_size(), 16)
+        h.clear()
+        self.assertFalse(h.can_undo())
+        self.assertEqual(h.get_size(), 0)
+        with self.assertRaises(ValueError):
+            History(0)
+        with self.assertRaises(ValueError):
+            History(10, 0)
+
+    def test_memory_budget(self):
+        h = History(100, max_bytes=40)
+        for i in range(6):
+            h.record([(i, 0), (i, 1)], [])
+        # every change takes 8 bytes: only the five most recent ones fit
+        self.assertEqual(h.get_size(), 40)
+        for i in range(5, 0, -1):
+            self.assertEqual(h.undo(), ([(i, 0), (i, 1)], []))
+        self.assertEqual(h.undo(), None)
+        # the newest change is kept even when it alone is over the budget
+        h.record([(x, 0) for x in range(20)], [])
+        self.assertEqual(h.get_size(), 80)
+        self.assertTrue(h.can_undo())
+
+    def test_cells_outside_the_board(self):
+        h = History(10)
+        # cells left of, above and right of the board (of an unbounded plane) are kept as coordinates
+        h.record([(-3, 2), (12, 0)], [(4, -1)])
+        h.record([(1, 1)], [])
+        self.assertEqual(h.get_size(), 4 * 4 + 2 * 4 + 4)
+        self.assertEqual(h.undo(), ([(1, 1)], []))
+        self.assertEqual(h.undo(), ([(-3, 2), (12, 0)], [(4, -1)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,203 @@
+import random
+import unittest
+from Model.GameOfLifeModel import GameOfLifeModel
+from Model.IncrementalGameOfLifeModel import IncrementalGameOfLifeModel
+
+
+class IncrementalGameOfLifeModelTests(unittest.TestCase):
+    """ A class used to run tests for the IncrementalGameOfLifeModel. """
+
+    def test_constructor(self):
+        m = IncrementalGameOfLifeModel(10, 20)
+        self.assertEqual(m.get_width(), 10)
+        self.assertEqual(m.get_height(), 20)
+        self.assertEqual(len(m.get_grid()), 20)
+        self.assertEqual(len(m.get_grid()[0]), 10)
+        self.assertEqual(m.get_grid()[19][9], False)
+        with self.assertRaises(ValueError):
+            IncrementalGameOfLifeModel(0, 10)
+        with self.assertRaises(ValueError):
+            IncrementalGameOfLifeModel(10, -2)
+
+    def test_toggle_cell(self):
+        m = IncrementalGameOfLifeModel(5, 5)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(3, 4)
+        self.assertIs(m.get_grid()[0][0], True)
+        self.assertIs(m.get_grid()[4][3], True)
+        m.toggle_cell(0, 0)
+        self.assertIs(m.get_grid()[0][0], False)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(-1, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(5, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(4, 5)
+
+    def test_update_state_edges(self):
+        m = IncrementalGameOfLifeModel(3, 3)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(0, 1)
+        m.toggle_cell(1, 0)
+        m.update_state()
+        self.assertEqual(m.get_grid(), [[True, True, False],
+                                        [True, True, False],
+                                        [False, False, False]])
+
+    def test_matches_reference_model(self):
+        rng = random.Random(7)
+        for width, height in [(1, 1), (2, 7), (13, 5), (40, 31)]:
+            reference = GameOfLifeModel(width, height)
+            m = IncrementalGameOfLifeModel(width, height)
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(15):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_frontier(self):
+        m = IncrementalGameOfLifeModel(50, 50)
+        self.assertEqual(m.get_frontier_size(), 0)
+        m.toggle_cell(0, 0)
+        self.assertEqual(m.get_frontier_size(), 4)
+        m.update_state()
+        self.assertEqual(m.get_frontier_size(), 4)
+        m.update_state()
+        self.assertEqual(m.get_frontier_size(), 0)
+        # a block is a still life, so the frontier empties after one generation
+        for (x, y) in [(10, 10), (11, 10), (10, 11), (11, 11)]:
+            m.toggle_cell(x, y)
+        self.assertEqual(m.get_frontier_size(), 16)
+        m.update_state()
+        self.assertEqual(m.get_frontier_size(), 0)
+        self.assertTrue(m.get_grid()[11][11])
+
+
+    def test_rules_match_reference_model(self):
+        rng = random.Random(17)
+        for rule in ['B36/S23', 'B2/S', 'B1357/S1357', 'B3/S012345678']:
+            reference = GameOfLifeModel(13, 6, rule=rule)
+            m = IncrementalGameOfLifeModel(13, 6, rule)
+            self.assertEqual(m.get_rule(), reference.get_rule())
+            for y in range(6):
+                for x in range(13):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(8):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_b0_rules_rejected(self):
+        with self.assertRaises(ValueError):
+            IncrementalGameOfLifeModel(5, 5, 'B0/S8')
+
+
+    def test_cycle_detection(self):
+        self.assertEqual(IncrementalGameOfLifeModel(5, 5).get_cycle(), None)
+        m = IncrementalGameOfLifeModel(7, 7, cycle_history=8)
+        for x in (1, 2, 3):
+            m.toggle_cell(x, 2)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), None)
+        m.update_state()
+        # the blinker is back in its first phase
+        self.assertEqual(m.get_cycle(), (2, 2))
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (2, 3))
+        # editing the board discards the recorded states
+        m.toggle_cell(6, 6)
+        m.step(2)
+        self.assertEqual(m.get_cycle(), None)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (2, 6))
+
+
+    def test_get_grid_view(self):
+        m = IncrementalGameOfLifeModel(3, 2)
+        view = m.get_grid_view()
+        m.toggle_cell(2, 1)
+        self.assertEqual(view[1][2], 1)
+        self.assertEqual([[c == 1 for c in row] for row in view], m.get_grid())
+        with self.assertRaises(TypeError):
+            view[1][2] = 0
+
+    def test_population_and_bounding_box(self):
+        rng = random.Random(19)
+        m = IncrementalGameOfLifeModel(20, 12)
+        self.assertEqual(m.population(), 0)
+        self.assertEqual(m.bounding_box(), None)
+        for y in range(3, 9):
+            for x in range(5, 14):
+                if rng.random() < 0.4:
+                    m.toggle_cell(x, y)
+        for i in range(30):
+            cells = [(x, y) for y, row in enumerate(m.get_grid()) for x, alive in enumerate(row) if alive]
+            self.assertEqual(m.population(), len(cells))
+            if cells:
+                self.assertEqual(m.bounding_box(), (min(c[0] for c in cells), min(c[1] for c in cells),
+                                                    max(c[0] for c in cells), max(c[1] for c in cells)))
+            else:
+                self.assertEqual(m.bounding_box(), None)
+            m.update_state()
+        m.toggle_cell(0, 0)
+        self.assertEqual(m.bounding_box()[:2], (0, 0))
+
+    def test_get_changes(self):
+        rng = random.Random(23)
+        m = IncrementalGameOfLifeModel(15, 10)
+        # the changes are only recorded while tracking is enabled
+        m.step(1)
+        self.assertEqual(m.get_changes(), None)
+        m.track_changes()
+        self.assertEqual(m.get_changes(), ([], []))
+        for y in range(10):
+            for x in range(15):
+                if rng.random() < 0.4:
+                    m.toggle_cell(x, y)
+        for n in (1, 1, 4):
+            before = m.get_grid()
+            m.step(n)
+            after = m.get_grid()
+            born, died = m.get_changes()
+            self.assertEqual(sorted(born), [(x, y) for x in range(15) for y in range(10)
+                                            if after[y][x] and not before[y][x]])
+            self.assertEqual(sorted(died), [(x, y) for x in range(15) for y in range(10)
+                                            if before[y][x] and not after[y][x]])
+        m.track_changes(False)
+        m.step(2)
+        self.assertEqual(m.get_changes(), None)
+
+
+    def test_bulk_operations(self):
+        reference = GameOfLifeModel(9, 7)
+        m = IncrementalGameOfLifeModel(9, 7, cycle_history=8)
+        glider = [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]
+        for model in (reference, m):
+            model.stamp(glider, 5, 1)
+            model.set_cells([(0, 0), (8, 6), (7, 6), (0, 0)])
+            model.set_cells([(6, 2), (1, 1)], False)
+            self.assertRaises(ValueError, model.set_cells, [(1, 1), (9, 0)])
+        for i in range(6):
+            self.assertEqual(m.get_grid(), reference.get_grid())
+            reference.update_state()
+            m.update_state()
+        m.clear()
+        self.assertEqual(m.get_grid(), [[False] * 9 for i in range(7)])
+        self.assertEqual(m.population(), 0)
+        self.assertEqual(m.bounding_box(), None)
+        self.assertEqual(m.get_frontier_size(), 0)
+        # the neighbour counts and the state hash start over: a blinker placed after the clear oscillates
+        m.set_cells([(3, 3), (4, 3), (5, 3)])
+        m.step(2)
+        self.assertEqual(m.get_grid(), [[(x, y) in ((3, 3), (4, 3), (5, 3)) for x in range(9)] for y in range(7)])
+        self.assertEqual(m.get_cycle()[0], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 from Model.GameOfLifeModel import GameOfLifeModel
 
@@ -146,6 +147,187 @@ class GameOfLifeModelTests(unittest.TestCase):
                                         [False, False, False, True],
                                         [False, True, True, True]])
 
+    def test_step(self):
+        m = GameOfLifeModel(4, 4)
+        m.toggle_cell(1, 0)
+        m.toggle_cell(0, 2)
+        m.toggle_cell(1, 2)
+        m.toggle_cell(2, 2)
+        m.toggle_cell(2, 1)
+        m.step(0)
+        self.assertEqual(m.get_grid()[0][1], True)
+        m.step(4)
+        self.assertEqual(m.get_grid(), [[False, False, False, False],
+                                        [False, False, True, False],
+                                        [False, False, False, True],
+                                        [False, True, True, True]])
+        with self.assertRaises(ValueError):
+            m.step(-1)
+
+    def test_torus(self):
+        with self.assertRaises(ValueError):
+            GameOfLifeModel(5, 5, 'sphere')
+        m = GameOfLifeModel(3, 3, 'torus')
+        self.assertEqual(m.get_topology(), 'torus')
+        m.toggle_cell(0, 0)
+        m.toggle_cell(0, 1)
+        m.toggle_cell(1, 0)
+        m.update_state()
+        # every cell touches all three living cells on a 3 x 3 torus
+        self.assertEqual(m.get_grid(), [[True, True, True],
+                                        [True, True, True],
+                                        [True, True, True]])
+        m = GameOfLifeModel(6, 6, 'torus')
+        for (x, y) in [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]:
+            m.toggle_cell(x, y)
+        m.step(24)
+        # after 24 generations the glider travelled 6 cells diagonally, back to where it started
+        expected = [[False] * 6 for i in range(6)]
+        for (x, y) in [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]:
+            expected[y][x] = True
+        self.assertEqual(m.get_grid(), expected)
+
+
+    def test_rule(self):
+        with self.assertRaises(ValueError):
+            GameOfLifeModel(5, 5, rule='B3/S2X')
+        self.assertEqual(GameOfLifeModel(3, 3).get_rule(), 'B3/S23')
+        # the centre cell has six living neighbours: it is only born under HighLife
+        for rule, born in [('B3/S23', False), ('B36/S23', True)]:
+            m = GameOfLifeModel(3, 3, rule=rule)
+            self.assertEqual(m.get_rule(), rule)
+            for (x, y) in [(0, 0), (1, 0), (2, 0), (0, 1), (2, 1), (0, 2)]:
+                m.toggle_cell(x, y)
+            m.update_state()
+            self.assertEqual(m.get_grid()[1][1], born)
+
+
+    def test_cycle_detection(self):
+        self.assertEqual(GameOfLifeModel(5, 5).get_cycle(), None)
+        m = GameOfLifeModel(7, 7, cycle_history=8)
+        for x in (1, 2, 3):
+            m.toggle_cell(x, 2)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), None)
+        m.update_state()
+        # the blinker is back in its first phase
+        self.assertEqual(m.get_cycle(), (2, 2))
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (2, 3))
+        # editing the board discards the recorded states
+        m.toggle_cell(6, 6)
+        m.step(2)
+        self.assertEqual(m.get_cycle(), None)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (2, 6))
+
+
+    def test_get_grid_view(self):
+        m = GameOfLifeModel(3, 2)
+        view = m.get_grid_view()
+        self.assertEqual(len(view), 2)
+        self.assertEqual(len(view[0]), 3)
+        m.toggle_cell(2, 1)
+        # the view is not a copy: it follows the model
+        self.assertIs(view[1][2], True)
+        self.assertTrue(True in view[1])
+        self.assertEqual([list(row) for row in view], m.get_grid())
+        self.assertIs(m.get_grid_view(), view)
+        with self.assertRaises(TypeError):
+            view[1][2] = False
+
+    def test_bulk_operations(self):
+        m = GameOfLifeModel(5, 4)
+        view = m.get_grid_view()
+        m.stamp([(0, 0), (1, 0), (1, 1)], 3, 2)
+        self.assertEqual(m.get_grid(), [[False] * 5,
+                                        [False] * 5,
+                                        [False, False, False, True, True],
+                                        [False, False, False, False, True]])
+        m.set_cells([(3, 2), (0, 0), (0, 0)], False)
+        m.set_cells([(0, 0)])
+        self.assertEqual(m.get_grid()[0][0], True)
+        self.assertEqual(m.get_grid()[2][3], False)
+        # nothing is changed when one of the coordinates is outside of the grid
+        with self.assertRaises(ValueError):
+            m.set_cells([(1, 1), (5, 0)])
+        with self.assertRaises(ValueError):
+            m.stamp([(0, 0), (1, 1)], 4, 3)
+        self.assertEqual(m.get_grid()[1][1], False)
+        self.assertEqual(m.get_grid()[3][4], True)
+        m.clear()
+        self.assertEqual(m.get_grid(), [[False] * 5 for i in range(4)])
+        # the rows are cleared in place, so views handed out before stay valid
+        m.toggle_cell(2, 2)
+        self.assertIs(view[2][2], True)
+
+    def test_bulk_operations_reset_cycle_detection(self):
+        m = GameOfLifeModel(7, 7, cycle_history=8)
+        m.stamp([(0, 0), (1, 0), (2, 0)], 1, 2)
+        m.step(2)
+        self.assertEqual(m.get_cycle(), (2, 2))
+        m.set_cells([(6, 6)])
+        self.assertEqual(m.get_cycle(), None)
+        m.step(2)
+        self.assertEqual(m.get_cycle(), None)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (2, 5))
+        m.clear()
+        self.assertEqual(m.get_cycle(), None)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (1, 6))
+
+    def test_population_and_bounding_box(self):
+        rng = random.Random(19)
+        m = GameOfLifeModel(20, 12)
+        self.assertEqual(m.population(), 0)
+        self.assertEqual(m.bounding_box(), None)
+        for y in range(3, 9):
+            for x in range(5, 14):
+                if rng.random() < 0.4:
+                    m.toggle_cell(x, y)
+        for i in range(30):
+            cells = [(x, y) for y, row in enumerate(m.get_grid()) for x, alive in enumerate(row) if alive]
+            self.assertEqual(m.population(), len(cells))
+            if cells:
+                self.assertEqual(m.bounding_box(), (min(c[0] for c in cells), min(c[1] for c in cells),
+                                                    max(c[0] for c in cells), max(c[1] for c in cells)))
+            else:
+                self.assertEqual(m.bounding_box(), None)
+            m.update_state()
+        m.toggle_cell(0, 0)
+        self.assertEqual(m.bounding_box()[:2], (0, 0))
+        m.set_cells([(19, 11), (0, 0)])
+        self.assertEqual(m.bounding_box()[2:], (19, 11))
+        m.clear()
+        self.assertEqual(m.population(), 0)
+        self.assertEqual(m.bounding_box(), None)
+
+    def test_get_changes(self):
+        rng = random.Random(23)
+        m = GameOfLifeModel(15, 10)
+        # the changes are only recorded while tracking is enabled
+        m.step(1)
+        self.assertEqual(m.get_changes(), None)
+        m.track_changes()
+        self.assertEqual(m.get_changes(), ([], []))
+        for y in range(10):
+            for x in range(15):
+                if rng.random() < 0.4:
+                    m.toggle_cell(x, y)
+        for n in (1, 1, 4):
+            before = m.get_grid()
+            m.step(n)
+            after = m.get_grid()
+            born, died = m.get_changes()
+            self.assertEqual(sorted(born), [(x, y) for x in range(15) for y in range(10)
+                                            if after[y][x] and not before[y][x]])
+            self.assertEqual(sorted(died), [(x, y) for x in range(15) for y in range(10)
+                                            if before[y][x] and not after[y][x]])
+        m.track_changes(False)
+        m.step(2)
+        self.assertEqual(m.get_changes(), None)
+
 
 if __name__ == '__main__':
     unittest.main()
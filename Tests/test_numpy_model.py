@@ -0,0 +1,245 @@
+import random
+import unittest
+from Model.CycleDetector import CycleDetector
+from Model.GameOfLifeModel import GameOfLifeModel
+from Model.NumpyGameOfLifeModel import NumpyGameOfLifeModel, cell_keys
+
+
+class NumpyGameOfLifeModelTests(unittest.TestCase):
+    """ A class used to run tests for the NumpyGameOfLifeModel. """
+
+    def test_constructor(self):
+        m = NumpyGameOfLifeModel(10, 20)
+        self.assertEqual(m.get_width(), 10)
+        self.assertEqual(m.get_height(), 20)
+        self.assertEqual(len(m.get_grid()), 20)
+        self.assertEqual(len(m.get_grid()[0]), 10)
+        self.assertEqual(m.get_grid()[19][9], False)
+        with self.assertRaises(ValueError):
+            NumpyGameOfLifeModel(0, 10)
+        with self.assertRaises(ValueError):
+            NumpyGameOfLifeModel(10, -2)
+
+    def test_toggle_cell(self):
+        m = NumpyGameOfLifeModel(5, 5)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(3, 4)
+        self.assertIs(m.get_grid()[0][0], True)
+        self.assertIs(m.get_grid()[4][3], True)
+        m.toggle_cell(0, 0)
+        self.assertIs(m.get_grid()[0][0], False)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(-1, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(5, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(4, 5)
+
+    def test_update_state_edges(self):
+        m = NumpyGameOfLifeModel(3, 3)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(0, 1)
+        m.toggle_cell(1, 0)
+        m.update_state()
+        self.assertEqual(m.get_grid(), [[True, True, False],
+                                        [True, True, False],
+                                        [False, False, False]])
+
+    def test_matches_reference_model(self):
+        rng = random.Random(7)
+        for width, height in [(1, 1), (2, 7), (13, 5), (40, 31)]:
+            reference = GameOfLifeModel(width, height)
+            m = NumpyGameOfLifeModel(width, height)
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(15):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_step_matches_update_state(self):
+        rng = random.Random(11)
+        stepped = NumpyGameOfLifeModel(70, 20)
+        updated = NumpyGameOfLifeModel(70, 20)
+        for i in range(500):
+            x = rng.randrange(70)
+            y = rng.randrange(20)
+            stepped.toggle_cell(x, y)
+            updated.toggle_cell(x, y)
+        stepped.step(25)
+        for i in range(25):
+            updated.update_state()
+        self.assertEqual(stepped.get_grid(), updated.get_grid())
+        with self.assertRaises(ValueError):
+            stepped.step(-1)
+
+    def test_torus_matches_reference_model(self):
+        rng = random.Random(13)
+        for width, height in [(1, 1), (2, 7), (13, 5), (64, 4), (70, 9)]:
+            reference = GameOfLifeModel(width, height, 'torus')
+            m = NumpyGameOfLifeModel(width, height, 'torus')
+            self.assertEqual(m.get_topology(), 'torus')
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(12):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+
+    def test_rules_match_reference_model(self):
+        rng = random.Random(17)
+        for rule in ['B36/S23', 'B2/S', 'B1357/S1357', 'B0/S8', 'B01/S0123']:
+            for topology in ['bounded', 'torus']:
+                reference = GameOfLifeModel(13, 6, topology, rule)
+                m = NumpyGameOfLifeModel(13, 6, topology, rule)
+                self.assertEqual(m.get_rule(), reference.get_rule())
+                for y in range(6):
+                    for x in range(13):
+                        if rng.random() < 0.4:
+                            reference.toggle_cell(x, y)
+                            m.toggle_cell(x, y)
+                for i in range(8):
+                    reference.update_state()
+                    m.update_state()
+                    self.assertEqual(m.get_grid(), reference.get_grid())
+
+
+    def test_cycle_detection(self):
+        self.assertEqual(NumpyGameOfLifeModel(5, 5).get_cycle(), None)
+        m = NumpyGameOfLifeModel(7, 7, cycle_history=8)
+        for x in (1, 2, 3):
+            m.toggle_cell(x, 2)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), None)
+        m.update_state()
+        # the blinker is back in its first phase
+        self.assertEqual(m.get_cycle(), (2, 2))
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (2, 3))
+        # editing the board discards the recorded states
+        m.toggle_cell(6, 6)
+        m.step(2)
+        self.assertEqual(m.get_cycle(), None)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (2, 6))
+
+    def test_cycle_detection_on_torus(self):
+        m = NumpyGameOfLifeModel(6, 6, 'torus', cycle_history=32)
+        for (x, y) in [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]:
+            m.toggle_cell(x, y)
+        m.step(23)
+        self.assertEqual(m.get_cycle(), None)
+        m.step(1)
+        self.assertEqual(m.get_cycle(), (24, 24))
+
+
+    def test_cell_keys(self):
+        c = CycleDetector(5, 4, seed=3)
+        self.assertEqual(cell_keys(c.get_salt(), 20).tolist(), [c.get_key(i) for i in range(20)])
+
+    def test_get_grid_view(self):
+        m = NumpyGameOfLifeModel(3, 2)
+        view = m.get_grid_view()
+        self.assertEqual(view.shape, (2, 3))
+        m.toggle_cell(2, 1)
+        m.toggle_cell(1, 1)
+        m.toggle_cell(0, 1)
+        m.update_state()
+        self.assertEqual(view.astype(bool).tolist(), m.get_grid())
+        with self.assertRaises(ValueError):
+            view[0, 0] = 1
+
+    def test_bulk_operations(self):
+        reference = GameOfLifeModel(9, 6)
+        m = NumpyGameOfLifeModel(9, 6)
+        glider = [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]
+        for model in (reference, m):
+            model.stamp(glider, 4, 2)
+            model.set_cells([(0, 0), (8, 5), (0, 0)])
+            model.set_cells([(6, 3)], False)
+            self.assertRaises(ValueError, model.set_cells, [(1, 1), (9, 0)])
+            self.assertRaises(ValueError, model.stamp, glider, 7, 0)
+        self.assertEqual(m.get_grid(), reference.get_grid())
+        m.clear()
+        self.assertEqual(m.get_grid(), [[False] * 9 for i in range(6)])
+
+    def test_large_stamp(self):
+        m = NumpyGameOfLifeModel(1000, 1000)
+        pattern = [(x, y) for y in range(0, 500, 2) for x in range(0, 800, 2)]
+        m.stamp(pattern, 100, 200)
+        self.assertEqual(int(m.get_grid_view().sum()), 100000)
+        self.assertEqual(m.get_grid_view()[200, 100], 1)
+        self.assertEqual(m.get_grid_view()[698, 898], 1)
+        m.set_cells([(x + 100, y + 200) for (x, y) in pattern], False)
+        self.assertEqual(int(m.get_grid_view().sum()), 0)
+
+    def test_bulk_operations_reset_cycle_detection(self):
+        m = NumpyGameOfLifeModel(7, 7, cycle_history=8)
+        m.stamp([(0, 0), (1, 0), (2, 0)], 1, 2)
+        m.step(2)
+        self.assertEqual(m.get_cycle(), (2, 2))
+        m.set_cells([(6, 6), (6, 6)])
+        self.assertEqual(m.get_cycle(), None)
+        m.step(2)
+        self.assertEqual(m.get_cycle(), None)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (2, 5))
+        m.clear()
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (1, 6))
+
+    def test_population_and_bounding_box(self):
+        rng = random.Random(19)
+        m = NumpyGameOfLifeModel(20, 12)
+        self.assertEqual(m.population(), 0)
+        self.assertEqual(m.bounding_box(), None)
+        for y in range(3, 9):
+            for x in range(5, 14):
+                if rng.random() < 0.4:
+                    m.toggle_cell(x, y)
+        for i in range(30):
+            cells = [(x, y) for y, row in enumerate(m.get_grid()) for x, alive in enumerate(row) if alive]
+            self.assertEqual(m.population(), len(cells))
+            if cells:
+                self.assertEqual(m.bounding_box(), (min(c[0] for c in cells), min(c[1] for c in cells),
+                                                    max(c[0] for c in cells), max(c[1] for c in cells)))
+            else:
+                self.assertEqual(m.bounding_box(), None)
+            m.update_state()
+        m.toggle_cell(0, 0)
+        self.assertEqual(m.bounding_box()[:2], (0, 0))
+
+
+    def test_get_changes(self):
+        rng = random.Random(23)
+        for topology in ('bounded', 'torus'):
+            m = NumpyGameOfLifeModel(15, 10, topology, cycle_history=4)
+            # the changes are only recorded while tracking is enabled
+            m.step(1)
+            self.assertEqual(m.get_changes(), None)
+            m.track_changes()
+            self.assertEqual(m.get_changes(), ([], []))
+            m.set_cells([(x, y) for y in range(10) for x in range(15) if rng.random() < 0.4])
+            for n in (1, 1, 4):
+                before = m.get_grid()
+                m.step(n)
+                after = m.get_grid()
+                born, died = m.get_changes()
+                self.assertEqual(sorted(born), [(x, y) for x in range(15) for y in range(10)
+                                                if after[y][x] and not before[y][x]])
+                self.assertEqual(sorted(died), [(x, y) for x in range(15) for y in range(10)
+                                                if before[y][x] and not after[y][x]])
+            m.track_changes(False)
+            m.step(2)
+            self.assertEqual(m.get_changes(), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import random
+import unittest
+from Model.GameOfLifeModel import GameOfLifeModel
+from Model.ParallelGameOfLifeModel import ParallelGameOfLifeModel
+
+
+class ParallelGameOfLifeModelTests(unittest.TestCase):
+    """ A class used to run tests for the ParallelGameOfLifeModel. """
+
+    def test_constructor(self):
+        m = ParallelGameOfLifeModel(10, 3, 8)
+        self.assertEqual(m.get_width(), 10)
+        self.assertEqual(m.get_height(), 3)
+        self.assertEqual(m.get_worker_count(), 3)
+        self.assertEqual(m.get_grid(), [[False] * 10] * 3)
+        m.close()
+        with self.assertRaises(ValueError):
+            ParallelGameOfLifeModel(0, 10, 2)
+        with self.assertRaises(ValueError):
+            ParallelGameOfLifeModel(10, 10, 0)
+
+    def test_toggle_cell(self):
+        m = ParallelGameOfLifeModel(5, 5, 2)
+        m.toggle_cell(3, 4)
+        self.assertIs(m.get_grid()[4][3], True)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(5, 4)
+        m.close()
+
+    def test_matches_reference_model(self):
+        rng = random.Random(5)
+        for workers in [1, 2, 3]:
+            reference = GameOfLifeModel(37, 23)
+            m = ParallelGameOfLifeModel(37, 23, workers)
+            for i in range(350):
+                x = rng.randrange(37)
+                y = rng.randrange(23)
+                reference.toggle_cell(x, y)
+                m.toggle_cell(x, y)
+            for i in range(5):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+            reference.step(9)
+            m.step(9)
+            self.assertEqual(m.get_grid(), reference.get_grid())
+            m.close()
+
+    def test_closed_model(self):
+        m = ParallelGameOfLifeModel(4, 4, 2)
+        m.toggle_cell(1, 1)
+        m.close()
+        self.assertIs(m.get_grid()[1][1], True)
+        with self.assertRaises(RuntimeError):
+            m.update_state()
+
+
+    def test_rule(self):
+        rng = random.Random(19)
+        reference = GameOfLifeModel(13, 6, rule='B36/S23')
+        m = ParallelGameOfLifeModel(13, 6, 2, 'B36/S23')
+        self.assertEqual(m.get_rule(), 'B36/S23')
+        for y in range(6):
+            for x in range(13):
+                if rng.random() < 0.4:
+                    reference.toggle_cell(x, y)
+                    m.toggle_cell(x, y)
+        reference.step(8)
+        m.step(8)
+        self.assertEqual(m.get_grid(), reference.get_grid())
+        m.close()
+
+
+    def test_bulk_operations(self):
+        reference = GameOfLifeModel(9, 7)
+        m = ParallelGameOfLifeModel(9, 7, 2)
+        glider = [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]
+        for model in (reference, m):
+            model.stamp(glider, 5, 1)
+            model.set_cells([(0, 0), (8, 6), (7, 6), (0, 0)])
+            model.set_cells([(6, 2), (1, 1)], False)
+            self.assertRaises(ValueError, model.set_cells, [(1, 1), (9, 0)])
+        for i in range(6):
+            self.assertEqual(m.get_grid(), reference.get_grid())
+            reference.update_state()
+            m.update_state()
+        m.clear()
+        self.assertEqual(m.get_grid(), [[False] * 9 for i in range(7)])
+        m.update_state()
+        self.assertEqual(m.population(), 0)
+        m.close()
+
+
+    def test_grid_view_follows_generations(self):
+        m = ParallelGameOfLifeModel(6, 6, 2)
+        view = m.get_grid_view()
+        m.set_cells([(1, 2), (2, 2), (3, 2)])
+        # an odd number of generations ends in the second buffer, which is copied back into the viewed one
+        m.step(1)
+        self.assertEqual(view.astype(bool).tolist(), m.get_grid())
+        self.assertEqual((m.population(), m.bounding_box()), (3, (2, 1, 2, 3)))
+        m.step(3)
+        self.assertEqual(view.astype(bool).tolist(), m.get_grid())
+        self.assertEqual((m.population(), m.bounding_box()), (3, (1, 2, 3, 2)))
+        with self.assertRaises(ValueError):
+            view[0, 0] = 1
+        m.close()
+        self.assertEqual(m.get_grid_view().astype(bool).tolist(), m.get_grid())
+        self.assertEqual(m.population(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
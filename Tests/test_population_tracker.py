@@ -0,0 +1,46 @@
+import unittest
+from Model.PopulationTracker import PopulationTracker
+
+
+class PopulationTrackerTests(unittest.TestCase):
+    """ A class used to run tests for the PopulationTracker. """
+
+    def test_population(self):
+        t = PopulationTracker(5, 4)
+        self.assertEqual(t.get_population(), 0)
+        self.assertEqual(t.get_bounding_box(), None)
+        t.flip(2, 1, True)
+        t.flip(4, 3, True)
+        self.assertEqual(t.get_population(), 2)
+        t.flip(2, 1, False)
+        self.assertEqual(t.get_population(), 1)
+        t.clear()
+        self.assertEqual(t.get_population(), 0)
+        self.assertEqual(t.get_bounding_box(), None)
+        with self.assertRaises(ValueError):
+            PopulationTracker(0, 4)
+
+    def test_bounding_box(self):
+        t = PopulationTracker(6, 6)
+        t.flip(2, 3, True)
+        self.assertEqual(t.get_bounding_box(), (2, 3, 2, 3))
+        t.flip(4, 1, True)
+        t.flip(1, 5, True)
+        self.assertEqual(t.get_bounding_box(), (1, 1, 4, 5))
+        # a death inside the box or on an edge which still holds other cells does not shrink it
+        t.flip(3, 5, True)
+        t.flip(3, 5, False)
+        t.flip(1, 1, True)
+        t.flip(1, 1, False)
+        self.assertEqual(t.get_bounding_box(), (1, 1, 4, 5))
+        t.flip(1, 5, False)
+        self.assertEqual(t.get_bounding_box(), (2, 1, 4, 3))
+        t.flip(2, 3, False)
+        t.flip(4, 1, False)
+        self.assertEqual(t.get_bounding_box(), None)
+        t.flip(0, 0, True)
+        self.assertEqual(t.get_bounding_box(), (0, 0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import random
+import unittest
+from Model.GameOfLifeModel import GameOfLifeModel
+from Model.RowBitsetGameOfLifeModel import RowBitsetGameOfLifeModel
+
+
+class RowBitsetGameOfLifeModelTests(unittest.TestCase):
+    """ A class used to run tests for the RowBitsetGameOfLifeModel. """
+
+    def test_constructor(self):
+        m = RowBitsetGameOfLifeModel(10, 20)
+        self.assertEqual(m.get_width(), 10)
+        self.assertEqual(m.get_height(), 20)
+        self.assertEqual(len(m.get_grid()), 20)
+        self.assertEqual(len(m.get_grid()[0]), 10)
+        self.assertEqual(m.get_grid()[19][9], False)
+        with self.assertRaises(ValueError):
+            RowBitsetGameOfLifeModel(0, 10)
+        with self.assertRaises(ValueError):
+            RowBitsetGameOfLifeModel(10, -2)
+
+    def test_toggle_cell(self):
+        m = RowBitsetGameOfLifeModel(5, 5)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(3, 4)
+        self.assertIs(m.get_grid()[0][0], True)
+        self.assertIs(m.get_grid()[4][3], True)
+        m.toggle_cell(0, 0)
+        self.assertIs(m.get_grid()[0][0], False)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(-1, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(5, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(4, 5)
+
+    def test_update_state_edges(self):
+        m = RowBitsetGameOfLifeModel(3, 3)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(0, 1)
+        m.toggle_cell(1, 0)
+        m.update_state()
+        self.assertEqual(m.get_grid(), [[True, True, False],
+                                        [True, True, False],
+                                        [False, False, False]])
+
+    def test_matches_reference_model(self):
+        rng = random.Random(7)
+        for width, height in [(1, 1), (2, 7), (13, 5), (40, 31)]:
+            reference = GameOfLifeModel(width, height)
+            m = RowBitsetGameOfLifeModel(width, height)
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(15):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_step_matches_update_state(self):
+        rng = random.Random(11)
+        stepped = RowBitsetGameOfLifeModel(70, 20)
+        updated = RowBitsetGameOfLifeModel(70, 20)
+        for i in range(500):
+            x = rng.randrange(70)
+            y = rng.randrange(20)
+            stepped.toggle_cell(x, y)
+            updated.toggle_cell(x, y)
+        stepped.step(25)
+        for i in range(25):
+            updated.update_state()
+        self.assertEqual(stepped.get_grid(), updated.get_grid())
+        with self.assertRaises(ValueError):
+            stepped.step(-1)
+
+    def test_torus_matches_reference_model(self):
+        rng = random.Random(13)
+        for width, height in [(1, 1), (2, 7), (13, 5), (64, 4), (70, 9)]:
+            reference = GameOfLifeModel(width, height, 'torus')
+            m = RowBitsetGameOfLifeModel(width, height, 'torus')
+            self.assertEqual(m.get_topology(), 'torus')
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(12):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+
+    def test_rules_match_reference_model(self):
+        rng = random.Random(17)
+        for rule in ['B36/S23', 'B2/S', 'B1357/S1357', 'B0/S8', 'B01/S0123']:
+            for topology in ['bounded', 'torus']:
+                reference = GameOfLifeModel(13, 6, topology, rule)
+                m = RowBitsetGameOfLifeModel(13, 6, topology, rule)
+                self.assertEqual(m.get_rule(), reference.get_rule())
+                for y in range(6):
+                    for x in range(13):
+                        if rng.random() < 0.4:
+                            reference.toggle_cell(x, y)
+                            m.toggle_cell(x, y)
+                for i in range(8):
+                    reference.update_state()
+                    m.update_state()
+                    self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_population_and_bounding_box(self):
+        rng = random.Random(19)
+        m = RowBitsetGameOfLifeModel(20, 12)
+        self.assertEqual(m.population(), 0)
+        self.assertEqual(m.bounding_box(), None)
+        for y in range(3, 9):
+            for x in range(5, 14):
+                if rng.random() < 0.4:
+                    m.toggle_cell(x, y)
+        for i in range(30):
+            cells = [(x, y) for y, row in enumerate(m.get_grid()) for x, alive in enumerate(row) if alive]
+            self.assertEqual(m.population(), len(cells))
+            if cells:
+                self.assertEqual(m.bounding_box(), (min(c[0] for c in cells), min(c[1] for c in cells),
+                                                    max(c[0] for c in cells), max(c[1] for c in cells)))
+            else:
+                self.assertEqual(m.bounding_box(), None)
+            m.update_state()
+        m.toggle_cell(0, 0)
+        self.assertEqual(m.bounding_box()[:2], (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
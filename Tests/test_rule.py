@@ -0,0 +1,41 @@
+import unittest
+from Model.Rule import Rule, ZERO, ONE, ONES, NOT_ONES
+
+
+class RuleTests(unittest.TestCase):
+    """ A class used to run tests for the Rule. """
+
+    def test_parse(self):
+        conway = Rule()
+        self.assertEqual(str(conway), 'B3/S23')
+        self.assertEqual(conway.get_birth(), (False, False, False, True, False, False, False, False, False))
+        self.assertEqual(conway.get_survival(), (False, False, True, True, False, False, False, False, False))
+        self.assertEqual(str(Rule('b36/s23')), 'B36/S23')
+        self.assertEqual(str(Rule('S23/B36')), 'B36/S23')
+        self.assertEqual(str(Rule('23/36')), 'B36/S23')
+        self.assertEqual(str(Rule('B/S')), 'B/S')
+        self.assertEqual(str(Rule('B012345678/S012345678')), 'B012345678/S012345678')
+
+    def test_invalid_rules(self):
+        for rulestring in [None, '', 'B3', 'B3/S23/X', 'B9/S23', 'B3/B23', 'S3/S23', 'B3/23', 'Bx/S23']:
+            with self.assertRaises(ValueError):
+                Rule(rulestring)
+
+    def test_tables(self):
+        highlife = Rule('B36/S23')
+        self.assertEqual(highlife.get_table(), (0, 0, 0, 1, 0, 0, 1, 0, 0,
+                                                0, 0, 1, 1, 0, 0, 0, 0, 0))
+        self.assertEqual(highlife.get_minterms(), [(2, False, True), (3, True, True), (6, True, False)])
+        for n in range(9):
+            self.assertEqual(highlife.next_state(False, n), n in (3, 6))
+            self.assertEqual(highlife.next_state(True, n), n in (2, 3))
+
+    def test_bitsliced_plan(self):
+        self.assertEqual(Rule().get_bitsliced_plan(), [(1, ONES, ONE)])
+        self.assertEqual(Rule('B36/S23').get_bitsliced_plan(), [(1, ONES, ONE), (3, NOT_ONES, ZERO)])
+        self.assertEqual(Rule('B/S').get_bitsliced_plan(), [])
+        self.assertEqual(Rule('B8/S0').get_bitsliced_plan(), [(0, ZERO, NOT_ONES), (4, NOT_ONES, ZERO)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+import SoupSearch
+from Model.Census import KNOWN_OBJECTS, parse_rows
+
+
+class SoupSearchTests(unittest.TestCase):
+    """ A class used to run tests for the soup search. """
+
+    parameters = {'size': 8, 'width': 20, 'height': 20, 'density': 0.5, 'seed': 3, 'rule': 'B3/S23', 'batch': 10,
+                  'generations': 400}
+
+    def test_soup(self):
+        a = SoupSearch.soup(5, self.parameters)
+        self.assertEqual(a.shape, (20, 20))
+        self.assertTrue((a == SoupSearch.soup(5, self.parameters)).all())
+        self.assertFalse((a == SoupSearch.soup(6, self.parameters)).all())
+        # only the square in the middle of the board is random
+        self.assertEqual(int(a.sum()), int(a[6:14, 6:14].sum()))
+
+    def test_search_batch(self):
+        batch, counts = SoupSearch.search_batch(2, self.parameters)
+        self.assertEqual(batch, 2)
+        self.assertGreater(sum(counts.values()), 0)
+        self.assertEqual(SoupSearch.search_batch(2, self.parameters)[1], counts)
+
+    def test_settle_long_periods(self):
+        # the pentadecathlon (period 15) and a block settle well within the generation limit
+        board = np.zeros((20, 20), dtype=np.uint8)
+        for (x, y) in parse_rows(KNOWN_OBJECTS['pentadecathlon']):
+            board[y + 8, x + 5] = 1
+        board[1:3, 1:3] = 1
+        self.assertEqual(SoupSearch.settle(board[np.newaxis], self.parameters), {'pentadecathlon': 1, 'block': 1})
+
+    def test_merge_census(self):
+        census = {'completed': 0, 'finished': [], 'soups': 0, 'census': {}}
+        SoupSearch.merge_census(census, 2, {'block': 1}, 10)
+        SoupSearch.merge_census(census, 1, {'block': 2, 'blinker': 1}, 10)
+        self.assertEqual((census['completed'], census['finished']), (0, [1, 2]))
+        SoupSearch.merge_census(census, 0, {}, 10)
+        self.assertEqual((census['completed'], census['finished']), (3, []))
+        SoupSearch.merge_census(census, 4, {}, 10)
+        self.assertEqual((census['completed'], census['finished']), (3, [4]))
+        self.assertEqual(census['soups'], 40)
+        self.assertEqual(census['census'], {'block': 3, 'blinker': 1})
+
+    def test_resume(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'census.json')
+            SoupSearch.search(path, self.parameters, 20, workers=1)
+            with open(path) as f:
+                self.assertEqual(json.load(f)['soups'], 20)
+            resumed = SoupSearch.search(path, self.parameters, 40, workers=2)
+            fresh = SoupSearch.search(os.path.join(directory, 'fresh.json'), self.parameters, 40, workers=1)
+            self.assertEqual(resumed['soups'], 40)
+            self.assertEqual(resumed['completed'], 4)
+            self.assertEqual(resumed['finished'], [])
+            self.assertEqual(resumed['census'], fresh['census'])
+            self.assertEqual(fresh['soups'], 40)
+            # a census file can only be resumed with the parameters it was started with
+            with self.assertRaises(ValueError):
+                SoupSearch.search(path, dict(self.parameters, seed=4), 60, workers=1)
+            with self.assertRaises(ValueError):
+                SoupSearch.search(path, dict(self.parameters, batch=0), 60, workers=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import random
+import unittest
+from Model.GameOfLifeModel import GameOfLifeModel
+from Model.ThreadedGameOfLifeModel import ThreadedGameOfLifeModel
+
+
+class ThreadedGameOfLifeModelTests(unittest.TestCase):
+    """ A class used to run tests for the ThreadedGameOfLifeModel. """
+
+    def test_constructor(self):
+        m = ThreadedGameOfLifeModel(10, 3, 8)
+        self.assertEqual(m.get_width(), 10)
+        self.assertEqual(m.get_height(), 3)
+        self.assertEqual(m.get_thread_count(), 3)
+        self.assertEqual(m.get_grid(), [[False] * 10] * 3)
+        m.close()
+        with self.assertRaises(ValueError):
+            ThreadedGameOfLifeModel(0, 10, 2)
+        with self.assertRaises(ValueError):
+            ThreadedGameOfLifeModel(10, 10, 0)
+
+    def test_toggle_cell(self):
+        m = ThreadedGameOfLifeModel(5, 5, 2)
+        m.toggle_cell(3, 4)
+        self.assertIs(m.get_grid()[4][3], True)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(5, 4)
+        m.close()
+
+    def test_matches_reference_model(self):
+        rng = random.Random(5)
+        for threads in [1, 2, 3]:
+            reference = GameOfLifeModel(37, 23)
+            m = ThreadedGameOfLifeModel(37, 23, threads)
+            for i in range(350):
+                x = rng.randrange(37)
+                y = rng.randrange(23)
+                reference.toggle_cell(x, y)
+                m.toggle_cell(x, y)
+            for i in range(5):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+            reference.step(9)
+            m.step(9)
+            self.assertEqual(m.get_grid(), reference.get_grid())
+            m.close()
+
+    def test_grid_view_follows_generations(self):
+        m = ThreadedGameOfLifeModel(5, 5, 2)
+        view = m.get_grid_view()
+        m.set_cells([(1, 2), (2, 2), (3, 2)])
+        for n in (1, 1, 2, 3):
+            m.step(n)
+            self.assertEqual(view.astype(bool).tolist(), m.get_grid())
+            self.assertIs(m.get_grid_view(), view)
+        self.assertEqual(m.population(), 3)
+        with self.assertRaises(ValueError):
+            view[0, 0] = 1
+        m.close()
+
+    def test_closed_model(self):
+        m = ThreadedGameOfLifeModel(4, 4, 2)
+        m.toggle_cell(1, 1)
+        m.close()
+        self.assertIs(m.get_grid()[1][1], True)
+        with self.assertRaises(RuntimeError):
+            m.update_state()
+
+    def test_torus_matches_reference_model(self):
+        rng = random.Random(13)
+        for width, height in [(1, 1), (2, 7), (13, 5), (64, 4), (70, 9)]:
+            reference = GameOfLifeModel(width, height, 'torus')
+            m = ThreadedGameOfLifeModel(width, height, 3, 'torus')
+            self.assertEqual(m.get_topology(), 'torus')
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(12):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+
+    def test_rules_match_reference_model(self):
+        rng = random.Random(17)
+        for rule in ['B36/S23', 'B2/S', 'B1357/S1357', 'B0/S8', 'B01/S0123']:
+            for topology in ['bounded', 'torus']:
+                reference = GameOfLifeModel(13, 6, topology, rule)
+                m = ThreadedGameOfLifeModel(13, 6, 2, topology, rule)
+                self.assertEqual(m.get_rule(), reference.get_rule())
+                for y in range(6):
+                    for x in range(13):
+                        if rng.random() < 0.4:
+                            reference.toggle_cell(x, y)
+                            m.toggle_cell(x, y)
+                for i in range(8):
+                    reference.update_state()
+                    m.update_state()
+                    self.assertEqual(m.get_grid(), reference.get_grid())
+                m.close()
+
+    def test_bulk_operations(self):
+        reference = GameOfLifeModel(70, 9)
+        m = ThreadedGameOfLifeModel(70, 9, 2)
+        glider = [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]
+        for model in (reference, m):
+            model.stamp(glider, 60, 1)
+            model.set_cells([(0, 0), (63, 8), (64, 8), (0, 0)])
+            model.set_cells([(62, 3)], False)
+            self.assertRaises(ValueError, model.set_cells, [(1, 1), (70, 0)])
+        for i in range(6):
+            self.assertEqual(m.get_grid(), reference.get_grid())
+            reference.update_state()
+            m.update_state()
+        m.clear()
+        self.assertEqual(m.get_grid(), [[False] * 70 for i in range(9)])
+        m.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import random
+import unittest
+from Model.GameOfLifeModel import GameOfLifeModel
+from Model.TiledGameOfLifeModel import TiledGameOfLifeModel
+
+
+class TiledGameOfLifeModelTests(unittest.TestCase):
+    """ A class used to run tests for the TiledGameOfLifeModel. """
+
+    def test_constructor(self):
+        m = TiledGameOfLifeModel(10, 20)
+        self.assertEqual(m.get_width(), 10)
+        self.assertEqual(m.get_height(), 20)
+        self.assertEqual(len(m.get_grid()), 20)
+        self.assertEqual(len(m.get_grid()[0]), 10)
+        self.assertEqual(m.get_grid()[19][9], False)
+        with self.assertRaises(ValueError):
+            TiledGameOfLifeModel(0, 10)
+        with self.assertRaises(ValueError):
+            TiledGameOfLifeModel(10, -2)
+
+    def test_toggle_cell(self):
+        m = TiledGameOfLifeModel(5, 5)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(3, 4)
+        self.assertIs(m.get_grid()[0][0], True)
+        self.assertIs(m.get_grid()[4][3], True)
+        m.toggle_cell(0, 0)
+        self.assertIs(m.get_grid()[0][0], False)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(-1, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(5, 4)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(4, 5)
+
+    def test_update_state_edges(self):
+        m = TiledGameOfLifeModel(3, 3)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(0, 1)
+        m.toggle_cell(1, 0)
+        m.update_state()
+        self.assertEqual(m.get_grid(), [[True, True, False],
+                                        [True, True, False],
+                                        [False, False, False]])
+
+    def test_matches_reference_model(self):
+        rng = random.Random(7)
+        for width, height in [(1, 1), (2, 7), (13, 5), (40, 31)]:
+            reference = GameOfLifeModel(width, height)
+            m = TiledGameOfLifeModel(width, height, 4)
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(15):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_awake_tiles(self):
+        m = TiledGameOfLifeModel(256, 256)
+        self.assertEqual(m.get_tile_count(), 64)
+        self.assertEqual(m.get_awake_tiles(), 0)
+        # blinker in the middle of tile (1, 1)
+        for x in (47, 48, 49):
+            m.toggle_cell(x, 48)
+        self.assertEqual(m.get_awake_tiles(), 9)
+        # block in the corner of the board
+        for (x, y) in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+            m.toggle_cell(x, y)
+        self.assertEqual(m.get_awake_tiles(), 9)
+        m.update_state()
+        self.assertEqual(m.get_awake_tiles(), 9)
+        with self.assertRaises(ValueError):
+            TiledGameOfLifeModel(10, 10, 0)
+
+    def test_sleeping_debris(self):
+        m = TiledGameOfLifeModel(128, 64)
+        for (x, y) in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+            m.toggle_cell(x, y)
+        m.update_state()
+        self.assertEqual(m.get_awake_tiles(), 0)
+        m.update_state()
+        self.assertEqual(m.get_grid()[1][1], True)
+        self.assertEqual(m.get_awake_tiles(), 0)
+
+
+    def test_rules_match_reference_model(self):
+        rng = random.Random(17)
+        for rule in ['B36/S23', 'B2/S', 'B1357/S1357', 'B3/S012345678', 'B0/S8', 'B01/S0123']:
+            reference = GameOfLifeModel(13, 6, rule=rule)
+            m = TiledGameOfLifeModel(13, 6, 4, rule)
+            self.assertEqual(m.get_rule(), reference.get_rule())
+            for y in range(6):
+                for x in range(13):
+                    if rng.random() < 0.4:
+                        reference.toggle_cell(x, y)
+                        m.toggle_cell(x, y)
+            for i in range(8):
+                reference.update_state()
+                m.update_state()
+                self.assertEqual(m.get_grid(), reference.get_grid())
+
+    def test_bulk_operations(self):
+        reference = GameOfLifeModel(70, 9)
+        m = TiledGameOfLifeModel(70, 9, 4)
+        glider = [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]
+        for model in (reference, m):
+            model.stamp(glider, 60, 1)
+            model.set_cells([(0, 0), (63, 8), (64, 8), (0, 0)])
+            model.set_cells([(62, 3)], False)
+            self.assertRaises(ValueError, model.set_cells, [(1, 1), (70, 0)])
+        for i in range(6):
+            self.assertEqual(m.get_grid(), reference.get_grid())
+            reference.update_state()
+            m.update_state()
+        m.clear()
+        self.assertEqual(m.get_grid(), [[False] * 70 for i in range(9)])
+        # cells written into sleeping tiles wake them up
+        m.update_state()
+        m.stamp([(0, 0), (1, 0), (2, 0)], 30, 4)
+        m.update_state()
+        self.assertEqual(m.get_grid()[3][31], True)
+
+
+if __name__ == '__main__':
+    unittest.main()
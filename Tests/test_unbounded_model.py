@@ -0,0 +1,157 @@
+import unittest
+from Model.UnboundedGameOfLifeModel import UnboundedGameOfLifeModel
+
+
+class UnboundedGameOfLifeModelTests(unittest.TestCase):
+    """ A class used to run tests for the UnboundedGameOfLifeModel. """
+
+    def test_constructor(self):
+        m = UnboundedGameOfLifeModel(10, 20, -5, 3)
+        self.assertEqual(m.get_width(), 10)
+        self.assertEqual(m.get_height(), 20)
+        self.assertEqual(m.get_window_origin(), (-5, 3))
+        self.assertEqual(m.bounding_box(), None)
+        self.assertEqual(m.population(), 0)
+        with self.assertRaises(ValueError):
+            UnboundedGameOfLifeModel(0, 10)
+
+    def test_toggle_cell(self):
+        m = UnboundedGameOfLifeModel(5, 5, 100, 200)
+        m.toggle_cell(1, 2)
+        self.assertEqual(m.get_grid()[2][1], True)
+        self.assertEqual(m.bounding_box(), (1, 2, 1, 2))
+        m.toggle_cell(4, 0)
+        self.assertEqual(m.bounding_box(), (1, 0, 4, 2))
+        m.toggle_cell(4, 0)
+        self.assertEqual(m.bounding_box(), (1, 2, 1, 2))
+        # the box is given in window coordinates
+        m.set_window_origin(101, 202)
+        self.assertEqual(m.bounding_box(), (0, 0, 0, 0))
+        m.toggle_cell(0, 0)
+        self.assertEqual(m.bounding_box(), None)
+        with self.assertRaises(ValueError):
+            m.toggle_cell(5, 0)
+
+    def test_glider_leaves_window(self):
+        m = UnboundedGameOfLifeModel(3, 3)
+        for (x, y) in [(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)]:
+            m.toggle_cell(x, y)
+        self.assertEqual(m.bounding_box(), (0, 0, 2, 2))
+        for i in range(400):
+            m.update_state()
+        self.assertEqual(m.population(), 5)
+        self.assertEqual(m.bounding_box(), (100, 100, 102, 102))
+        self.assertEqual(m.get_grid(), [[False] * 3] * 3)
+        m.set_window_origin(100, 100)
+        self.assertEqual(m.get_grid(), [[False, False, True],
+                                        [True, False, True],
+                                        [False, True, True]])
+        self.assertEqual(m.bounding_box(), (0, 0, 2, 2))
+
+    def test_edits_cover_the_plane(self):
+        m = UnboundedGameOfLifeModel(5, 5)
+        m.set_cells([(0, 0), (1, 0), (2, 0), (1, 0)])
+        self.assertEqual(m.population(), 3)
+        self.assertEqual(m.bounding_box(), (0, 0, 2, 0))
+        m.set_cells([(0, 0), (4, 4)], False)
+        self.assertEqual(m.population(), 2)
+        self.assertEqual(m.bounding_box(), (1, 0, 2, 0))
+        with self.assertRaises(ValueError):
+            m.set_cells([(3, 3), (None, 0)])
+        self.assertEqual(m.population(), 2)
+        # a stamp may reach past the window
+        m.stamp([(0, 0), (1, 0), (0, 1), (1, 1)], 4, -1)
+        self.assertEqual(m.population(), 6)
+        self.assertEqual(m.bounding_box(), (1, -1, 5, 0))
+        self.assertEqual(m.get_grid()[0], [False, True, True, False, True])
+        # cells which left the window are counted and cleared
+        m.set_window_origin(20, 20)
+        self.assertEqual(m.population(), 6)
+        self.assertEqual(m.bounding_box(), (-19, -21, -15, -20))
+        self.assertEqual(sorted(m.live_cells()), [(-19, -20), (-18, -20), (-16, -21), (-16, -20), (-15, -21),
+                                                  (-15, -20)])
+        m.clear()
+        self.assertEqual(m.population(), 0)
+        self.assertEqual(m.bounding_box(), None)
+        self.assertEqual(m.live_cells(), [])
+        # cells outside the window can be set as well
+        m.set_cells([(-19, -20), (30, 0)])
+        self.assertEqual(m.bounding_box(), (-19, -20, 30, 0))
+        m.set_cells([(-19, -20), (30, 0)], False)
+        m.set_window_origin(0, 0)
+        self.assertEqual(m.get_grid(), [[False] * 5] * 5)
+
+    def test_blinker_does_not_clip(self):
+        m = UnboundedGameOfLifeModel(3, 1)
+        m.toggle_cell(0, 0)
+        m.toggle_cell(1, 0)
+        m.toggle_cell(2, 0)
+        m.update_state()
+        self.assertEqual(m.bounding_box(), (1, -1, 1, 1))
+        m.update_state()
+        self.assertEqual(m.get_grid(), [[True, True, True]])
+
+
+    def test_rule(self):
+        with self.assertRaises(ValueError):
+            UnboundedGameOfLifeModel(5, 5, rule='B0/S8')
+        # a lone cell survives under S0 and a domino stays put under B/S1
+        m = UnboundedGameOfLifeModel(3, 3, rule='B/S0')
+        m.toggle_cell(1, 1)
+        m.update_state()
+        self.assertEqual(m.population(), 1)
+        m = UnboundedGameOfLifeModel(3, 3, rule='B/S1')
+        m.toggle_cell(0, 0)
+        m.toggle_cell(1, 0)
+        m.step(3)
+        self.assertEqual(m.bounding_box(), (0, 0, 1, 0))
+
+
+    def test_get_changes(self):
+        m = UnboundedGameOfLifeModel(3, 3, 10, 10)
+        # the changes are only recorded while tracking is enabled
+        m.set_cells([(0, 1), (1, 1), (2, 1)])
+        m.step(1)
+        self.assertEqual(m.get_changes(), None)
+        m.track_changes()
+        self.assertEqual(m.get_changes(), ([], []))
+        m.update_state()
+        born, died = m.get_changes()
+        self.assertEqual((sorted(born), sorted(died)), ([(0, 1), (2, 1)], [(1, 0), (1, 2)]))
+        m.step(2)
+        self.assertEqual(m.get_changes(), ([], []))
+        # a blinker on the edge of the window changes cells outside of it
+        m.clear()
+        m.set_cells([(0, 0), (1, 0), (2, 0)])
+        m.step(1)
+        born, died = m.get_changes()
+        self.assertEqual((sorted(born), sorted(died)), ([(1, -1), (1, 1)], [(0, 0), (2, 0)]))
+        m.track_changes(False)
+        m.step(1)
+        self.assertEqual(m.get_changes(), None)
+
+    def test_get_cycle(self):
+        self.assertEqual(UnboundedGameOfLifeModel(5, 5).get_cycle(), None)
+        m = UnboundedGameOfLifeModel(3, 3, cycle_history=8)
+        # a blinker reaching past the window repeats on the plane
+        m.set_cells([(-1, 1), (0, 1), (1, 1)])
+        m.update_state()
+        self.assertEqual(m.get_cycle(), None)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (2, 2))
+        # editing forgets the recorded states
+        m.toggle_cell(2, 2)
+        m.update_state()
+        self.assertEqual(m.get_cycle(), None)
+        m.clear()
+        m.update_state()
+        self.assertEqual(m.get_cycle(), (1, 4))
+        # a glider repeats its shape in another place, which is not a cycle of the plane
+        m.set_cells([(2, 0), (0, 1), (2, 1), (1, 2), (2, 2)])
+        for i in range(16):
+            m.update_state()
+            self.assertEqual(m.get_cycle(), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
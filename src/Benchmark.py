@@ -0,0 +1,193 @@
+import os
+import random
+import sys
+import time
+import tracemalloc
+from Model.GameOfLifeModel import GameOfLifeModel
+
+
+def main():
+    """
+    Headless benchmark of the Game of Life engines.
+    Every engine advances the same seeded random board and the number of generations per second is reported.
+    Command line arguments:
+        -engine: name of the engine to benchmark (all engines when omitted)
+        -width, -height: dimensions of the board (default 500 x 500)
+        -generations: number of generations to advance (default 50)
+        -workers: number of processes (parallel engine) or threads (threaded engine);
+                  sweeps 1, 2, 4, ... CPUs when omitted
+        -memory: 1 to report the bytes allocated per cell by every engine (measured with tracemalloc)
+                 instead of its speed
+    """
+    args = sys.argv
+    width = read_argument(args, '-width', 500)
+    height = read_argument(args, '-height', 500)
+    generations = read_argument(args, '-generations', 50)
+    workers = read_argument(args, '-workers', None)
+    engine = read_argument(args, '-engine', None, str)
+    memory = read_argument(args, '-memory', 0)
+
+    cells = random_cells(width, height, 0.35, 0)
+    names = [engine] if engine is not None else list(engine_factories().keys())
+    if memory:
+        for name in names:
+            # the boards of the parallel engine live in its worker processes, which tracemalloc does not see
+            if name != 'parallel':
+                size = memory_per_cell(engine_factories()[name], width, height, cells)
+                print(f'{name}: {size:.2f} bytes/cell')
+        return
+    for name in names:
+        if name in ('parallel', 'threaded'):
+            counts = [workers] if workers is not None else worker_counts()
+            for count in counts:
+                rate = benchmark(engine_factories()[name], width, height, cells, generations, workers=count)
+                print(f'{name} ({count} workers): {rate:.2f} generations/s')
+        else:
+            rate = benchmark(engine_factories()[name], width, height, cells, generations)
+            print(f'{name}: {rate:.2f} generations/s')
+
+
+def engine_factories() -> {}:
+    """
+    :return: dictionary mapping engine names to the functions which create them
+    """
+    def parallel(width, height, workers=None):
+        from Model.ParallelGameOfLifeModel import ParallelGameOfLifeModel
+        return ParallelGameOfLifeModel(width, height, workers)
+
+    def threaded(width, height, workers=None):
+        from Model.ThreadedGameOfLifeModel import ThreadedGameOfLifeModel
+        return ThreadedGameOfLifeModel(width, height, workers)
+
+    def numpy(width, height):
+        from Model.NumpyGameOfLifeModel import NumpyGameOfLifeModel
+        return NumpyGameOfLifeModel(width, height)
+
+    def bitboard(width, height):
+        from Model.BitboardGameOfLifeModel import BitboardGameOfLifeModel
+        return BitboardGameOfLifeModel(width, height)
+
+    def tiled(width, height):
+        from Model.TiledGameOfLifeModel import TiledGameOfLifeModel
+        return TiledGameOfLifeModel(width, height)
+
+    def block(width, height):
+        from Model.BlockGameOfLifeModel import BlockGameOfLifeModel
+        return BlockGameOfLifeModel(width, height)
+
+    def bitset(width, height):
+        from Model.RowBitsetGameOfLifeModel import RowBitsetGameOfLifeModel
+        return RowBitsetGameOfLifeModel(width, height)
+
+    def compact(width, height):
+        from Model.CompactGameOfLifeModel import CompactGameOfLifeModel
+        return CompactGameOfLifeModel(width, height)
+
+    def sparse(width, height):
+        from Model.SparseGameOfLifeModel import SparseGameOfLifeModel
+        return SparseGameOfLifeModel(width, height)
+
+    def incremental(width, height):
+        from Model.IncrementalGameOfLifeModel import IncrementalGameOfLifeModel
+        return IncrementalGameOfLifeModel(width, height)
+
+    return {
+        'reference': GameOfLifeModel,
+        'compact': compact,
+        'numpy': numpy,
+        'bitboard': bitboard,
+        'tiled': tiled,
+        'block': block,
+        'bitset': bitset,
+        'sparse': sparse,
+        'incremental': incremental,
+        'parallel': parallel,
+        'threaded': threaded,
+    }
+
+
+def benchmark(factory, width: int, height: int, cells: [(int, int)], generations: int, **kwargs) -> float:
+    """
+    Times an engine on a board.
+    :param factory: function creating the engine from the width, height and the keyword arguments
+    :param cells: coordinates of the initially living cells
+    :param generations: number of generations to advance
+    :return: generations per second
+    """
+    model = factory(width, height, **kwargs)
+    for (x, y) in cells:
+        model.toggle_cell(x, y)
+    start = time.perf_counter()
+    model.step(generations)
+    elapsed = time.perf_counter() - start
+    if hasattr(model, 'close'):
+        model.close()
+    return generations / elapsed if elapsed > 0 else float('inf')
+
+
+def memory_per_cell(factory, width: int, height: int, cells: [(int, int)], **kwargs) -> float:
+    """
+    Measures the memory held by an engine with tracemalloc: the memory still allocated after the engine was
+    created and seeded (the engine itself, its grid and any buffers), divided by the number of cells.
+    Allocations of modules imported while creating the first engine are not counted.
+    :param factory: function creating the engine from the width, height and the keyword arguments
+    :param cells: coordinates of the initially living cells
+    :return: bytes per cell
+    """
+    factory(1, 1, **kwargs)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        model = factory(width, height, **kwargs)
+        for (x, y) in cells:
+            model.toggle_cell(x, y)
+        model.step(1)
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    if hasattr(model, 'close'):
+        model.close()
+    return size / (width * height)
+
+
+def random_cells(width: int, height: int, density: float, seed: int) -> [(int, int)]:
+    """
+    :return: coordinates of the living cells of a seeded random board
+    """
+    rng = random.Random(seed)
+    return [(x, y) for y in range(height) for x in range(width) if rng.random() < density]
+
+
+def worker_counts() -> [int]:
+    """
+    :return: powers of two up to the number of CPUs (and the number of CPUs itself)
+    """
+    cpus = os.cpu_count() or 1
+    counts = []
+    count = 1
+    while count < cpus:
+        counts.append(count)
+        count *= 2
+    counts.append(cpus)
+    return counts
+
+
+def read_argument(args: [str], key: str, default, convert=int):
+    """
+    Searches through a list of arguments and identifies the value of a parameter with the provided key.
+    :param args: list of string arguments through which to parse
+    :param key: the string which indicates the parameter that needs to be identified
+    :param default: the value returned when the parameter is not present
+    :param convert: function converting the string value
+    :return: the value of the parameter if present; default if parameter is not present
+    """
+    i = 0
+    while i < len(args) - 1:
+        if args[i] == key:
+            return convert(args[i + 1])
+        i += 1
+    return default
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@ import sys
 import tkinter
 from tkinter import messagebox
 from Controller.IController import IController
+from Model.History import History
 from Model.IGameOfLifeModel import IGameOfLifeModel
 from Resources.GameUtils import GameUtils
 from View.IGameOfLifeView import IGameOfLifeView
@@ -20,6 +21,7 @@ class Controller(IController):
     __speed: the delay in milliseconds between consecutive state updates of the game when it is played
     __play: boolean that determines if the game is currently being played (true) or if the game is
             paused (false)
+    __history: History of the changes of the board which can be undone; created when the first change is recorded
 
     Methods
     -------
@@ -33,10 +35,17 @@ class Controller(IController):
         Method that performs a specific action called by the user of the program (command).
         Some commands may have associated events such as the coordinates of a mouse click.
 
+    undo():
+        reverts the most recent change of the board (a generation, a skip or an edit)
+
+    redo():
+        applies the most recently undone change of the board again
+
     __automatic__advance():
         starts an automatic progression of the game of life.
         sets __play to True.
         Updates the model and redraws automatically.
+        Stops once the model reports that the board is static or periodic.
 
     __exit():
         terminates the game and the program.
@@ -47,6 +56,9 @@ class Controller(IController):
     __advance():
         Used to update the model and view by a single state progression.
 
+    __fast_forward(generations):
+        Used to update the model by several state progressions at once and redraw the view.
+
     __toggle_cell_clicked(event):
         Toggles the state of the clicked cell.
         event: Coordinates of the mouse click
@@ -54,15 +66,18 @@ class Controller(IController):
     __reset_game():
         Clears all living cells from the model and from the view
 
+    __record(born, died):
+        Adds a change of the board to the history.
+
+    __record_changes():
+        Adds the changes the model reports for its last update to the history.
+
     __generate_structure(struct_name):
         Clears all living cells and spawns a specified structure in the center of the game board.
 
     __add_structure(struct_name):
         Adds the current model pattern to the structure library (resources.txt file)
 
-    __empty_game():
-        Determines if the model has at least one living cell. Returns True is there are no living cells.
-
     __delete_structures(structs):
         Deletes structures from library based on the specified names.
 
@@ -88,6 +103,7 @@ class Controller(IController):
         self.__model = model
         self.__speed = 500
         self.__play = False
+        self.__history = None
         self.__struct_adder = None
         self.__struct_manager = None
         self.__file_path = file_path
@@ -110,10 +126,16 @@ class Controller(IController):
             self.__exit_game()
         elif command == 'next':
             self.__advance()
+        elif command == 'fast forward':
+            self.__fast_forward(event)
         elif command == 'toggle cell':
             self.__toggle_cell_clicked(event)
         elif command == 'reset':
             self.__reset_game()
+        elif command == 'undo':
+            self.undo()
+        elif command == 'redo':
+            self.redo()
         elif command == 'set speed':
             self.__speed = event
         elif command == 'change view mode':
@@ -139,12 +161,57 @@ class Controller(IController):
             raise ValueError('Invalid Command')
         self.__view.update()
 
+    def undo(self):
+        """
+        Reverts the most recent change of the board: the cells it brought to life are killed and the cells it
+        killed are revived, so the cost depends on the size of the change and not on the size of the board.
+        Stops the automatic progression of the game.
+        """
+        self.__stop()
+        change = self.__history.undo() if self.__history is not None else None
+        if change is None:
+            return
+        born, died = change
+        self.__model.set_cells(born, False)
+        self.__model.set_cells(died, True)
+        self.__view.update()
+
+    def redo(self):
+        """
+        Applies the most recently undone change of the board again. Stops the automatic progression of the game.
+        """
+        self.__stop()
+        change = self.__history.redo() if self.__history is not None else None
+        if change is None:
+            return
+        born, died = change
+        self.__model.set_cells(died, False)
+        self.__model.set_cells(born, True)
+        self.__view.update()
+
+    def __stop(self):
+        """ Stops the automatic progression of the game without advancing it. """
+        if self.__play:
+            self.__play = False
+            self.__view.toggle_start_stop_button(self.__play)
+
     def __automatic___advance(self):
-        """ Automatically updates the state of the game after a certain amount of time passed."""
+        """
+        Automatically updates the state of the game after a certain amount of time passed.
+        Playing stops when the model detects that the board repeats itself, or when every cell died (for models
+        without cycle detection), since nothing new would be shown.
+        """
         if self.__play:
             self.__advance()
         else:
             return
+        cycle = self.__model.get_cycle()
+        if cycle is not None or self.__model.population() == 0:
+            self.__play = False
+            self.__view.toggle_start_stop_button(self.__play)
+            if cycle is not None:
+                self.__view.show_cycle(cycle)
+            return
         self.__view.after(self.__speed, self.__automatic___advance)
 
     def __exit_game(self):
@@ -161,7 +228,11 @@ class Controller(IController):
         """
         self.__play = not self.__play
         if self.__play:
+            self.__view.show_cycle(None)
             self.__automatic___advance()
+            if not self.__play:
+                # playing already stopped on a cycle, which switched the button back
+                return
         else:
             self.__advance()
         self.__view.toggle_start_stop_button(self.__play)
@@ -169,6 +240,18 @@ class Controller(IController):
     def __advance(self):
         """ Method which updates the model and redraws the view. Used to progress the game. """
         self.__model.update_state()
+        self.__record_changes()
+        self.__view.update()
+
+    def __fast_forward(self, generations: int):
+        """
+        Updates the model by several generations in a single call and redraws the view.
+        :param generations: number of generations to skip
+        """
+        if generations is None:
+            raise ValueError('Generation Count Cannot Be Null')
+        self.__model.step(generations)
+        self.__record_changes()
         self.__view.update()
 
     def __toggle_cell_clicked(self, event: tkinter.Event):
@@ -185,6 +268,10 @@ class Controller(IController):
         if x < 0 or y < 0 or x + 1 > self.__model.get_width() or y + 1 > self.__model.get_height():
             return
         self.__model.toggle_cell(x, y)
+        if self.__model.get_grid_view()[y][x]:
+            self.__record([(x, y)], [])
+        else:
+            self.__record([], [(x, y)])
         self.__view.update()
 
     def __reset_game(self):
@@ -194,16 +281,34 @@ class Controller(IController):
         """
         if self.__play:
             self.__toggle_play()
-        grid = self.__model.get_grid()
-        outer_idx = 0
-        inner_idx = 0
-        while outer_idx < self.__model.get_height():
-            while inner_idx < self.__model.get_width():
-                if grid[outer_idx][inner_idx]:
-                    self.__model.toggle_cell(inner_idx, outer_idx)
-                inner_idx += 1
-            outer_idx += 1
-            inner_idx = 0
+        died = self.__model.live_cells()
+        self.__model.clear()
+        self.__record([], died)
+
+    def __record(self, born: [(int, int)], died: [(int, int)]):
+        """
+        Adds a change of the board to the history.
+        :param born: coordinates of the cells that came to life
+        :param died: coordinates of the cells that died
+        """
+        if not born and not died:
+            return
+        if self.__history is None:
+            self.__history = History(self.__model.get_width())
+            # the model only records the cells it flips once there is a history to add them to
+            self.__model.track_changes(True)
+        self.__history.record(born, died)
+
+    def __record_changes(self):
+        """
+        Adds the changes of the last update of the model to the history. Models which do not report their changes
+        cannot be undone across an update, so the history is forgotten instead.
+        """
+        changes = self.__model.get_changes()
+        if changes is not None:
+            self.__record(*changes)
+        elif self.__history is not None:
+            self.__history.clear()
 
     def __generate_structure(self, struct_name: str):
         """
@@ -221,13 +326,16 @@ class Controller(IController):
             messagebox.showerror(title='Error Generating Structure',
                                  message="Structure is too large for this game!")
             return
-        self.__reset_game()
+        if self.__play:
+            self.__toggle_play()
+        died = self.__model.live_cells()
+        self.__model.clear()
         coordinates = u.get_struct_coordinates(struct_name)
         x_offset = self.__model.get_width() // 2 - dimensions[0]//2
         y_offset = self.__model.get_height() // 2 - dimensions[1]//2
-
-        for i in coordinates:
-            self.__model.toggle_cell(i[0] + x_offset, i[1] + y_offset)
+        self.__model.stamp(coordinates, x_offset, y_offset)
+        # clearing the board and placing the structure are undone together
+        self.__record(list(set((c[0] + x_offset, c[1] + y_offset) for c in coordinates)), died)
         self.__view.update()
 
     def __add_structure(self, struct_name: str):
@@ -241,7 +349,9 @@ class Controller(IController):
         if struct_name == "" or struct_name is None:
             messagebox.showerror(title='Error Adding Structure', message="Structure needs a name!")
             return
-        if self.__empty_game():
+        # the top left corner of the living cells becomes the origin of the structure
+        cells = self.__model.live_cells()
+        if not cells:
             messagebox.showerror(title='Error Adding Structure', message="No structure found!")
             return
         r = GameUtils(self.__file_path)
@@ -250,57 +360,15 @@ class Controller(IController):
             messagebox.showerror(title='Error Adding Structure', message="Name already taken!")
             return
 
-        grid = self.__model.get_grid()
-        first_x = self.__model.get_width()
-        first_y = self.__model.get_height()
-
-        # getting x offset
-        for i in grid:
-            idx = 0
-            for j in i:
-                if j is True:
-                    if idx < first_x:
-                        first_x = min(first_x, idx)
-                idx += 1
-
-        # getting y offset
-        idx = 0
-        for i in grid:
-            if True in i:
-                first_y = idx
-                break
-            idx += 1
-
-        raw_coordinates = []
-        idx_x = 0
-        idx_y = 0
-        while idx_y < len(grid):
-            while idx_x < len(grid[idx_y]):
-                if grid[idx_y][idx_x]:
-                    raw_coordinates.append((idx_x, idx_y))
-                idx_x += 1
-            idx_x = 0
-            idx_y += 1
-
-        result_coordinates = []
-        for c in raw_coordinates:
-            result_coordinates.append((c[0] - first_x, c[1] - first_y))
+        first_x = min(x for (x, y) in cells)
+        first_y = min(y for (x, y) in cells)
+        result_coordinates = [(x - first_x, y - first_y) for (x, y) in cells]
 
         r.add_structure(struct_name, result_coordinates)
         self.__struct_adder.destroy()
         self.__view.update_struct_options(self)
         messagebox.showinfo(title='Success', message="Structure Added.")
 
-    def __empty_game(self) -> bool:
-        """
-        Determines if the game is empty.
-        :return: True if the model does not have living cells. False is the model has at least one living cell.
-        """
-        result = True
-        for i in self.__model.get_grid():
-            result = result and (True not in i)
-        return result
-
     def __delete_structures(self, structs: [str]):
         """
         Removes existing patterns from the library (resources.txt file) based on the provided list of names.
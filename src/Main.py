@@ -1,42 +1,57 @@
 import sys
 from Controller.Controller import Controller
 from Model.GameOfLifeModel import GameOfLifeModel
+from Model.UnboundedGameOfLifeModel import UnboundedGameOfLifeModel
 from View.GameOfLifeView import GameOfLifeView
 
 
 def main():
     """
     Main method through which the Game of Life is initiated.
-    Command line arguments can contain the desired height and width of the game (in cells).
-    In the absence of commandline arguments, width and height are set to default values of 30 and 50 cells.
+    Command line arguments can contain the desired height and width of the game (in cells) and its topology
+    ('bounded', 'torus' or 'unbounded') and rule (in B/S notation, e.g. 'B36/S23').
+    In the absence of commandline arguments, width and height are set to default values of 30 and 50 cells,
+    the grid is bounded and the rule is Conway's B3/S23.
     """
     args = sys.argv
     game_height = extract_argument(args, '-height')
     game_width = extract_argument(args, '-width')
+    topology = extract_argument(args, '-topology', str)
+    rule = extract_argument(args, '-rule', str)
 
     # setting default values for game height and width in case they are not provided
     if game_width is None:
         game_width = 50
     if game_height is None:
         game_height = 30
+    if topology is None:
+        topology = 'bounded'
+    if rule is None:
+        rule = 'B3/S23'
 
     # initiating the game
-    m = GameOfLifeModel(game_width, game_height)
+    # the recent states are hashed so that playing stops on static and periodic boards; the detector derives
+    # the keys of the cells on demand, so it adds nothing to the start-up time of large boards
+    if topology == 'unbounded':
+        m = UnboundedGameOfLifeModel(game_width, game_height, rule=rule, cycle_history=64)
+    else:
+        m = GameOfLifeModel(game_width, game_height, topology, rule, cycle_history=64)
     v = GameOfLifeView(m)
     c = Controller(m, v)
     c.execute()
 
-def extract_argument(args: [str], key: str):
+def extract_argument(args: [str], key: str, convert=int):
     """
     Searches through a list of arguments and identifies the value of a parameter with the provided key.
     :param args: list of string arguments through which to parse
     :param key: the string which indicates the parameter that needs to be identified
+    :param convert: function used to convert the string value of the parameter
     :return: the value of the parameter if present; None if parameter is not present
     """
     i = 0
     while i < len(args) - 1:
         if args[i] == key:
-            return int(args[i + 1])
+            return convert(args[i + 1])
         else:
             i += 1
     return None
@@ -0,0 +1,444 @@
+import numpy as np
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.NumpyGameOfLifeModel import cell_indices
+from Model.Rule import Rule, ONE as ALWAYS, ONES, NOT_ONES, ZERO
+
+ONE = np.uint64(1)
+HIGH_BIT = np.uint64(63)
+WORD_BITS = 64
+# largest number of words in a band of rows; the scratch buffers of the adder network hold one band, so their memory
+# does not grow with the board, and a band of this size still fits in the cache
+BAND_WORDS = 4096
+# number of set bits of every byte value, used to count the living cells of the packed words
+BYTE_COUNTS = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def shift_west(rows: np.ndarray, out: np.ndarray, carry: np.ndarray) -> np.ndarray:
+    """
+    Moves every cell one column to the right so that bit x holds the state of cell x - 1.
+    :param rows: 2d array of packed uint64 words
+    :param out: array of the same shape as rows which receives the west neighbours
+    :param carry: scratch array of the same shape as rows
+    :return: out
+    """
+    np.left_shift(rows, ONE, out=out)
+    np.right_shift(rows[:, :-1], HIGH_BIT, out=carry[:, 1:])
+    np.bitwise_or(out[:, 1:], carry[:, 1:], out=out[:, 1:])
+    return out
+
+
+def shift_east(rows: np.ndarray, out: np.ndarray, carry: np.ndarray) -> np.ndarray:
+    """
+    Moves every cell one column to the left so that bit x holds the state of cell x + 1.
+    :param rows: 2d array of packed uint64 words
+    :param out: array of the same shape as rows which receives the east neighbours
+    :param carry: scratch array of the same shape as rows
+    :return: out
+    """
+    np.right_shift(rows, ONE, out=out)
+    np.left_shift(rows[:, 1:], HIGH_BIT, out=carry[:, :-1])
+    np.bitwise_or(out[:, :-1], carry[:, :-1], out=out[:, :-1])
+    return out
+
+
+def full_adder(a: np.ndarray, b: np.ndarray, c: np.ndarray, twos: np.ndarray, partial: np.ndarray) -> np.ndarray:
+    """
+    Adds three bit planes in place. The sum bits are written into a and the carry bits into twos.
+    :param partial: scratch array of the same shape as the planes
+    :return: a
+    """
+    np.bitwise_xor(a, b, out=partial)
+    np.bitwise_and(a, b, out=twos)
+    np.bitwise_xor(partial, c, out=a)
+    np.bitwise_and(partial, c, out=partial)
+    np.bitwise_or(twos, partial, out=twos)
+    return a
+
+
+def pair_count_equals(pairs: int, s0: np.ndarray, s1: np.ndarray, s2: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Selects the cells whose four weight-2 carries add up to pairs.
+    :param pairs: number of set carries (0 to 4)
+    :param s0, s1, s2: bit planes of the binary sum of the carries (s2 is only set when all four are)
+    :param out: array receiving the selection unless it is one of the sum planes itself
+    :return: plane with the bits of the matching cells set
+    """
+    if pairs == 4:
+        return s2
+    if pairs == 0:
+        np.bitwise_or(s0, s1, out=out)
+        np.bitwise_or(out, s2, out=out)
+        return np.invert(out, out=out)
+    if pairs == 1:
+        np.invert(s1, out=out)
+        return np.bitwise_and(out, s0, out=out)
+    if pairs == 2:
+        np.invert(s0, out=out)
+        return np.bitwise_and(out, s1, out=out)
+    return np.bitwise_and(s0, s1, out=out)
+
+
+def rule_term(dead: int, live: int, alive: np.ndarray, ones: np.ndarray, not_ones: np.ndarray,
+              out: np.ndarray) -> np.ndarray:
+    """
+    Evaluates one entry of the bit-sliced plan of a rule (see Rule.get_bitsliced_plan).
+    :param dead: function of the ones bit (ZERO, ONE, ONES or NOT_ONES) giving the next state of dead cells
+    :param live: function of the ones bit giving the next state of living cells
+    :param alive: plane of the living cells
+    :param ones: plane of the weight-1 bit of the neighbour count
+    :param not_ones: complement of ones (only read when a function is NOT_ONES)
+    :param out: array receiving the result unless an input plane already is the result
+    :return: plane of the next states, ignoring the pair count
+    """
+    planes = {ONES: ones, NOT_ONES: not_ones}
+    if dead == live:
+        if dead == ALWAYS:
+            out.fill(np.iinfo(np.uint64).max)
+            return out
+        return planes[dead]
+    if dead == ZERO:
+        if live == ALWAYS:
+            return alive
+        return np.bitwise_and(planes[live], alive, out=out)
+    if live == ZERO:
+        np.invert(alive, out=out)
+        if dead == ALWAYS:
+            return out
+        return np.bitwise_and(out, planes[dead], out=out)
+    if live == ALWAYS:
+        return np.bitwise_or(planes[dead], alive, out=out)
+    if dead == ALWAYS:
+        np.invert(alive, out=out)
+        return np.bitwise_or(out, planes[live], out=out)
+    # one function is the complement of the other
+    np.bitwise_xor(ones, alive, out=out)
+    if dead == NOT_ONES:
+        np.invert(out, out=out)
+    return out
+
+
+class BitboardGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model on a bit-packed board.
+    Every row is stored as consecutive uint64 words (cell x lives in bit x % 64 of word x // 64) and the next
+    generation is computed 64 cells at a time with bit-sliced full adders over the eight neighbour planes.
+    On a bounded board cells outside the board are dead (same edge rule as GameOfLifeModel); on a torus the padding
+    rows are refilled from the opposite edges and the first and last cell of every row are carried into each
+    other's horizontal shifts.
+    The adder network leaves the neighbour count as a ones bit plus four weight-2 carries; the rule is compiled
+    once into a plan over the sum of the carries (see Rule.get_bitsliced_plan), so any B/S rule is evaluated with
+    the same word-parallel operations as B3/S23.
+    The network runs over bands of rows from the top of the board down and every band is written back in place, so
+    the scratch buffers only hold one band: the board stays close to one bit per cell whatever its size.
+
+    Parameters
+    ----------
+    __words: (height + 2) x word_count array of uint64; the first and last rows are the padding rows
+    __mask: per word mask of the bits that belong to the board
+    __band: number of rows in a band
+    __inputs: preallocated (band + 2) x word_count copy of the rows of a band and of the rows around it; the first
+        row still holds the row above the band after that row was overwritten with its next generation
+    __west, __east, __carry: preallocated (band + 2) x word_count buffers for the horizontal neighbours
+    __planes: preallocated band x word_count buffers for the adder network
+    __width: width of the game grid (in cells)
+    __height: height of the game grid (in cells)
+    __topology: 'bounded' or 'torus'
+    __rule: the rule of the game
+    __plan: bit-sliced plan of the rule
+    __complement: whether the plan reads the complement of the ones bit
+
+    Methods
+    -------
+    __init__(width, height, topology, rule):
+        Constructor which initializes the BitboardGameOfLifeModel Object with a specified grid width, height,
+        topology and rule
+
+    toggle_cell(x, y):
+        switches the status of the specified cell
+
+    update_state():
+        updates the state of the game based on the Game of Life Rules
+
+    step(n):
+        updates the state of the game n times reusing the preallocated buffers
+
+    __advance_band(block, out):
+        computes the next generation of the rows of a band
+
+    get_width():
+        returns width of game grid
+
+    get_height():
+        returns height of the game grid
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the game grid
+
+    get_grid_view():
+        returns a read-only array of the cells unpacked from the words
+
+    population():
+        returns the number of living cells counted over the packed words
+
+    bounding_box():
+        returns the bounding box of the living cells found from the non-zero words
+
+    __unpack():
+        unpacks the words into an array of cells
+
+    clear():
+        kills every cell of the grid with a single write
+
+    set_cells(coordinates, value):
+        sets the state of several cells with a single vectorized write
+
+    stamp(pattern, x, y):
+        brings the cells of a pattern to life at the given offset
+
+    get_topology():
+        returns the name of the topology of the grid
+
+    get_rule():
+        returns the rulestring of the game
+    """
+
+    def __init__(self, width: int, height: int, topology: str = 'bounded', rule: str = 'B3/S23'):
+        """
+        Initializes the BitboardGameOfLifeModel Object
+        :param width: width of the game grid
+        :param height: height of the game grid
+        :param topology: 'bounded' for a grid surrounded by dead cells or 'torus' for a grid whose edges wrap around
+        :param rule: rulestring in B/S notation
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        if topology not in ('bounded', 'torus'):
+            raise ValueError('Invalid Topology!')
+        self.__width = width
+        self.__height = height
+        self.__topology = topology
+        self.__rule = Rule(rule)
+        self.__plan = self.__rule.get_bitsliced_plan()
+        self.__complement = any(NOT_ONES in (dead, live) for (pairs, dead, live) in self.__plan)
+        word_count = (width + WORD_BITS - 1) // WORD_BITS
+        self.__words = np.zeros((height + 2, word_count), dtype=np.uint64)
+        self.__mask = np.full(word_count, np.iinfo(np.uint64).max, dtype=np.uint64)
+        if width % WORD_BITS:
+            self.__mask[-1] = np.uint64((1 << (width % WORD_BITS)) - 1)
+        # boards smaller than a band are still cut in two, which halves their scratch buffers
+        band = max(1, min((height + 1) // 2, BAND_WORDS // word_count))
+        self.__band = band
+        self.__inputs = np.zeros((band + 2, word_count), dtype=np.uint64)
+        self.__west = np.zeros((band + 2, word_count), dtype=np.uint64)
+        self.__east = np.zeros((band + 2, word_count), dtype=np.uint64)
+        self.__carry = np.zeros((band + 2, word_count), dtype=np.uint64)
+        self.__planes = [np.zeros((band, word_count), dtype=np.uint64) for i in range(8)]
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.__words[y + 1, x // WORD_BITS] ^= ONE << np.uint64(x % WORD_BITS)
+
+    def clear(self):
+        """ Kills every cell of the grid. """
+        self.__words.fill(0)
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells with one unbuffered bitwise write, so that cells sharing a word all
+        apply. All coordinates are validated first.
+        :param coordinates: list (or n x 2 array) of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        ys, xs = cell_indices(coordinates, self.__width, self.__height)
+        bits = np.left_shift(ONE, (xs % WORD_BITS).astype(np.uint64))
+        words = (ys + 1, xs // WORD_BITS)
+        if value:
+            np.bitwise_or.at(self.__words, words, bits)
+        else:
+            np.bitwise_and.at(self.__words, words, np.invert(bits))
+
+    def stamp(self, pattern: [(int, int)], x: int, y: int):
+        """
+        Brings the cells of a pattern to life; cells outside the pattern keep their state.
+        :param pattern: list of (x, y) coordinates of the living cells of the pattern (as in the structure library)
+        :param x: x coordinate of the top left corner of the pattern in the grid
+        :param y: y coordinate of the top left corner of the pattern in the grid
+        """
+        if x is None or y is None:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.set_cells(np.asarray(pattern, dtype=np.int64).reshape(-1, 2) + (x, y), True)
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        self.step(1)
+
+    def step(self, n: int):
+        """
+        Updates the state of the game n times. Every generation is computed band by band in preallocated buffers.
+        :param n: number of generations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        h = self.__height
+        band = self.__band
+        rows = self.__words
+        inputs = self.__inputs
+        torus = self.__topology == 'torus'
+        for i in range(n):
+            if torus:
+                rows[0] = rows[h]
+                rows[h + 1] = rows[1]
+            np.copyto(inputs[0], rows[0])
+            for top in range(0, h, band):
+                count = min(band, h - top)
+                block = inputs[:count + 2]
+                np.copyto(block[1:], rows[top + 1:top + count + 2])
+                self.__advance_band(block, rows[top + 1:top + count + 1])
+                # the last row of the band was overwritten, but it is the row above the next band
+                np.copyto(inputs[0], block[count])
+
+    def __advance_band(self, block: np.ndarray, out: np.ndarray):
+        """
+        Computes the next generation of the rows of a band with the adder network.
+        :param block: the rows of the band with the row above and the row below it
+        :param out: array receiving the next generation of the rows of the band
+        """
+        h = len(block) - 2
+        rows = block
+        alive = rows[1:h + 1]
+        west = self.__west[:h + 2]
+        east = self.__east[:h + 2]
+        carry = self.__carry[:h + 2]
+        up, up_twos, down, down_twos, mid_twos, ones_twos, tmp, not_ones = [p[:h] for p in self.__planes]
+        plan = self.__plan
+        shift_west(rows, west, carry)
+        shift_east(rows, east, carry)
+        if self.__topology == 'torus':
+            # the last cell of a row is the west neighbour of the first one and vice versa
+            last_bit = np.uint64((self.__width - 1) % WORD_BITS)
+            wrapped = carry[:, 0]
+            np.right_shift(rows[:, -1], last_bit, out=wrapped)
+            np.bitwise_and(wrapped, ONE, out=wrapped)
+            np.bitwise_or(west[:, 0], wrapped, out=west[:, 0])
+            np.bitwise_and(rows[:, 0], ONE, out=wrapped)
+            np.left_shift(wrapped, last_bit, out=wrapped)
+            np.bitwise_or(east[:, -1], wrapped, out=east[:, -1])
+
+        # row above and row below: three inputs each, reduced with a full adder
+        np.copyto(up, west[0:h])
+        full_adder(up, rows[0:h], east[0:h], up_twos, tmp)
+        np.copyto(down, west[2:h + 2])
+        full_adder(down, rows[2:h + 2], east[2:h + 2], down_twos, tmp)
+        # own row: two inputs, reduced with a half adder (the sum goes into the west buffer)
+        mid = west[1:h + 1]
+        np.bitwise_and(mid, east[1:h + 1], out=mid_twos)
+        np.bitwise_xor(mid, east[1:h + 1], out=mid)
+        ones = full_adder(up, down, mid, ones_twos, tmp)
+
+        # sum of the four weight-2 carries as the bits s0, s1 and s2
+        s0, s1, s2 = mid_twos, down_twos, down
+        full_adder(up_twos, down_twos, mid_twos, down, tmp)
+        np.bitwise_and(up_twos, ones_twos, out=tmp)
+        np.bitwise_xor(up_twos, ones_twos, out=s0)
+        np.bitwise_xor(down, tmp, out=s1)
+        np.bitwise_and(down, tmp, out=s2)
+
+        # evaluate the plan of the rule; the result is collected in ones_twos
+        if self.__complement:
+            np.invert(ones, out=not_ones)
+        result = ones_twos
+        selected, term = up_twos, tmp
+        for index, (pairs, dead, live) in enumerate(plan):
+            matches = pair_count_equals(pairs, s0, s1, s2, selected)
+            states = rule_term(dead, live, alive, ones, not_ones, term)
+            if index == 0:
+                np.bitwise_and(matches, states, out=result)
+            else:
+                np.bitwise_and(matches, states, out=term)
+                np.bitwise_or(result, term, out=result)
+        if not plan:
+            result.fill(0)
+        np.bitwise_and(result, self.__mask, out=out)
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the grid
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the grid
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual grid
+        :return: copy of the array as a list of list of booleans
+        """
+        return self.__unpack().astype(bool).tolist()
+
+    def get_grid_view(self) -> np.ndarray:
+        """
+        The bits of the words cannot be addressed as an array, so the view is unpacked when it is requested and does
+        not follow later changes; it still costs one byte per cell instead of a list of lists.
+        :return: read-only height x width array of uint8 cells (1 alive, 0 dead)
+        """
+        cells = self.__unpack()
+        cells.flags.writeable = False
+        return cells
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (a popcount over the bytes of the packed words)
+        """
+        packed = self.__words[1:self.__height + 1].view(np.uint8)
+        return int(BYTE_COUNTS[packed].sum(dtype=np.int64))
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        The rows are found from the words that are not zero and the columns from the lowest and the highest bit of
+        the words of all rows ORed together, so the board is never unpacked.
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        words = self.__words[1:self.__height + 1]
+        rows = np.flatnonzero(words.any(axis=1))
+        if len(rows) == 0:
+            return None
+        columns = np.bitwise_or.reduce(words[rows[0]:rows[-1] + 1], axis=0)
+        used = np.flatnonzero(columns)
+        first = int(columns[used[0]])
+        last = int(columns[used[-1]])
+        return (int(used[0]) * WORD_BITS + (first & -first).bit_length() - 1, int(rows[0]),
+                int(used[-1]) * WORD_BITS + last.bit_length() - 1, int(rows[-1]))
+
+    def __unpack(self) -> np.ndarray:
+        """
+        :return: height x width array of uint8 cells (1 alive, 0 dead) unpacked from the words
+        """
+        packed = self.__words[1:self.__height + 1].astype('<u8').view(np.uint8)
+        return np.unpackbits(packed, axis=1, bitorder='little')[:, :self.__width]
+
+    def get_topology(self) -> str:
+        """
+        :return: 'bounded' or 'torus'
+        """
+        return self.__topology
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
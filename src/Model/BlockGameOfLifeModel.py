@@ -0,0 +1,267 @@
+from Model.BlockGridView import BlockGridView
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.Rule import Rule
+
+# next state tables already built, by rulestring
+BLOCK_TABLES = {}
+
+
+def column_table(offset: int) -> [int]:
+    """
+    Blocks are 2x2 cells stored as a 4 bit nibble (bit 2 * y + x for the cell (x, y) of the block). The 4x4
+    neighbourhood of a block is indexed by a 16 bit integer (bit 4 * y + x) and is assembled from three columns
+    of blocks, each described by a 12 bit key (block above | block << 4 | block below << 8).
+    :param offset: position of the column relative to the evaluated block (-1 left, 0 centre, 1 right)
+    :return: 4096 entry table mapping a column key to its cells inside the 4x4 neighbourhood
+    """
+    table = []
+    for key in range(4096):
+        bits = 0
+        for row in range(3):
+            nibble = (key >> (4 * row)) & 15
+            for cell in range(4):
+                if nibble >> cell & 1:
+                    x = 1 + 2 * offset + (cell & 1)
+                    y = 2 * row - 1 + (cell >> 1)
+                    if 0 <= x < 4 and 0 <= y < 4:
+                        bits |= 1 << (4 * y + x)
+        table.append(bits)
+    return table
+
+
+LEFT = column_table(-1)
+CENTRE = column_table(0)
+RIGHT = column_table(1)
+
+
+def block_table(rule: Rule) -> [int]:
+    """
+    Builds (or returns the cached) table of the next state of the centre of every 4x4 neighbourhood.
+    :param rule: the rule of the game
+    :return: 65536 entry table mapping a 4x4 neighbourhood to the nibble of its centre block one generation later
+    """
+    key = str(rule)
+    if key in BLOCK_TABLES:
+        return BLOCK_TABLES[key]
+    states = rule.get_table()
+    cells = []
+    for (x, y) in [(1, 1), (2, 1), (1, 2), (2, 2)]:
+        mask = 0
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if dx or dy:
+                    mask |= 1 << (4 * (y + dy) + x + dx)
+        cells.append((1 << (2 * (y - 1) + x - 1), 4 * y + x, mask))
+    table = []
+    for index in range(65536):
+        nibble = 0
+        for (bit, position, mask) in cells:
+            if states[9 * (index >> position & 1) + (index & mask).bit_count()]:
+                nibble |= bit
+        table.append(nibble)
+    BLOCK_TABLES[key] = table
+    return table
+
+
+class BlockGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model in pure Python with a precomputed block transition table.
+    The grid is stored as 2x2 blocks of cells packed into nibbles. The 4x4 neighbourhood of every block is
+    assembled from three column lookups and mapped to the next state of the block by a single lookup into a
+    65536 entry table built once per rule, so four cells are advanced per table lookup instead of counting
+    the neighbours of every cell.
+    Cells outside the board are always dead (same edge rule as GameOfLifeModel).
+
+    Parameters
+    ----------
+    __rows: list of block rows; every row and the list itself are padded with an empty block on both ends (the
+        list is updated in place, so that grid views follow it)
+    __view: read-only view of the cells handed out by get_grid_view
+    __table: block transition table of the rule
+    __column_mask: mask of the cells of the last block column which belong to the board
+    __row_mask: mask of the cells of the last block row which belong to the board
+    __width: width of the game grid (in cells)
+    __height: height of the game grid (in cells)
+    __rule: the rule of the game
+
+    Methods
+    -------
+    __init__(width, height, rule):
+        Constructor which initializes the BlockGameOfLifeModel Object with a specified grid width and height
+
+    toggle_cell(x, y):
+        switches the status of the specified cell
+
+    clear():
+        kills every cell of the grid
+
+    set_cells(coordinates, value):
+        sets the state of several cells by writing their bits into the blocks
+
+    update_state():
+        updates the state of the game based on the rule of the game
+
+    get_width():
+        returns width of game grid
+
+    get_height():
+        returns height of the game grid
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the game grid
+
+    get_grid_view():
+        returns a read-only view of the cells that reads the blocks directly
+
+    population():
+        returns the number of living cells counted over the blocks
+
+    bounding_box():
+        returns the bounding box of the living cells found from the non-empty blocks
+
+    get_rule():
+        returns the rulestring of the game
+    """
+
+    def __init__(self, width: int, height: int, rule: str = 'B3/S23'):
+        """
+        Initializes the BlockGameOfLifeModel Object
+        :param width: width of the game grid
+        :param height: height of the game grid
+        :param rule: rulestring in B/S notation
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        self.__width = width
+        self.__height = height
+        self.__rule = Rule(rule)
+        self.__table = block_table(self.__rule)
+        # on an odd sized board the right column or the bottom row of the last blocks lies outside the board
+        self.__column_mask = 0b0101 if width % 2 else 0b1111
+        self.__row_mask = 0b0011 if height % 2 else 0b1111
+        self.__rows = [[0] * ((width + 1) // 2 + 2) for i in range((height + 1) // 2 + 2)]
+        self.__view = BlockGridView(self.__rows, width, height)
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.__rows[y // 2 + 1][x // 2 + 1] ^= 1 << (2 * (y & 1) + (x & 1))
+
+    def clear(self):
+        """ Kills every cell of the grid by replacing the block rows with empty ones. """
+        self.__rows[:] = [[0] * len(self.__rows[0]) for i in range(len(self.__rows))]
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells at once by setting or clearing their bits in the blocks, without reading
+        the grid. All coordinates are validated before any cell is changed.
+        :param coordinates: list of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        width = self.__width
+        height = self.__height
+        for (x, y) in coordinates:
+            if x is None or y is None or x < 0 or y < 0 or x >= width or y >= height:
+                raise ValueError('Invalid Cell Coordinates!')
+        rows = self.__rows
+        for (x, y) in coordinates:
+            bit = 1 << (2 * (y & 1) + (x & 1))
+            if value:
+                rows[y // 2 + 1][x // 2 + 1] |= bit
+            else:
+                rows[y // 2 + 1][x // 2 + 1] &= ~bit
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        table = self.__table
+        left = LEFT
+        centre = CENTRE
+        right = RIGHT
+        rows = self.__rows
+        updated = []
+        for r in range(1, len(rows) - 1):
+            keys = [a | b << 4 | c << 8 for a, b, c in zip(rows[r - 1], rows[r], rows[r + 1])]
+            row = [0]
+            row += [table[left[a] | centre[b] | right[c]] for a, b, c in zip(keys, keys[1:], keys[2:])]
+            row.append(0)
+            row[-2] &= self.__column_mask
+            updated.append(row)
+        if self.__row_mask != 0b1111:
+            updated[-1] = [block & self.__row_mask for block in updated[-1]]
+        rows[1:-1] = updated
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the grid
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the grid
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual grid
+        :return: copy of the array as a list of list of booleans
+        """
+        grid = []
+        for y in range(self.__height):
+            row = self.__rows[y // 2 + 1]
+            shift = 2 * (y & 1)
+            grid.append([row[x // 2 + 1] >> (shift + (x & 1)) & 1 == 1 for x in range(self.__width)])
+        return grid
+
+    def get_grid_view(self) -> BlockGridView:
+        """
+        The view reads the blocks directly: it is not copied and reflects every later change.
+        :return: read-only view of the grid, indexed like the grid (view[y][x] is 1 for a living cell, 0 for a dead one)
+        """
+        return self.__view
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (the set bits of the blocks)
+        """
+        return sum(sum(map(int.bit_count, row)) for row in self.__rows)
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        Only the blocks are visited: the rows and columns of the box are found from the non-empty blocks and the
+        cell inside the outermost blocks from their bits.
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        used = [r for r, row in enumerate(self.__rows) if any(row)]
+        if not used:
+            return None
+        top = self.__rows[used[0]]
+        bottom = self.__rows[used[-1]]
+        columns = [0] * len(top)
+        for row in self.__rows[used[0]:used[-1] + 1]:
+            columns = [a | b for a, b in zip(columns, row)]
+        filled = [c for c, blocks in enumerate(columns) if blocks]
+        left = columns[filled[0]]
+        right = columns[filled[-1]]
+        # bits 0 and 2 hold the left column of a block, bits 0 and 1 its upper row
+        return (2 * (filled[0] - 1) + (0 if left & 0b0101 else 1),
+                2 * (used[0] - 1) + (0 if any(block & 0b0011 for block in top) else 1),
+                2 * (filled[-1] - 1) + (1 if right & 0b1010 else 0),
+                2 * (used[-1] - 1) + (1 if any(block & 0b1100 for block in bottom) else 0))
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
@@ -0,0 +1,138 @@
+class BlockRowView:
+    """
+    A class providing read-only access to a row of cells of a block grid without unpacking it.
+
+    Parameters
+    ----------
+    __blocks: the block row holding the cells (padded with an empty block on both ends)
+    __shift: position of the bits of the row inside the blocks (0 for the upper, 2 for the lower row of a block)
+    __width: number of cells in the row
+
+    Methods
+    -------
+    __init__(blocks, shift, width):
+        wraps the cells of a block row
+
+    __len__():
+        returns the number of cells in the row
+
+    __getitem__(x):
+        returns the state of a cell (or a list of states for a slice)
+
+    __iter__():
+        iterates over the states of the cells
+
+    __contains__(state):
+        checks whether a cell of the row has the state
+    """
+
+    __slots__ = ('__blocks', '__shift', '__width')
+
+    def __init__(self, blocks: [int], shift: int, width: int):
+        """
+        :param blocks: the block row holding the cells (read through, never modified)
+        :param shift: 0 for the upper and 2 for the lower row of cells of the blocks
+        :param width: number of cells in the row
+        """
+        self.__blocks = blocks
+        self.__shift = shift
+        self.__width = width
+
+    def __len__(self) -> int:
+        """
+        :return: the number of cells in the row
+        """
+        return self.__width
+
+    def __getitem__(self, x):
+        """
+        :param x: index of a cell or a slice
+        :return: state of the cell (1 alive, 0 dead); for a slice a new list of states
+        """
+        if isinstance(x, slice):
+            return [self[i] for i in range(*x.indices(self.__width))]
+        if x < 0:
+            x += self.__width
+        if x < 0 or x >= self.__width:
+            raise IndexError('Invalid Cell Coordinates!')
+        return self.__blocks[x // 2 + 1] >> (self.__shift + (x & 1)) & 1
+
+    def __iter__(self):
+        """
+        :return: iterator over the states of the cells
+        """
+        blocks = self.__blocks
+        shift = self.__shift
+        return (blocks[x // 2 + 1] >> (shift + (x & 1)) & 1 for x in range(self.__width))
+
+    def __contains__(self, state) -> bool:
+        """
+        :param state: state to look for
+        :return: True if a cell of the row has the state
+        """
+        return any(cell == state for cell in self)
+
+
+class BlockGridView:
+    """
+    A class providing read-only access to the cells of a grid stored as 2x2 blocks without unpacking it.
+    The view reads the list of block rows whenever a row is requested, so it reflects every later change made
+    to the list; a row view reads the block row it was created from.
+
+    Parameters
+    ----------
+    __rows: list of block rows (padded with an empty block row on both ends)
+    __width: width of the grid (in cells)
+    __height: height of the grid (in cells)
+
+    Methods
+    -------
+    __init__(rows, width, height):
+        wraps the block rows of a grid
+
+    __len__():
+        returns the number of rows
+
+    __getitem__(y):
+        returns a read-only view of a row
+
+    __iter__():
+        iterates over read-only views of the rows
+    """
+
+    __slots__ = ('__rows', '__width', '__height')
+
+    def __init__(self, rows: [[int]], width: int, height: int):
+        """
+        :param rows: the list of block rows; rows may be replaced in it, but the list itself must be kept
+        :param width: width of the grid (in cells)
+        :param height: height of the grid (in cells)
+        """
+        self.__rows = rows
+        self.__width = width
+        self.__height = height
+
+    def __len__(self) -> int:
+        """
+        :return: the number of rows of the grid
+        """
+        return self.__height
+
+    def __getitem__(self, y):
+        """
+        :param y: index of a row or a slice
+        :return: read-only view of the row; for a slice a tuple of views
+        """
+        if isinstance(y, slice):
+            return tuple(self[i] for i in range(*y.indices(self.__height)))
+        if y < 0:
+            y += self.__height
+        if y < 0 or y >= self.__height:
+            raise IndexError('Invalid Cell Coordinates!')
+        return BlockRowView(self.__rows[y // 2 + 1], 2 * (y & 1), self.__width)
+
+    def __iter__(self):
+        """
+        :return: iterator over read-only views of the rows
+        """
+        return (self[y] for y in range(self.__height))
@@ -0,0 +1,370 @@
+import hashlib
+from collections import Counter
+import numpy as np
+from Model.Rule import Rule
+from Resources.GameUtils import GameUtils
+
+# longest period (or number of generations) a pattern is followed for when the table of known objects is built
+MAX_PERIOD = 64
+
+# objects commonly left behind by random soups of Conway's Game of Life, drawn row by row ('o' is a living cell)
+KNOWN_OBJECTS = {
+    'block': ['oo',
+              'oo'],
+    'beehive': ['.oo.',
+                'o..o',
+                '.oo.'],
+    'loaf': ['.oo.',
+             'o..o',
+             '.o.o',
+             '..o.'],
+    'boat': ['oo.',
+             'o.o',
+             '.o.'],
+    'ship': ['oo.',
+             'o.o',
+             '.oo'],
+    'tub': ['.o.',
+            'o.o',
+            '.o.'],
+    'pond': ['.oo.',
+             'o..o',
+             'o..o',
+             '.oo.'],
+    'long boat': ['oo..',
+                  'o.o.',
+                  '.o.o',
+                  '..o.'],
+    'long ship': ['oo..',
+                  'o.o.',
+                  '.o.o',
+                  '..oo'],
+    'barge': ['.o..',
+              'o.o.',
+              '.o.o',
+              '..o.'],
+    'mango': ['.oo..',
+              'o..o.',
+              '.o..o',
+              '..oo.'],
+    'snake': ['oo.o',
+              'o.oo'],
+    'aircraft carrier': ['oo..',
+                         'o..o',
+                         '..oo'],
+    'eater 1': ['oo..',
+                'o.o.',
+                '..o.',
+                '..oo'],
+    'blinker': ['ooo'],
+    'toad': ['.ooo',
+             'ooo.'],
+    'traffic light': ['..ooo..',
+                      '.......',
+                      'o.....o',
+                      'o.....o',
+                      'o.....o',
+                      '.......',
+                      '..ooo..'],
+    'beacon': ['oo..',
+               'o...',
+               '...o',
+               '..oo'],
+    'pulsar': ['..ooo...ooo..',
+               '.............',
+               'o....o.o....o',
+               'o....o.o....o',
+               'o....o.o....o',
+               '..ooo...ooo..',
+               '.............',
+               '..ooo...ooo..',
+               'o....o.o....o',
+               'o....o.o....o',
+               'o....o.o....o',
+               '.............',
+               '..ooo...ooo..'],
+    'pentadecathlon': ['..o....o..',
+                       'oo.oooo.oo',
+                       '..o....o..'],
+    'glider': ['.o.',
+               '..o',
+               'ooo'],
+    'lightweight spaceship': ['.o..o',
+                              'o....',
+                              'o...o',
+                              'oooo.'],
+}
+
+
+def label_components(cells: np.ndarray, reach: int = 1) -> (np.ndarray, int):
+    """
+    Labels the groups of living cells of a grid without visiting the cells in Python. Two living cells are in the
+    same group if a chain of living cells joins them in which consecutive cells are at most reach cells apart
+    horizontally and vertically (reach 1 gives the 8-connected groups).
+    Every living cell starts with its own row-major index as label; every pass lowers the labels to the smallest
+    label around them and then to the label of the cell they point at, until nothing changes. The pointer jumping
+    makes the number of passes grow with the logarithm of the size of the largest group instead of its diameter.
+    :param cells: 2d array of cells (non-zero alive)
+    :param reach: largest distance between two neighbouring cells of a group (positive)
+    :return: (labels, count): array of the shape of cells holding the label (0 to count - 1) of every living cell
+        and -1 for the dead cells; the number of groups
+    """
+    if reach is None or reach <= 0:
+        raise ValueError('Invalid Reach!')
+    alive = np.asarray(cells) != 0
+    height, width = alive.shape
+    dead = height * width
+    padded = np.full((height + 2 * reach, width + 2 * reach), dead, dtype=np.int64)
+    inner = padded[reach:height + reach, reach:width + reach]
+    inner[alive] = np.flatnonzero(alive)
+    lowest = np.empty((height, width), dtype=np.int64)
+    while True:
+        np.copyto(lowest, inner)
+        for dy in range(2 * reach + 1):
+            for dx in range(2 * reach + 1):
+                np.minimum(lowest, padded[dy:dy + height, dx:dx + width], out=lowest)
+        lowest[~alive] = dead
+        # the label of a cell is the index of a cell of the same group whose own label may already be lower
+        lowest = np.append(lowest.ravel(), dead)[lowest].reshape(height, width)
+        if np.array_equal(lowest, inner):
+            break
+        inner[...] = lowest
+    labels = np.full((height, width), -1, dtype=np.int64)
+    roots, labels[alive] = np.unique(inner[alive], return_inverse=True)
+    return labels, len(roots)
+
+
+def canonical_form(cells: np.ndarray) -> (int, int, bytes):
+    """
+    Finds the representative of a pattern which is shared by all its rotations, reflections and translations:
+    the smallest of the 8 orientations of the pattern cropped to its bounding box.
+    :param cells: 2d array of cells (non-zero alive) holding at least one living cell
+    :return: (height, width, cells) of the representative, with the cells packed into bits row by row
+    """
+    cells = np.asarray(cells) != 0
+    rows = np.flatnonzero(cells.any(axis=1))
+    columns = np.flatnonzero(cells.any(axis=0))
+    cells = cells[rows[0]:rows[-1] + 1, columns[0]:columns[-1] + 1]
+    forms = []
+    for flipped in (cells, cells.T):
+        for turns in range(4):
+            form = np.rot90(flipped, turns)
+            forms.append((form.shape[0], form.shape[1], np.packbits(form).tobytes()))
+    return min(forms)
+
+
+def parse_rows(rows: [str]) -> [(int, int)]:
+    """
+    :param rows: the rows of a pattern ('o' for a living cell, any other character for a dead one)
+    :return: (x, y) coordinates of the living cells
+    """
+    return [(x, y) for (y, row) in enumerate(rows) for (x, c) in enumerate(row) if c == 'o']
+
+
+class Census:
+    """
+    A class naming the objects found on a stabilized board.
+    The living cells are split into groups (see count), every group is reduced to its canonical form (the same for
+    all its rotations, reflections and positions) and the form is looked up in a table built from the built-in
+    objects and the structures of the library. The table holds every phase of the oscillators and spaceships, so an
+    object is found whatever phase the board stopped in. Unknown objects are named after a hash of their form;
+    objects which touch each other are counted as one unknown object.
+    Groups which fit into 8 x 8 cells (nearly all of them) are encoded as 64 bit masks with vectorized reductions,
+    so only the distinct masks of a board are named in Python.
+
+    Parameters
+    ----------
+    __rule: the rule the phases of the known objects are computed with
+    __names: table mapping canonical forms to the names of the objects
+    __masks: cache mapping the 64 bit masks of small groups to their names and whether they are known
+
+    Methods
+    -------
+    __init__(rule, file_path):
+        Builds the table of known objects from the built-in objects and the structures of a library.
+
+    add_object(name, coordinates):
+        adds an object and its phases to the table
+
+    identify(cells):
+        returns the name of a single object
+
+    count(cells, footprint):
+        returns the number of times every object appears on a board
+    """
+
+    def __init__(self, rule: str = 'B3/S23', file_path: str = None):
+        """
+        Creates the table of known objects. The built-in objects are only added if they are periodic in the rule;
+        structures of the library never replace a built-in name.
+        :param rule: rulestring in B/S notation
+        :param file_path: path of a structure library (such as Resources/resources.txt); None to only use the
+            built-in objects
+        """
+        self.__rule = Rule(rule)
+        self.__names = {}
+        self.__masks = {}
+        for (name, rows) in KNOWN_OBJECTS.items():
+            phases = self.__phases(parse_rows(rows))
+            if phases is not None:
+                for form in phases:
+                    self.__names.setdefault(form, name)
+        if file_path is not None:
+            library = GameUtils(file_path)
+            for name in library.get_key_list('structures'):
+                coordinates = library.get_struct_coordinates(name)
+                if coordinates:
+                    self.add_object(name, coordinates)
+
+    def add_object(self, name: str, coordinates: [(int, int)]):
+        """
+        Adds an object to the table under all of its phases (only its own phase if it is not periodic).
+        Forms which already have a name keep it.
+        :param name: name of the object
+        :param coordinates: (x, y) coordinates of the living cells of the object
+        """
+        if not coordinates:
+            raise ValueError('Invalid Structure!')
+        phases = self.__phases(coordinates)
+        if phases is None:
+            phases = [self.__form(coordinates)]
+        for form in phases:
+            self.__names.setdefault(form, name)
+        self.__masks = {}
+
+    def identify(self, cells: np.ndarray) -> str:
+        """
+        :param cells: 2d array of cells (non-zero alive) holding one object
+        :return: the name of the object; 'unknown' followed by its number of cells and a hash of its form if the
+            object is not in the table
+        """
+        return self.__lookup(cells)[0]
+
+    def count(self, cells: np.ndarray, footprint: np.ndarray = None) -> {str: int}:
+        """
+        Counts the objects of a board. Some objects (such as the aircraft carrier) are made of parts which are two
+        cells apart, so cells up to two cells apart are grouped first; groups which are not known objects (such as
+        two blocks next to each other) are then split into their 8-connected parts, which are counted instead.
+        :param cells: 2d array of cells (non-zero alive)
+        :param footprint: array of the same shape marking the cells which are alive in any phase of the board
+            (the union of the phases of its period); the parts of an oscillator may be further apart in one of its
+            phases, so the objects are found in the footprint. None to find them in cells
+        :return: dictionary mapping the names of the objects to their number
+        """
+        cells = np.asarray(cells) != 0
+        footprint = cells if footprint is None else cells | (np.asarray(footprint) != 0)
+        labels, count = label_components(footprint, 2)
+        names, known = self.__name_groups(cells, footprint, labels, count)
+        census = Counter(names[known].tolist())
+        if not known.all():
+            parts, part_count = label_components(cells & (labels >= 0) & ~known[labels], 1)
+            part_names = self.__name_groups(cells, parts >= 0, parts, part_count)[0]
+            census.update(name for name in part_names.tolist() if name is not None)
+        return dict(census)
+
+    def __name_groups(self, cells: np.ndarray, footprint: np.ndarray, labels: np.ndarray, count: int) -> \
+            (np.ndarray, np.ndarray):
+        """
+        Names the living cells of every group of a labelled footprint. Groups which fit into 8 x 8 cells are encoded
+        as 64 bit masks with vectorized reductions, so only the distinct masks are named in Python.
+        :param cells: 2d array of booleans (True alive)
+        :param footprint: 2d array of booleans marking the cells which belong to a group
+        :param labels: labels of the groups of the footprint (-1 outside of them)
+        :param count: number of groups
+        :return: (names, known): array of the names of the groups (None for groups without living cells) and array
+            of booleans, True for the groups which are known objects
+        """
+        names = np.full(count, None, dtype=object)
+        known = np.zeros(count, dtype=bool)
+        if count == 0:
+            return names, known
+        # bounding boxes of the groups
+        ys, xs = np.nonzero(footprint)
+        groups = labels[ys, xs]
+        left = np.full(count, footprint.shape[1], dtype=np.int64)
+        top = np.full(count, footprint.shape[0], dtype=np.int64)
+        right = np.zeros(count, dtype=np.int64)
+        bottom = np.zeros(count, dtype=np.int64)
+        np.minimum.at(left, groups, xs)
+        np.minimum.at(top, groups, ys)
+        np.maximum.at(right, groups, xs)
+        np.maximum.at(bottom, groups, ys)
+        # the living cells of every group, relative to the corner of its box
+        ys, xs = np.nonzero(cells & footprint)
+        groups = labels[ys, xs]
+        occupied = np.zeros(count, dtype=bool)
+        occupied[groups] = True
+        small = (right - left < 8) & (bottom - top < 8)
+        in_small = small[groups]
+        bits = ((ys - top[groups]) * 8 + xs - left[groups])[in_small].astype(np.uint64)
+        masks = np.zeros(count, dtype=np.uint64)
+        np.bitwise_or.at(masks, groups[in_small], np.left_shift(np.uint64(1), bits))
+        selected = np.flatnonzero(small & occupied)
+        unique, inverse = np.unique(masks[selected], return_inverse=True)
+        unique_names = np.empty(len(unique), dtype=object)
+        unique_known = np.zeros(len(unique), dtype=bool)
+        for (i, mask) in enumerate(unique.tolist()):
+            if mask not in self.__masks:
+                self.__masks[mask] = self.__lookup(self.__unpack(mask))
+            unique_names[i], unique_known[i] = self.__masks[mask]
+        names[selected] = unique_names[inverse]
+        known[selected] = unique_known[inverse]
+        for group in np.flatnonzero(~small & occupied).tolist():
+            box = (slice(top[group], bottom[group] + 1), slice(left[group], right[group] + 1))
+            names[group], known[group] = self.__lookup(cells[box] & (labels[box] == group))
+        return names, known
+
+    def __lookup(self, cells: np.ndarray) -> (str, bool):
+        """
+        :param cells: 2d array of cells (non-zero alive) holding one object
+        :return: (name, known): the name of the object and True if it is in the table
+        """
+        form = canonical_form(cells)
+        name = self.__names.get(form)
+        if name is not None:
+            return name, True
+        digest = hashlib.blake2b(repr(form).encode(), digest_size=6).hexdigest()
+        return f'unknown ({int(np.count_nonzero(cells))} cells) {digest}', False
+
+    def __phases(self, coordinates: [(int, int)]) -> [(int, int, bytes)]:
+        """
+        Follows a pattern on an infinite plane until it repeats its first form (at any position).
+        :param coordinates: (x, y) coordinates of the living cells of the pattern
+        :return: the canonical forms of the phases of the pattern; None if it does not repeat within MAX_PERIOD
+            generations
+        """
+        first = self.__form(coordinates)
+        phases = [first]
+        living = set(coordinates)
+        for i in range(MAX_PERIOD):
+            neighbors = Counter((x + dx, y + dy) for (x, y) in living
+                                for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy)
+            candidates = living | neighbors.keys()
+            living = {c for c in candidates if self.__rule.next_state(c in living, neighbors[c])}
+            if not living:
+                return None
+            form = self.__form(living)
+            if form == first:
+                return phases
+            phases.append(form)
+        return None
+
+    @staticmethod
+    def __form(coordinates) -> (int, int, bytes):
+        """
+        :param coordinates: (x, y) coordinates of living cells
+        :return: the canonical form of the cells
+        """
+        xs = [x for (x, y) in coordinates]
+        ys = [y for (x, y) in coordinates]
+        cells = np.zeros((max(ys) - min(ys) + 1, max(xs) - min(xs) + 1), dtype=bool)
+        cells[np.array(ys) - min(ys), np.array(xs) - min(xs)] = True
+        return canonical_form(cells)
+
+    @staticmethod
+    def __unpack(mask: int) -> np.ndarray:
+        """
+        :param mask: 64 bit mask of a group (bit 8 * y + x set for a living cell)
+        :return: 8 x 8 array of the cells of the group
+        """
+        return np.array([(mask >> i) & 1 for i in range(64)], dtype=bool).reshape(8, 8)
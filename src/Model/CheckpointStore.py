@@ -0,0 +1,361 @@
+import os
+import struct
+import zlib
+from array import array
+from Model.IGameOfLifeModel import IGameOfLifeModel
+
+
+def set_bytes(data: bytes) -> array:
+    """
+    :param data: bytes holding 0 or 1
+    :return: array of the indices of the bytes holding 1
+    """
+    indices = array('I')
+    i = data.find(1)
+    while i >= 0:
+        indices.append(i)
+        i = data.find(1, i + 1)
+    return indices
+
+
+class CheckpointStore:
+    """
+    A class recording the generations of a model so that any recorded generation can be restored directly.
+    The recording is split into segments of a fixed number of generations. A segment starts with a keyframe, the
+    whole board compressed with zlib, followed by one delta per generation (the row-major indices of the born and
+    of the dead cells, taken from the model's get_changes or, for models which do not report their changes, from
+    the difference between two boards). Seeking restores the keyframe of the segment holding the generation and
+    replays the deltas up to it, or only replays the deltas between the current and the requested generation when
+    both lie in the same segment. The board is written back with a single clear and set_cells call.
+    Segments are kept in memory up to a memory budget; older segments are then written to files in a directory
+    (when one is given) up to a disk budget, and dropped beyond it.
+    The generations are counted from the board of the model when the store was created (generation 0). The model
+    must only be advanced through the store while it records.
+
+    Parameters
+    ----------
+    __model: the recorded model
+    __width: width of the board
+    __size: number of cells of the board
+    __interval: number of generations per segment (a keyframe is taken every interval generations)
+    __max_bytes: memory budget of the segments held in memory
+    __directory: directory receiving the segments evicted from memory; None to drop them
+    __max_disk_bytes: disk budget of the segments written to the directory
+    __level: zlib compression level
+    __segments: list of segments from oldest to newest; a segment is a dict holding its first generation, its
+        compressed keyframe and list of (born, died) index arrays, or the path and size of its file once written
+    __memory: number of bytes held by the segments in memory
+    __disk: number of bytes held by the segment files
+    __generation: generation currently shown by the model
+    __latest: last recorded generation
+    __frame: board of the latest generation, one byte per cell (kept for models which do not report changes)
+
+    Methods
+    -------
+    __init__(model, interval, max_bytes, directory, max_disk_bytes, level):
+        Creates a store recording the model from its current board.
+
+    advance(n):
+        moves the model n generations forward, replaying recorded generations and recording new ones
+
+    seek(generation):
+        moves the model to a generation
+
+    get_generation():
+        returns the generation shown by the model
+
+    get_latest():
+        returns the last recorded generation
+
+    get_first():
+        returns the earliest generation which can still be restored
+
+    get_memory_size():
+        returns the number of bytes held in memory
+
+    get_disk_size():
+        returns the number of bytes held on disk
+
+    close():
+        removes the segment files
+    """
+
+    def __init__(self, model: IGameOfLifeModel, interval: int = 100, max_bytes: int = 64 * 1024 * 1024,
+                 directory: str = None, max_disk_bytes: int = 1024 * 1024 * 1024, level: int = 6):
+        """
+        Creates a store and records the current board of the model as generation 0.
+        :param model: the model to record
+        :param interval: number of generations between two keyframes
+        :param max_bytes: memory budget of the recorded segments
+        :param directory: existing directory receiving the segments that exceed the memory budget; None drops them
+        :param max_disk_bytes: disk budget of the segments written to the directory
+        :param level: zlib compression level of the keyframes and of the segment files
+        """
+        if model is None:
+            raise ValueError('Invalid Model!')
+        if interval is None or interval <= 0:
+            raise ValueError('Invalid Interval!')
+        if max_bytes is None or max_bytes <= 0 or max_disk_bytes is None or max_disk_bytes < 0:
+            raise ValueError('Invalid History Size!')
+        self.__model = model
+        self.__width = model.get_width()
+        self.__size = model.get_width() * model.get_height()
+        self.__interval = interval
+        self.__max_bytes = max_bytes
+        self.__directory = directory
+        self.__max_disk_bytes = max_disk_bytes
+        self.__level = level
+        self.__segments = []
+        self.__memory = 0
+        self.__disk = 0
+        self.__generation = 0
+        self.__latest = 0
+        frame = self.__read_frame()
+        # the changes of the model are only trusted if it reports them once tracking is enabled
+        model.track_changes(True)
+        self.__frame = frame if model.get_changes() is None else None
+        self.__open_segment(0, frame)
+
+    def advance(self, n: int = 1):
+        """
+        Moves the model n generations forward. Generations which were already recorded are replayed from the
+        store; the following ones are computed by the model one at a time and recorded.
+        :param n: number of generations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        target = self.__generation + n
+        if self.__generation < self.__latest:
+            self.seek(min(target, self.__latest))
+        model = self.__model
+        while self.__generation < target:
+            model.update_state()
+            self.__generation += 1
+            self.__latest = self.__generation
+            if self.__latest % self.__interval == 0:
+                frame = self.__read_frame()
+                if self.__frame is not None:
+                    self.__frame = frame
+                self.__open_segment(self.__latest, frame)
+            else:
+                self.__segments[-1]['deltas'].append(self.__read_delta())
+                self.__memory += self.__delta_bytes(self.__segments[-1]['deltas'][-1])
+            self.__enforce_budgets()
+
+    def seek(self, generation: int):
+        """
+        Moves the model to a generation. Recorded generations are restored from the nearest keyframe (or from
+        the current board, when it lies in the same segment); later generations are computed and recorded.
+        :param generation: the generation to show
+        """
+        if generation is None or generation < self.get_first():
+            raise ValueError('Invalid Generation!')
+        if generation > self.__latest:
+            self.seek(self.__latest)
+            self.advance(generation - self.__latest)
+            return
+        if generation == self.__generation:
+            return
+        # the stored segments are contiguous and all span interval generations
+        segment = self.__segments[(generation - self.get_first()) // self.__interval]
+        first = segment['first']
+        keyframe, deltas = self.__load(segment)
+        if first <= self.__generation < first + self.__interval:
+            self.__apply_deltas(deltas, self.__generation - first, generation - first)
+        else:
+            self.__restore(keyframe, deltas[:generation - first])
+        self.__generation = generation
+
+    def get_generation(self) -> int:
+        """
+        :return: the generation shown by the model
+        """
+        return self.__generation
+
+    def get_latest(self) -> int:
+        """
+        :return: the last recorded generation
+        """
+        return self.__latest
+
+    def get_first(self) -> int:
+        """
+        :return: the earliest generation which can still be restored (older segments were dropped)
+        """
+        return self.__segments[0]['first']
+
+    def get_memory_size(self) -> int:
+        """
+        :return: the number of bytes of the keyframes and deltas held in memory
+        """
+        return self.__memory
+
+    def get_disk_size(self) -> int:
+        """
+        :return: the number of bytes of the segment files
+        """
+        return self.__disk
+
+    def close(self):
+        """ Removes the segment files written by the store; their generations can no longer be restored. """
+        while self.__segments and 'path' in self.__segments[0]:
+            self.__drop_oldest()
+
+    def __read_frame(self) -> bytes:
+        """
+        The board is read through get_grid_view, so array backed views are copied in one call.
+        :return: the board of the model, one byte per cell (1 alive, 0 dead) in row-major order
+        """
+        view = self.__model.get_grid_view()
+        if hasattr(view, 'tobytes'):
+            return view.tobytes()
+        return b''.join(bytes(row) for row in view)
+
+    def __read_delta(self) -> (array, array):
+        """
+        :return: (born, died) row-major index arrays of the cells changed by the last generation
+        """
+        width = self.__width
+        changes = self.__model.get_changes()
+        if changes is not None:
+            born, died = changes
+            return array('I', [y * width + x for (x, y) in born]), array('I', [y * width + x for (x, y) in died])
+        frame = self.__read_frame()
+        # the boards are compared as integers, one byte per cell, so only the changed cells are visited in Python
+        size = self.__size
+        new = int.from_bytes(frame, 'little')
+        old = int.from_bytes(self.__frame, 'little')
+        self.__frame = frame
+        return (set_bytes((new & ~old).to_bytes(size, 'little')),
+                set_bytes((old & ~new).to_bytes(size, 'little')))
+
+    def __open_segment(self, first: int, frame: bytes):
+        """
+        Starts a new segment with a keyframe.
+        :param first: generation of the keyframe
+        :param frame: board of the generation, one byte per cell
+        """
+        keyframe = zlib.compress(frame, self.__level)
+        self.__segments.append({'first': first, 'keyframe': keyframe, 'deltas': []})
+        self.__memory += len(keyframe)
+
+    def __enforce_budgets(self):
+        """
+        Moves the oldest segments held in memory to disk (or drops them without a directory) while the memory
+        budget is exceeded, then drops the oldest files while the disk budget is exceeded. The segment being
+        recorded always stays in memory.
+        """
+        while self.__memory > self.__max_bytes:
+            index = next(i for i, s in enumerate(self.__segments) if 'path' not in s)
+            if index == len(self.__segments) - 1:
+                break
+            segment = self.__segments[index]
+            size = len(segment['keyframe']) + sum(self.__delta_bytes(d) for d in segment['deltas'])
+            if self.__directory is None:
+                del self.__segments[index]
+            else:
+                path = os.path.join(self.__directory, 'segment_' + str(segment['first']) + '.bin')
+                data = self.__serialize(segment['keyframe'], segment['deltas'])
+                with open(path, 'wb') as f:
+                    f.write(data)
+                self.__segments[index] = {'first': segment['first'], 'path': path, 'bytes': len(data)}
+                self.__disk += len(data)
+            self.__memory -= size
+        while self.__disk > self.__max_disk_bytes:
+            self.__drop_oldest()
+
+    def __drop_oldest(self):
+        """ Forgets the oldest segment and removes its file. """
+        segment = self.__segments.pop(0)
+        if 'path' in segment:
+            os.remove(segment['path'])
+            self.__disk -= segment['bytes']
+        else:
+            self.__memory -= len(segment['keyframe']) + sum(self.__delta_bytes(d) for d in segment['deltas'])
+
+    def __load(self, segment: {}) -> (bytes, [(array, array)]):
+        """
+        :param segment: a segment held in memory or on disk
+        :return: (compressed keyframe, deltas) of the segment
+        """
+        if 'path' not in segment:
+            return segment['keyframe'], segment['deltas']
+        with open(segment['path'], 'rb') as f:
+            return self.__deserialize(f.read())
+
+    def __restore(self, keyframe: bytes, deltas: [(array, array)]):
+        """
+        Writes the board of a keyframe followed by deltas into the model.
+        :param keyframe: compressed keyframe
+        :param deltas: (born, died) index arrays of the generations following the keyframe
+        """
+        live = set(set_bytes(zlib.decompress(keyframe)))
+        for (born, died) in deltas:
+            live.difference_update(died)
+            live.update(born)
+        width = self.__width
+        self.__model.clear()
+        self.__model.set_cells([(i % width, i // width) for i in live], True)
+
+    def __apply_deltas(self, deltas: [(array, array)], start: int, end: int):
+        """
+        Moves the model between two generations of the same segment by writing only the cells that change.
+        :param deltas: deltas of the segment (delta i leads from generation first + i to first + i + 1)
+        :param start: offset of the current generation in the segment
+        :param end: offset of the requested generation in the segment
+        """
+        states = {}
+        if end > start:
+            for (born, died) in deltas[start:end]:
+                states.update(dict.fromkeys(died, False))
+                states.update(dict.fromkeys(born, True))
+        else:
+            for (born, died) in reversed(deltas[end:start]):
+                states.update(dict.fromkeys(born, False))
+                states.update(dict.fromkeys(died, True))
+        width = self.__width
+        self.__model.set_cells([(i % width, i // width) for i, alive in states.items() if not alive], False)
+        self.__model.set_cells([(i % width, i // width) for i, alive in states.items() if alive], True)
+
+    def __serialize(self, keyframe: bytes, deltas: [(array, array)]) -> bytes:
+        """
+        :return: the contents of a segment file: the keyframe followed by the zlib compressed deltas, each
+            preceded by the lengths of its arrays
+        """
+        parts = []
+        for (born, died) in deltas:
+            parts.append(struct.pack('<II', len(born), len(died)))
+            parts.append(born.tobytes())
+            parts.append(died.tobytes())
+        return struct.pack('<II', len(keyframe), len(deltas)) + keyframe + \
+            zlib.compress(b''.join(parts), self.__level)
+
+    @staticmethod
+    def __deserialize(data: bytes) -> (bytes, [(array, array)]):
+        """
+        :param data: contents of a segment file
+        :return: (compressed keyframe, deltas) of the segment
+        """
+        length, count = struct.unpack_from('<II', data)
+        keyframe = data[8:8 + length]
+        payload = zlib.decompress(data[8 + length:])
+        deltas = []
+        offset = 0
+        for i in range(count):
+            born_count, died_count = struct.unpack_from('<II', payload, offset)
+            offset += 8
+            born = array('I')
+            born.frombytes(payload[offset:offset + 4 * born_count])
+            offset += 4 * born_count
+            died = array('I')
+            died.frombytes(payload[offset:offset + 4 * died_count])
+            offset += 4 * died_count
+            deltas.append((born, died))
+        return keyframe, deltas
+
+    @staticmethod
+    def __delta_bytes(delta: (array, array)) -> int:
+        """
+        :return: the number of bytes held by the index arrays of a delta
+        """
+        return (len(delta[0]) + len(delta[1])) * delta[0].itemsize
@@ -0,0 +1,217 @@
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.Rule import Rule
+
+
+class CompactGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model with the grid stored in a single contiguous bytearray.
+    Every cell takes one byte (1 alive, 0 dead) at index y * width + x, instead of an 8 byte pointer to a bool
+    inside a list per row. A generation sums the three cells of every horizontal window of a row once, adds
+    the sums of the rows above and below, and maps (state, sum) to the next state with the lookup table of the
+    rule; the intermediate rows are bytes as well.
+    The edge rules are the same as in GameOfLifeModel.
+
+    Parameters
+    ----------
+    __cells: row-major bytearray of cell states (1 alive, 0 dead)
+    __rows: read-only memoryviews of the rows of __cells handed out by get_grid_view
+    __lookup: next state indexed by 10 * state + (state + number of living neighbours)
+    __width: width of the game grid (in cells)
+    __height: height of the game grid (in cells)
+    __topology: 'bounded' or 'torus'
+    __rule: the rule of the game
+
+    Methods
+    -------
+    __init__(width, height, topology, rule):
+        Constructor which initializes the CompactGameOfLifeModel Object with a specified grid width, height,
+        topology and rule
+
+    toggle_cell(x, y):
+        switches the status of the specified cell
+
+    update_state():
+        updates the state of the game based on the rule of the game
+
+    get_width():
+        returns width of game grid
+
+    get_height():
+        returns height of the game grid
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the game grid
+
+    get_grid_view():
+        returns a read-only view of the game grid which is not copied
+
+    clear():
+        kills every cell of the grid
+
+    set_cells(coordinates, value):
+        sets the state of several cells at once
+
+    population():
+        returns the number of living cells
+
+    bounding_box():
+        returns the smallest rectangle holding all living cells
+
+    get_topology():
+        returns the name of the topology of the grid
+
+    get_rule():
+        returns the rulestring of the game
+    """
+
+    __slots__ = ('__cells', '__rows', '__lookup', '__width', '__height', '__topology', '__rule')
+
+    def __init__(self, width: int, height: int, topology: str = 'bounded', rule: str = 'B3/S23'):
+        """
+        Initializes the CompactGameOfLifeModel Object
+        :param width: width of the game grid
+        :param height: height of the game grid
+        :param topology: 'bounded' for a grid surrounded by dead cells or 'torus' for a grid whose edges wrap around
+        :param rule: rulestring in B/S notation
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        if topology not in ('bounded', 'torus'):
+            raise ValueError('Invalid Topology!')
+        self.__width = width
+        self.__height = height
+        self.__topology = topology
+        self.__rule = Rule(rule)
+        table = self.__rule.get_table()
+        # the window sums include the cell itself (a living cell has a sum of at least 1)
+        self.__lookup = bytes(table[9 * state + total - state] if total >= state else 0
+                              for state in (0, 1) for total in range(10))
+        self.__cells = bytearray(width * height)
+        cells = memoryview(self.__cells).toreadonly()
+        self.__rows = tuple(cells[y * width:(y + 1) * width] for y in range(height))
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.__cells[y * self.__width + x] ^= 1
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        width = self.__width
+        height = self.__height
+        cells = self.__cells
+        lookup = self.__lookup
+        torus = self.__topology == 'torus'
+        rows = [bytes(cells[y * width:(y + 1) * width]) for y in range(height)]
+        sums = []
+        for row in rows:
+            padded = row[-1:] + row + row[:1] if torus else b'\0' + row + b'\0'
+            sums.append(bytes(map(sum, zip(padded, padded[1:], padded[2:]))))
+        empty = bytes(width)
+        updated = []
+        for y in range(height):
+            if y > 0:
+                above = sums[y - 1]
+            else:
+                above = sums[-1] if torus else empty
+            if y < height - 1:
+                below = sums[y + 1]
+            else:
+                below = sums[0] if torus else empty
+            updated.append(bytes([lookup[10 * c + a + s + b]
+                                  for c, a, s, b in zip(rows[y], above, sums[y], below)]))
+        cells[:] = b''.join(updated)
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the grid
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the grid
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual grid
+        :return: copy of the array as a list of list of booleans
+        """
+        return [[c == 1 for c in row] for row in self.__rows]
+
+    def get_grid_view(self) -> (memoryview,):
+        """
+        The rows share memory with the grid: they are not copied and reflect every later change.
+        :return: tuple of read-only memoryviews of the rows (view[y][x] is 1 for a living cell, 0 for a dead one)
+        """
+        return self.__rows
+
+    def clear(self):
+        """ Kills every cell of the grid. """
+        self.__cells[:] = bytes(len(self.__cells))
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells at once. All coordinates are validated before any cell is changed.
+        :param coordinates: list of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        width = self.__width
+        height = self.__height
+        for (x, y) in coordinates:
+            if x is None or y is None or x < 0 or y < 0 or x >= width or y >= height:
+                raise ValueError('Invalid Cell Coordinates!')
+        cells = self.__cells
+        state = 1 if value else 0
+        for (x, y) in coordinates:
+            cells[y * width + x] = state
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (counted by bytearray.count)
+        """
+        return self.__cells.count(1)
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        The first and last living cells give the rows of the box; the columns are found with one search per row.
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        cells = self.__cells
+        width = self.__width
+        first = cells.find(1)
+        if first < 0:
+            return None
+        last = cells.rfind(1)
+        min_x = width
+        max_x = 0
+        for y in range(first // width, last // width + 1):
+            start = cells.find(1, y * width, (y + 1) * width)
+            if start >= 0:
+                min_x = min(min_x, start - y * width)
+                max_x = max(max_x, cells.rfind(1, y * width, (y + 1) * width) - y * width)
+        return min_x, first // width, max_x, last // width
+
+    def get_topology(self) -> str:
+        """
+        :return: 'bounded' or 'torus'
+        """
+        return self.__topology
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
@@ -0,0 +1,160 @@
+from collections import deque
+
+MASK = (1 << 64) - 1
+
+
+def splitmix64(value: int) -> int:
+    """
+    Mixes a 64 bit value into a pseudo-random 64 bit value (the output function of the SplitMix64 generator).
+    :param value: integer (only its lowest 64 bits are used)
+    :return: the mixed value
+    """
+    z = (value + 0x9E3779B97F4A7C15) & MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK
+    return z ^ (z >> 31)
+
+
+class CycleDetector:
+    """
+    A class detecting repeating board states with an incremental Zobrist hash.
+    Every cell owns a pseudo-random 64 bit key and the hash of a board is the XOR of the keys of its living cells, so
+    a model keeps the hash current by XORing in the key of every cell it flips. The keys are mixed from the indices
+    of the cells when they are needed instead of being stored, so a detector costs the same on any board size.
+    Once per generation the hash is looked up in a bounded table of the most recent hashes; finding it means the
+    board repeats with a period equal to the distance between the two generations.
+
+    Parameters
+    ----------
+    __salt: value XORed into the index of a cell before it is mixed into the key of the cell
+    __hash: hash of the current board
+    __seen: table mapping the recent hashes to the generation they were recorded at
+    __order: (hash, generation) of the recent generations from oldest to newest, used to evict old hashes
+    __history: maximum number of hashes kept
+    __generation: number of generations recorded
+    __cycle: (period, generation) of the last detected repetition; None if there is none
+
+    Methods
+    -------
+    __init__(width, height, history, seed):
+        Creates a detector for an empty board of the given size.
+
+    flip(index):
+        updates the hash after the cell with the given row-major index changed state
+
+    apply(delta):
+        updates the hash with the XOR of the keys of several flipped cells
+
+    record():
+        closes a generation and checks whether its board was seen before
+
+    forget():
+        clears the recorded hashes (after the board was edited by the user)
+
+    get_key(index):
+        returns the key of a cell
+
+    get_salt():
+        returns the value the keys are derived with
+
+    get_hash():
+        returns the hash of the current board
+
+    get_generation():
+        returns the number of recorded generations
+
+    get_cycle():
+        returns the period of the last detected repetition and the generation it was detected at
+    """
+
+    def __init__(self, width: int, height: int, history: int = 64, seed: int = 0):
+        """
+        Creates a detector for an empty board.
+        :param width: width of the board
+        :param height: height of the board
+        :param history: number of recent generations searched for repetitions (longest detectable period)
+        :param seed: seed of the random keys
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        if history is None or history <= 0:
+            raise ValueError('Invalid History Size!')
+        self.__salt = splitmix64(seed)
+        self.__hash = 0
+        self.__seen = {}
+        self.__order = deque()
+        self.__history = history
+        self.__generation = 0
+        self.__cycle = None
+        self.forget()
+
+    def flip(self, index: int):
+        """
+        Updates the hash after a cell changed state (in either direction).
+        :param index: row-major index of the cell
+        """
+        self.__hash ^= splitmix64(index ^ self.__salt)
+
+    def apply(self, delta: int):
+        """
+        Updates the hash after several cells changed state.
+        :param delta: XOR of the keys of the cells that changed state
+        """
+        self.__hash ^= delta
+
+    def record(self) -> (int, int):
+        """
+        Closes a generation: the current hash is looked up in and then added to the table of recent hashes.
+        :return: (period, generation) if the board repeats an earlier one; None otherwise
+        """
+        self.__generation += 1
+        value = self.__hash
+        previous = self.__seen.get(value)
+        self.__cycle = None if previous is None else (self.__generation - previous, self.__generation)
+        self.__seen[value] = self.__generation
+        self.__order.append((value, self.__generation))
+        if len(self.__order) > self.__history:
+            oldest, generation = self.__order.popleft()
+            # the hash may have been seen again since, in which case its newer entry is kept
+            if self.__seen[oldest] == generation:
+                del self.__seen[oldest]
+        return self.__cycle
+
+    def forget(self):
+        """ Clears the recorded hashes, since the board no longer follows from them, and records the current one. """
+        self.__seen = {self.__hash: self.__generation}
+        self.__order = deque([(self.__hash, self.__generation)])
+        self.__cycle = None
+
+    def get_key(self, index: int) -> int:
+        """
+        :param index: row-major index of a cell
+        :return: the 64 bit key of the cell
+        """
+        return splitmix64(index ^ self.__salt)
+
+    def get_salt(self) -> int:
+        """
+        The key of the cell with index i is splitmix64(i ^ salt); vectorized engines derive all keys at once from it.
+        :return: the value XORed into the indices of the cells before they are mixed
+        """
+        return self.__salt
+
+    def get_hash(self) -> int:
+        """
+        :return: the 64 bit hash of the current board
+        """
+        return self.__hash
+
+    def get_generation(self) -> int:
+        """
+        :return: the number of recorded generations
+        """
+        return self.__generation
+
+    def get_cycle(self) -> (int, int):
+        """
+        :return: (period, generation) if the board of the last recorded generation repeats an earlier one;
+            None otherwise
+        """
+        return self.__cycle
@@ -0,0 +1,364 @@
+import numpy as np
+from Model.NumpyGameOfLifeModel import apply_rule, cell_indices, cell_keys, count_neighbors, wrap_edges
+from Model.Rule import Rule
+
+
+class EnsembleGameOfLifeModel:
+    """
+    A class simulating a stack of independent game of life boards of the same size in a single 3-D NumPy array.
+    A generation advances every board at once with the kernels of NumpyGameOfLifeModel, whose shifted views span
+    the whole stack, so the interpreter overhead of a step is paid once per generation instead of once per board.
+    The edge rules are the same as in NumpyGameOfLifeModel and apply to every board separately.
+    The hashes of the most recent generations are kept in a ring buffer to detect the boards that stabilized: a
+    board is stable once its hash repeats one of them. The cells of every board are packed into bytes and hashed
+    as the sum of the bytes times pseudo-random 64 bit keys (a Zobrist-style hash with one key per byte), so the
+    ring costs 8 bytes per board and generation instead of a copy of the board. As with CycleDetector, equal
+    hashes are taken as equal boards. Boards that already stabilized are not compared again.
+
+    Parameters
+    ----------
+    __padded: count x (height + 2) x (width + 2) array of uint8 cells; the outer ring of every board is its border
+    __grid: view of the inner count x height x width region of __padded
+    __view: read-only view of __grid handed out by get_grid_view
+    __neighbors: preallocated count x height x width buffer holding neighbour counts
+    __kept: preallocated count x height x width buffer of booleans
+    __scratch: preallocated count x height x width buffer of booleans
+    __keys: height x bytes per row array of the uint64 keys of the packed bytes of a board
+    __hashes: ring buffer of the hashes of the boards of the recent generations (history x count); the slot of the
+        current generation is kept up to date by the edits
+    __edited: generation at which every board was last edited; earlier slots of the ring do not apply to it
+    __periods: period of every board (0 while it has not stabilized)
+    __settled: generation at which every board entered its cycle (-1 while it has not stabilized)
+    __generation: number of generations computed
+    __count: number of boards
+    __width: width of the boards (in cells)
+    __height: height of the boards (in cells)
+    __topology: 'bounded' or 'torus'
+    __rule: the rule of the game
+
+    Methods
+    -------
+    __init__(count, width, height, topology, rule, cycle_history):
+        Constructor which initializes the EnsembleGameOfLifeModel Object with a number of boards of the specified
+        width and height, topology and rule
+
+    toggle_cell(board, x, y):
+        switches the status of the specified cell of a board
+
+    set_cells(board, coordinates, value):
+        sets the state of several cells of a board with a single vectorized write
+
+    set_boards(cells):
+        replaces the cells of every board
+
+    randomize(density, seed):
+        fills every board with a random soup
+
+    clear(board):
+        kills every cell of a board (or of every board)
+
+    update_state():
+        updates the state of every board based on the rule of the game
+
+    step(n):
+        updates the state of every board n times
+
+    run(max_generations):
+        updates the boards until all of them stabilized or the generation limit is reached
+
+    get_count():
+        returns the number of boards
+
+    get_width():
+        returns width of the boards
+
+    get_height():
+        returns height of the boards
+
+    get_generation():
+        returns the number of generations computed
+
+    get_grid(board):
+        returns the list of list of booleans representing a copy of a board
+
+    get_grid_view():
+        returns a read-only view of the stack of boards which is not copied
+
+    population():
+        returns the number of living cells of every board
+
+    get_periods():
+        returns the period of every board (0 while it has not stabilized)
+
+    get_stabilized():
+        returns for every board whether it stabilized
+
+    get_settled_generations():
+        returns the generation at which every board entered its cycle
+
+    get_topology():
+        returns the name of the topology of the boards
+
+    get_rule():
+        returns the rulestring of the game
+    """
+
+    def __init__(self, count: int, width: int, height: int, topology: str = 'bounded', rule: str = 'B3/S23',
+                 cycle_history: int = 8):
+        """
+        Initializes the EnsembleGameOfLifeModel Object with empty boards
+        :param count: number of boards
+        :param width: width of every board
+        :param height: height of every board
+        :param topology: 'bounded' for boards surrounded by dead cells or 'torus' for boards whose edges wrap around
+        :param rule: rulestring in B/S notation
+        :param cycle_history: number of recent generations searched for repetitions (longest detectable period)
+        """
+        if count is None or width is None or height is None or count <= 0 or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        if topology not in ('bounded', 'torus'):
+            raise ValueError('Invalid Topology!')
+        if cycle_history is None or cycle_history <= 0:
+            raise ValueError('Invalid History Size!')
+        self.__count = count
+        self.__width = width
+        self.__height = height
+        self.__topology = topology
+        self.__rule = Rule(rule)
+        self.__padded = np.zeros((count, height + 2, width + 2), dtype=np.uint8)
+        self.__grid = self.__padded[:, 1:height + 1, 1:width + 1]
+        self.__view = self.__grid.view()
+        self.__view.flags.writeable = False
+        self.__neighbors = np.zeros((count, height, width), dtype=np.uint8)
+        self.__kept = np.zeros((count, height, width), dtype=bool)
+        self.__scratch = np.zeros((count, height, width), dtype=bool)
+        self.__keys = cell_keys(0, height * ((width + 7) // 8)).reshape(height, -1)
+        # the hash of an empty board is 0
+        self.__hashes = np.zeros((cycle_history, count), dtype=np.uint64)
+        self.__edited = np.zeros(count, dtype=np.int64)
+        self.__periods = np.zeros(count, dtype=np.int64)
+        self.__settled = np.full(count, -1, dtype=np.int64)
+        self.__generation = 0
+
+    def toggle_cell(self, board: int, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param board: index of the board
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        self.__check_board(board)
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.__grid[board, y, x] ^= 1
+        self.__forget(board)
+
+    def set_cells(self, board: int, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells of a board with one fancy-indexed write. All coordinates are validated first.
+        :param board: index of the board
+        :param coordinates: list (or n x 2 array) of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        self.__check_board(board)
+        ys, xs = cell_indices(coordinates, self.__width, self.__height)
+        self.__grid[board, ys, xs] = value
+        self.__forget(board)
+
+    def set_boards(self, cells: np.ndarray):
+        """
+        Replaces the cells of every board.
+        :param cells: count x height x width array of cells (non-zero alive)
+        """
+        cells = np.asarray(cells)
+        if cells.shape != self.__grid.shape:
+            raise ValueError('Invalid Grid Parameters!')
+        np.not_equal(cells, 0, out=self.__grid, casting='unsafe')
+        self.__forget(slice(None))
+
+    def randomize(self, density: float = 0.5, seed: int = None):
+        """
+        Fills every board with a random soup; the same seed always gives the same soups.
+        :param density: probability of a cell to be alive (between 0 and 1)
+        :param seed: seed of the random number generator (None for a fresh one)
+        """
+        if density is None or density < 0 or density > 1:
+            raise ValueError('Invalid Density!')
+        rng = np.random.default_rng(seed)
+        np.less(rng.random(self.__grid.shape), density, out=self.__grid, casting='unsafe')
+        self.__forget(slice(None))
+
+    def clear(self, board: int = None):
+        """
+        Kills every cell of a board.
+        :param board: index of the board (None for every board)
+        """
+        if board is None:
+            board = slice(None)
+        else:
+            self.__check_board(board)
+        self.__grid[board] = 0
+        self.__forget(board)
+
+    def update_state(self):
+        """
+        updates the state of every board based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        self.step(1)
+
+    def step(self, n: int):
+        """
+        Updates the state of every board n times. Every generation is computed in place in preallocated buffers.
+        :param n: number of generations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        torus = self.__topology == 'torus'
+        grid = self.__grid
+        for i in range(n):
+            if torus:
+                wrap_edges(self.__padded)
+            count_neighbors(self.__padded, self.__neighbors)
+            apply_rule(self.__rule, self.__neighbors, grid, grid, self.__kept, self.__scratch)
+            self.__generation += 1
+            self.__detect_cycles()
+
+    def run(self, max_generations: int) -> int:
+        """
+        Updates the boards until every board stabilized (or the generation limit is reached).
+        :param max_generations: maximum number of generations to compute (non-negative)
+        :return: the number of generations computed
+        """
+        if max_generations is None or max_generations < 0:
+            raise ValueError('Invalid Step Count!')
+        for i in range(max_generations):
+            if self.__periods.all():
+                return i
+            self.step(1)
+        return max_generations
+
+    def __detect_cycles(self):
+        """
+        Compares the hashes of the boards which have not stabilized with the recent generations, closest first, so
+        that a board which repeats is given its shortest period. The hashes of the new generation are recorded as
+        well.
+        """
+        history = len(self.__hashes)
+        generation = self.__generation
+        hashes = self.__hash(slice(None))
+        open_boards = self.__periods == 0
+        for lag in range(1, min(history, generation) + 1):
+            slot = (generation - lag) % history
+            # the slot only applies to the boards which were not edited since it was recorded
+            candidates = open_boards & (self.__edited <= generation - lag)
+            repeated = np.flatnonzero(candidates & (self.__hashes[slot] == hashes))
+            self.__periods[repeated] = lag
+            self.__settled[repeated] = generation - lag
+            open_boards[repeated] = False
+        self.__hashes[generation % history] = hashes
+
+    def __hash(self, board) -> np.ndarray:
+        """
+        :param board: index of a board or a slice of boards
+        :return: the uint64 hash of the board (or array of the hashes of the boards); the products wrap around
+        """
+        packed = np.packbits(self.__grid[board], axis=-1)
+        return np.einsum('...ij,ij->...', packed, self.__keys)
+
+    def __forget(self, board):
+        """
+        Forgets the recorded generations of edited boards, which start over as unstable.
+        :param board: index of the board (or a slice of boards)
+        """
+        self.__edited[board] = self.__generation
+        self.__hashes[self.__generation % len(self.__hashes), board] = self.__hash(board)
+        self.__periods[board] = 0
+        self.__settled[board] = -1
+
+    def __check_board(self, board: int):
+        """
+        :param board: index of a board
+        """
+        if board is None or board < 0 or board >= self.__count:
+            raise ValueError('Invalid Board!')
+
+    def get_count(self) -> int:
+        """
+        :return: the number of boards
+        """
+        return self.__count
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the boards
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the boards
+        """
+        return self.__height
+
+    def get_generation(self) -> int:
+        """
+        :return: the number of generations computed since the model was created
+        """
+        return self.__generation
+
+    def get_grid(self, board: int) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual board
+        :param board: index of the board
+        :return: copy of the board as a list of list of booleans
+        """
+        self.__check_board(board)
+        return self.__grid[board].astype(bool).tolist()
+
+    def get_grid_view(self) -> np.ndarray:
+        """
+        The view shares memory with the boards: it is not copied and reflects every later change.
+        :return: read-only count x height x width array of uint8 cells (1 alive, 0 dead)
+        """
+        return self.__view
+
+    def population(self) -> np.ndarray:
+        """
+        :return: array holding the number of living cells of every board (one vectorized sum)
+        """
+        return self.__grid.sum(axis=(1, 2), dtype=np.int64)
+
+    def get_periods(self) -> np.ndarray:
+        """
+        A period of 1 means the board is static (or empty).
+        :return: array holding the period of every board; 0 for the boards which have not stabilized
+        """
+        return self.__periods.copy()
+
+    def get_stabilized(self) -> np.ndarray:
+        """
+        :return: array of booleans, True for the boards which repeat one of their recent generations
+        """
+        return self.__periods > 0
+
+    def get_settled_generations(self) -> np.ndarray:
+        """
+        :return: array holding the first generation of the cycle of every board; -1 for the boards which have not
+            stabilized
+        """
+        return self.__settled.copy()
+
+    def get_topology(self) -> str:
+        """
+        :return: 'bounded' or 'torus'
+        """
+        return self.__topology
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
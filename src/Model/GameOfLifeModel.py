@@ -1,4 +1,9 @@
+from array import array
+from Model.CycleDetector import CycleDetector
+from Model.GridView import GridView
 from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.PopulationTracker import PopulationTracker
+from Model.Rule import Rule
 
 
 class GameOfLifeModel(IGameOfLifeModel):
@@ -8,13 +13,23 @@ class GameOfLifeModel(IGameOfLifeModel):
     Parameters
     ----------
     __grid: array of array of booleans representing the game of life grid
+    __view: read-only GridView of __grid handed out by get_grid_view
     __width: width of the game grid (in cells)
     __height: height of the game grid (in cells)
+    __topology: 'bounded' (cells outside the grid are dead) or 'torus' (opposite edges are joined)
+    __wrapped_rows: for every row, the indices of the rows above, itself and below on the torus
+    __wrapped_columns: for every column, the indices of the columns left, itself and right on the torus
+    __rule: the rule of the game
+    __cycles: CycleDetector hashing the states of the grid; None when cycle detection is disabled
+    __tracker: PopulationTracker counting the living cells and keeping their bounding box
+    __changes: array('I') of the row-major indices of the cells flipped by the last update_state or step call;
+        None while change tracking is disabled
 
     Methods
     -------
-    __init__(width, height):
-        Constructor which initializes the GameOfLifeModel Object with a specified grid width and height
+    __init__(width, height, topology, rule, cycle_history):
+        Constructor which initializes the GameOfLifeModel Object with a specified grid width, height, topology and
+        rule
 
     __generate_grid(width, height):
         creates an array of array of booleans representing the grid of the game
@@ -24,11 +39,14 @@ class GameOfLifeModel(IGameOfLifeModel):
         switches the status of the specified cell
 
     update_state():
-        updates the state of the game based on the Game of Life Rules:
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
             1. If a dead cell has exactly 3 living cells around it, it becomes alive
             2. If a living cell has 4 or more living cells around it, it dies.
             3. If a living cell has less than 2 living cells around it, it dies.
 
+    step(n):
+        updates the state of the game n times
+
     get_width():
         returns width of game grid
 
@@ -37,20 +55,69 @@ class GameOfLifeModel(IGameOfLifeModel):
 
     get_grid():
         returns the list of list of booleans representing a copy of the game grid
+
+    get_grid_view():
+        returns a read-only view of the game grid which is not copied
+
+    clear():
+        kills every cell of the grid
+
+    set_cells(coordinates, value):
+        sets the state of several cells at once
+
+    population():
+        returns the number of living cells
+
+    bounding_box():
+        returns the smallest rectangle holding all living cells
+
+    track_changes(enabled):
+        starts or stops recording the cells changed by every update
+
+    get_changes():
+        returns the cells born and the cells that died during the last update (None unless tracking is enabled)
+
+
+    get_topology():
+        returns the name of the topology of the grid
+
+    get_rule():
+        returns the rulestring of the game
+
+    get_cycle():
+        returns the period of the grid if it repeats one of the recent states
     """
 
-    def __init__(self, width: int, height: int):
+    __slots__ = ('__grid', '__view', '__width', '__height', '__topology', '__wrapped_rows', '__wrapped_columns',
+                 '__rule', '__cycles', '__tracker', '__changes')
+
+    def __init__(self, width: int, height: int, topology: str = 'bounded', rule: str = 'B3/S23',
+                 cycle_history: int = 0):
         """
         Initializes the GameOfLifeModel Object
         :param width: width of the game grid
         :param height: height of the game grid
+        :param topology: 'bounded' for a grid surrounded by dead cells or 'torus' for a grid whose edges wrap around
+        :param rule: rulestring in B/S notation
+        :param cycle_history: number of recent states searched for repetitions (0 disables cycle detection)
         """
         if width <= 0 or height <= 0:
             raise ValueError('Invalid Grid Parameters!')
+        elif topology not in ('bounded', 'torus'):
+            raise ValueError('Invalid Topology!')
         else:
             self.__grid = self.__generate_grid(width, height)
+            self.__view = GridView(self.__grid)
             self.__width = width
             self.__height = height
+            self.__topology = topology
+            self.__rule = Rule(rule)
+            self.__cycles = CycleDetector(width, height, cycle_history) if cycle_history else None
+            self.__tracker = PopulationTracker(width, height)
+            self.__changes = None
+            # neighbour indices are resolved once so that the step does not wrap coordinates cell by cell
+            self.__wrapped_rows = [((y - 1) % height, y, (y + 1) % height) for y in range(height)]
+            self.__wrapped_columns = [((x - 1) % width, x, (x + 1) % width) for x in range(width)]
 
     @staticmethod
     def __generate_grid(width: int, height: int) -> [[bool]]:
@@ -81,6 +148,44 @@ class GameOfLifeModel(IGameOfLifeModel):
             raise ValueError('Invalid Cell Coordinates!')
         else:
             self.__grid[y][x] = not self.__grid[y][x]
+            self.__tracker.flip(x, y, self.__grid[y][x])
+            if self.__cycles is not None:
+                self.__cycles.flip(y * self.__width + x)
+                self.__cycles.forget()
+
+    def clear(self):
+        """ Kills every cell of the grid. The rows are emptied in place so that grid views stay valid. """
+        if self.__cycles is not None:
+            for y in range(self.__height):
+                for x in range(self.__width):
+                    if self.__grid[y][x]:
+                        self.__cycles.flip(y * self.__width + x)
+            self.__cycles.forget()
+        for row in self.__grid:
+            row[:] = [False] * self.__width
+        self.__tracker.clear()
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells at once. All coordinates are validated before any cell is changed.
+        :param coordinates: list of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        width = self.__width
+        height = self.__height
+        for (x, y) in coordinates:
+            if x is None or y is None or x < 0 or y < 0 or x >= width or y >= height:
+                raise ValueError('Invalid Cell Coordinates!')
+        value = bool(value)
+        grid = self.__grid
+        for (x, y) in set(coordinates):
+            if grid[y][x] != value:
+                grid[y][x] = value
+                self.__tracker.flip(x, y, value)
+                if self.__cycles is not None:
+                    self.__cycles.flip(y * width + x)
+        if self.__cycles is not None:
+            self.__cycles.forget()
 
     def __surrounding_live_cells(self, x: int, y: int) -> int:
         """
@@ -90,6 +195,18 @@ class GameOfLifeModel(IGameOfLifeModel):
         """
         if x < 0 or y < 0 or x is None or y is None or y >= len(self.__grid) or x >= len(self.__grid[0]):
             raise ValueError('Invalid Cell Coordinates!')
+        elif self.__topology == 'torus':
+            result = 0
+            columns = self.__wrapped_columns[x]
+            for row in self.__wrapped_rows[y]:
+                cells = self.__grid[row]
+                for column in columns:
+                    if cells[column]:
+                        result += 1
+            if self.__grid[y][x]:
+                return result - 1
+            else:
+                return result
         else:
             startX = max(0, x - 1)
             endX = min(self.__width - 1, x + 1)
@@ -110,11 +227,13 @@ class GameOfLifeModel(IGameOfLifeModel):
 
     def update_state(self):
         """
-        updates the state of the game based on the Game of Life Rules:
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
         1. If a dead cell has exactly 3 living cells around it, it becomes alive
         2. If a living cell has 4 or more living cells around it, it dies.
         3. If a living cell has less than 2 living cells around it, it dies.
         """
+        birth = self.__rule.get_birth()
+        survival = self.__rule.get_survival()
         toggle_list = []
         i = 0
         j = 0
@@ -123,14 +242,41 @@ class GameOfLifeModel(IGameOfLifeModel):
             while j < self.__width:
                 neighbors = self.__surrounding_live_cells(j, i)
                 alive = self.__grid[i][j]
-                if alive and (neighbors < 2 or neighbors > 3):
+                if alive and not survival[neighbors]:
                     toggle_list.append((j, i))
-                elif not alive and neighbors == 3:
+                elif not alive and birth[neighbors]:
                     toggle_list.append((j, i))
                 j += 1
             i += 1
+        cycles = self.__cycles
+        tracker = self.__tracker
         for x in toggle_list:
-            self.toggle_cell(x[0], x[1])
+            self.__grid[x[1]][x[0]] = not self.__grid[x[1]][x[0]]
+            tracker.flip(x[0], x[1], self.__grid[x[1]][x[0]])
+            if cycles is not None:
+                cycles.flip(x[1] * self.__width + x[0])
+        if cycles is not None:
+            cycles.record()
+        if self.__changes is not None:
+            self.__changes = array('I', [y * self.__width + x for (x, y) in toggle_list])
+
+    def step(self, n: int):
+        """
+        Updates the state of the game n times. The cells flipped by the generations are combined, so that
+        get_changes reports the difference between the first and the last board.
+        :param n: number of generations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        if self.__changes is None:
+            for i in range(n):
+                self.update_state()
+            return
+        changes = set()
+        for i in range(n):
+            self.update_state()
+            changes.symmetric_difference_update(self.__changes)
+        self.__changes = array('I', changes)
 
     def get_width(self) -> int:
         """
@@ -156,3 +302,69 @@ class GameOfLifeModel(IGameOfLifeModel):
                 row.append(self.__grid[i][j])
             grid.append(row)
         return grid
+
+    def get_grid_view(self) -> GridView:
+        """
+        The view reads the grid directly: it is not copied and reflects every later change.
+        :return: read-only view of the grid, indexed like the grid (view[y][x])
+        """
+        return self.__view
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (kept up to date as cells change, no scan of the grid)
+        """
+        return self.__tracker.get_population()
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        return self.__tracker.get_bounding_box()
+
+    def track_changes(self, enabled: bool = True):
+        """
+        The changes are only recorded while tracking is enabled, so that plain play does not pay for them.
+        :param enabled: True to record the changes of every later update_state or step call, False to stop
+        """
+        self.__changes = array('I') if enabled else None
+
+    def get_changes(self) -> ([(int, int)], [(int, int)]):
+        """
+        :return: (born, died) lists of (x, y) coordinates of the cells changed by the last update_state or step call;
+            None while change tracking is disabled
+        """
+        if self.__changes is None:
+            return None
+        width = self.__width
+        born = []
+        died = []
+        for i in self.__changes:
+            x = i % width
+            y = i // width
+            if self.__grid[y][x]:
+                born.append((x, y))
+            else:
+                died.append((x, y))
+        return born, died
+
+    def get_topology(self) -> str:
+        """
+        :return: 'bounded' or 'torus'
+        """
+        return self.__topology
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
+
+    def get_cycle(self) -> (int, int):
+        """
+        Only available when the model was created with a cycle history.
+        :return: (period, generation) if the grid repeats one of the recent states; None otherwise
+        """
+        if self.__cycles is None:
+            return None
+        return self.__cycles.get_cycle()
@@ -0,0 +1,108 @@
+class RowView:
+    """
+    A class providing read-only access to a row of a grid without copying it.
+
+    Parameters
+    ----------
+    __row: the list of cells of the row
+
+    Methods
+    -------
+    __init__(row):
+        wraps the row
+
+    __len__():
+        returns the number of cells in the row
+
+    __getitem__(x):
+        returns the state of a cell (or a list of states for a slice)
+
+    __iter__():
+        iterates over the states of the cells
+    """
+
+    __slots__ = ('__row',)
+
+    def __init__(self, row: [bool]):
+        """
+        :param row: the list of cells of the row (read through, never modified)
+        """
+        self.__row = row
+
+    def __len__(self) -> int:
+        """
+        :return: the number of cells in the row
+        """
+        return len(self.__row)
+
+    def __getitem__(self, x):
+        """
+        :param x: index of a cell or a slice
+        :return: state of the cell; for a slice a new list of states
+        """
+        return self.__row[x]
+
+    def __iter__(self):
+        """
+        :return: iterator over the states of the cells
+        """
+        return iter(self.__row)
+
+    def __contains__(self, state) -> bool:
+        """
+        :param state: state to look for
+        :return: True if a cell of the row has the state
+        """
+        return state in self.__row
+
+
+class GridView:
+    """
+    A class providing read-only access to a list of list grid without copying it.
+    The view reads the rows of the grid directly, so it reflects every later change made to them.
+
+    Parameters
+    ----------
+    __rows: tuple of RowView objects, one per row of the grid
+
+    Methods
+    -------
+    __init__(rows):
+        wraps the rows of a grid
+
+    __len__():
+        returns the number of rows
+
+    __getitem__(y):
+        returns a read-only view of a row
+
+    __iter__():
+        iterates over read-only views of the rows
+    """
+
+    __slots__ = ('__rows',)
+
+    def __init__(self, rows: [[bool]]):
+        """
+        :param rows: the rows of the grid; the rows are wrapped once and must not be replaced afterwards
+        """
+        self.__rows = tuple(RowView(row) for row in rows)
+
+    def __len__(self) -> int:
+        """
+        :return: the number of rows of the grid
+        """
+        return len(self.__rows)
+
+    def __getitem__(self, y):
+        """
+        :param y: index of a row or a slice
+        :return: read-only view of the row; for a slice a tuple of views
+        """
+        return self.__rows[y]
+
+    def __iter__(self):
+        """
+        :return: iterator over read-only views of the rows
+        """
+        return iter(self.__rows)
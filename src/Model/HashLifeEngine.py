@@ -0,0 +1,284 @@
+import weakref
+from collections import OrderedDict
+from Model.Rule import Rule
+
+
+class Node:
+    """
+    A class representing a canonical quadtree node of the HashLife engine.
+    A node of level k covers a 2^k x 2^k square; level 0 nodes are single cells.
+
+    Parameters
+    ----------
+    level: level of the node in the quadtree
+    nw, ne, sw, se: the four quadrants of the node (None for single cells)
+    population: number of living cells inside the node
+    """
+
+    def __init__(self, level: int, nw, ne, sw, se, population: int):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+
+
+class HashLifeEngine:
+    """
+    A class implementing Gosper's HashLife algorithm on an unbounded plane.
+    The pattern is stored as a quadtree of canonical (hash-consed) nodes centered on the origin, and the
+    results of advancing each node are memoized, which allows repeating structures and long stretches of time
+    to be simulated in a single step.
+    Any B/S rule without B0 is supported; under B0 the empty plane would not stay empty, which breaks the
+    assumption that empty nodes never change.
+
+    Parameters
+    ----------
+    __nodes: canonical table mapping the identities of four quadrants to the node built from them
+    __results: memoized results of advancing a node by a power of two generations (least recently used first)
+    __cache_size: maximum number of memoized results kept before the oldest ones are evicted
+    __zeros: empty node of every level built so far
+    __root: node containing the current pattern
+    __generation: number of generations the pattern was advanced by
+    __rule: the rule of the game
+
+    Methods
+    -------
+    __init__(cache_size, rule):
+        Creates an empty engine which keeps at most cache_size memoized results.
+
+    set_coordinates(coordinates):
+        replaces the current pattern with the living cells at the given coordinates
+
+    get_coordinates(normalize):
+        returns the coordinates of the living cells
+
+    advance(generations):
+        advances the pattern by the given amount of generations
+
+    get_generation():
+        returns the number of generations the pattern was advanced by
+
+    get_population():
+        returns the number of living cells
+
+    get_rule():
+        returns the rulestring of the engine
+    """
+
+    def __init__(self, cache_size: int = 1 << 20, rule: str = 'B3/S23'):
+        """
+        Creates an empty engine.
+        :param cache_size: maximum number of memoized results kept in memory
+        :param rule: rulestring in B/S notation (rules with B0 are not supported)
+        """
+        if cache_size is None or cache_size <= 0:
+            raise ValueError('Invalid Cache Size!')
+        self.__rule = Rule(rule)
+        if self.__rule.get_birth()[0]:
+            raise ValueError('Invalid Rule!')
+        self.__nodes = weakref.WeakValueDictionary()
+        self.__results = OrderedDict()
+        self.__cache_size = cache_size
+        self.__off = Node(0, None, None, None, None, 0)
+        self.__on = Node(0, None, None, None, None, 1)
+        self.__zeros = [self.__off]
+        self.__root = self.__zero(3)
+        self.__generation = 0
+
+    def set_coordinates(self, coordinates: [(int, int)]):
+        """
+        Replaces the current pattern and resets the generation counter.
+        :param coordinates: list of (x, y) coordinates of living cells
+        """
+        cells = list(set((int(c[0]), int(c[1])) for c in coordinates))
+        level = 3
+        while cells and not all(-(1 << (level - 1)) <= c[0] < (1 << (level - 1)) and
+                                -(1 << (level - 1)) <= c[1] < (1 << (level - 1)) for c in cells):
+            level += 1
+        half = 1 << (level - 1)
+        self.__root = self.__build(cells, level, -half, -half)
+        self.__generation = 0
+
+    def get_coordinates(self, normalize: bool = False) -> [(int, int)]:
+        """
+        :param normalize: shift the coordinates so that the smallest x and y are 0 (the structure library format)
+        :return: sorted list of (x, y) coordinates of living cells
+        """
+        result = []
+        half = 1 << (self.__root.level - 1)
+        self.__collect(self.__root, -half, -half, result)
+        if normalize and result:
+            min_x = min(c[0] for c in result)
+            min_y = min(c[1] for c in result)
+            result = [(c[0] - min_x, c[1] - min_y) for c in result]
+        result.sort(key=lambda c: (c[1], c[0]))
+        return result
+
+    def advance(self, generations: int):
+        """
+        Advances the pattern by decomposing the amount of generations into powers of two.
+        :param generations: non-negative number of generations to advance by
+        """
+        if generations is None or generations < 0:
+            raise ValueError('Invalid Generation Count!')
+        node = self.__root
+        j = 0
+        remaining = generations
+        while remaining:
+            if remaining & 1:
+                node = self.__step(node, j)
+            remaining >>= 1
+            j += 1
+        self.__root = node
+        self.__generation += generations
+
+    def get_generation(self) -> int:
+        """
+        :return: the number of generations the pattern was advanced by
+        """
+        return self.__generation
+
+    def get_population(self) -> int:
+        """
+        :return: the number of living cells
+        """
+        return self.__root.population
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the engine in B/S notation
+        """
+        return str(self.__rule)
+
+    def __join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        """ Returns the canonical node made of the four quadrants. """
+        key = (id(nw), id(ne), id(sw), id(se))
+        node = self.__nodes.get(key)
+        if node is None:
+            node = Node(nw.level + 1, nw, ne, sw, se,
+                        nw.population + ne.population + sw.population + se.population)
+            self.__nodes[key] = node
+        return node
+
+    def __zero(self, level: int) -> Node:
+        """ Returns the canonical empty node of the given level. """
+        while len(self.__zeros) <= level:
+            z = self.__zeros[-1]
+            self.__zeros.append(self.__join(z, z, z, z))
+        return self.__zeros[level]
+
+    def __centre(self, m: Node) -> Node:
+        """ Returns a node one level higher with m in its centre. """
+        z = self.__zero(m.level - 1)
+        return self.__join(self.__join(z, z, z, m.nw), self.__join(z, z, m.ne, z),
+                           self.__join(z, m.sw, z, z), self.__join(m.se, z, z, z))
+
+    def __inner(self, m: Node) -> Node:
+        """ Returns the central node one level lower than m. """
+        return self.__join(m.nw.se, m.ne.sw, m.sw.ne, m.se.nw)
+
+    def __step(self, node: Node, j: int) -> Node:
+        """
+        Advances a centered node by 2^j generations, padding it so that the pattern cannot escape and
+        cropping empty borders afterwards.
+        """
+        while node.level < j + 1:
+            node = self.__centre(node)
+        node = self.__successor(self.__centre(self.__centre(node)), j)
+        while node.level > 3 and self.__inner(node).population == node.population:
+            node = self.__inner(node)
+        return node
+
+    def __successor(self, m: Node, j: int) -> Node:
+        """
+        Returns the central node one level lower than m advanced by 2^j generations (j is capped at level - 2).
+        """
+        if m.population == 0:
+            return m.nw
+        j = min(j, m.level - 2)
+        key = (m, j)
+        result = self.__results.get(key)
+        if result is not None:
+            self.__results.move_to_end(key)
+            return result
+
+        if m.level == 2:
+            result = self.__life_4x4(m)
+        else:
+            c1 = self.__successor(self.__join(m.nw.nw, m.nw.ne, m.nw.sw, m.nw.se), j)
+            c2 = self.__successor(self.__join(m.nw.ne, m.ne.nw, m.nw.se, m.ne.sw), j)
+            c3 = self.__successor(self.__join(m.ne.nw, m.ne.ne, m.ne.sw, m.ne.se), j)
+            c4 = self.__successor(self.__join(m.nw.sw, m.nw.se, m.sw.nw, m.sw.ne), j)
+            c5 = self.__successor(self.__join(m.nw.se, m.ne.sw, m.sw.ne, m.se.nw), j)
+            c6 = self.__successor(self.__join(m.ne.sw, m.ne.se, m.se.nw, m.se.ne), j)
+            c7 = self.__successor(self.__join(m.sw.nw, m.sw.ne, m.sw.sw, m.sw.se), j)
+            c8 = self.__successor(self.__join(m.sw.ne, m.se.nw, m.sw.se, m.se.sw), j)
+            c9 = self.__successor(self.__join(m.se.nw, m.se.ne, m.se.sw, m.se.se), j)
+            if j < m.level - 2:
+                # the nine sub-results already advanced 2^j generations, only their centres are needed
+                result = self.__join(self.__join(c1.se, c2.sw, c4.ne, c5.nw),
+                                     self.__join(c2.se, c3.sw, c5.ne, c6.nw),
+                                     self.__join(c4.se, c5.sw, c7.ne, c8.nw),
+                                     self.__join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                result = self.__join(self.__successor(self.__join(c1, c2, c4, c5), j),
+                                     self.__successor(self.__join(c2, c3, c5, c6), j),
+                                     self.__successor(self.__join(c4, c5, c7, c8), j),
+                                     self.__successor(self.__join(c5, c6, c8, c9), j))
+
+        self.__results[key] = result
+        if len(self.__results) > self.__cache_size:
+            self.__results.popitem(last=False)
+        return result
+
+    def __life_4x4(self, m: Node) -> Node:
+        """ Computes the central 2x2 cells of a 4x4 node one generation ahead. """
+        cells = [[m.nw.nw, m.nw.ne, m.ne.nw, m.ne.ne],
+                 [m.nw.sw, m.nw.se, m.ne.sw, m.ne.se],
+                 [m.sw.nw, m.sw.ne, m.se.nw, m.se.ne],
+                 [m.sw.sw, m.sw.se, m.se.sw, m.se.se]]
+        birth = self.__rule.get_birth()
+        survival = self.__rule.get_survival()
+        centre = []
+        for y in (1, 2):
+            for x in (1, 2):
+                neighbors = 0
+                for dy in (-1, 0, 1):
+                    for dx in (-1, 0, 1):
+                        if dx or dy:
+                            neighbors += cells[y + dy][x + dx].population
+                if survival[neighbors] if cells[y][x].population else birth[neighbors]:
+                    centre.append(self.__on)
+                else:
+                    centre.append(self.__off)
+        return self.__join(centre[0], centre[1], centre[2], centre[3])
+
+    def __build(self, cells: [(int, int)], level: int, x0: int, y0: int) -> Node:
+        """ Builds the node of the given level whose top left corner is (x0, y0). """
+        if not cells:
+            return self.__zero(level)
+        if level == 0:
+            return self.__on
+        half = 1 << (level - 1)
+        quadrants = ([], [], [], [])
+        for c in cells:
+            quadrants[(c[0] >= x0 + half) + 2 * (c[1] >= y0 + half)].append(c)
+        return self.__join(self.__build(quadrants[0], level - 1, x0, y0),
+                           self.__build(quadrants[1], level - 1, x0 + half, y0),
+                           self.__build(quadrants[2], level - 1, x0, y0 + half),
+                           self.__build(quadrants[3], level - 1, x0 + half, y0 + half))
+
+    def __collect(self, node: Node, x0: int, y0: int, result: [(int, int)]):
+        """ Appends the coordinates of the living cells of a node whose top left corner is (x0, y0). """
+        if node.population == 0:
+            return
+        if node.level == 0:
+            result.append((x0, y0))
+            return
+        half = 1 << (node.level - 1)
+        self.__collect(node.nw, x0, y0, result)
+        self.__collect(node.ne, x0 + half, y0, result)
+        self.__collect(node.sw, x0, y0 + half, result)
+        self.__collect(node.se, x0 + half, y0 + half, result)
@@ -0,0 +1,166 @@
+from array import array
+from collections import deque
+
+
+class History:
+    """
+    A class remembering the recent changes of a board so that they can be undone and redone.
+    Every change (a generation, a skip or an edit of the user) is stored as the row-major indices of the cells
+    born and of the cells that died, packed into arrays of 4 byte integers, so an entry costs memory in
+    proportion to the cells it changed instead of a copy of the board. Undoing or redoing an entry only touches
+    those cells. The undo entries form a ring buffer: once the entries take more than the memory budget, the
+    oldest ones are dropped.
+    Cells outside the board (left of or above it, or right of it, as on an unbounded plane) have no row-major
+    index; a list of cells holding one of them is stored as signed (x, y) pairs instead.
+
+    Parameters
+    ----------
+    __width: width of the board (used to convert coordinates to row-major indices)
+    __undo: deque of (born, died) arrays, oldest first; an array is either row-major indices (typecode 'I') or
+        interleaved x, y coordinates (typecode 'i')
+    __redo: list of (born, died) index arrays undone since the last recorded change, most recent last
+    __size: number of bytes held by the arrays of both stacks
+    __max_bytes: memory budget of the arrays
+
+    Methods
+    -------
+    __init__(width, max_bytes):
+        Creates an empty history for a board of the given width.
+
+    record(born, died):
+        remembers a change and forgets the changes that were undone before it
+
+    undo():
+        returns the change to revert and moves it to the redo stack
+
+    redo():
+        returns the change to apply again and moves it back to the undo stack
+
+    clear():
+        forgets every change
+
+    can_undo():
+        returns True if there is a change to undo
+
+    can_redo():
+        returns True if there is a change to redo
+
+    get_size():
+        returns the number of bytes held by the stored changes
+    """
+
+    def __init__(self, width: int, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Creates an empty history.
+        :param width: width of the board
+        :param max_bytes: memory budget of the stored changes; the oldest changes are dropped once it is exceeded
+        """
+        if width is None or width <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        if max_bytes is None or max_bytes <= 0:
+            raise ValueError('Invalid History Size!')
+        self.__width = width
+        self.__max_bytes = max_bytes
+        self.__undo = deque()
+        self.__redo = []
+        self.__size = 0
+
+    def record(self, born: [(int, int)], died: [(int, int)]):
+        """
+        Remembers a change. Changes which were undone can no longer be redone afterwards.
+        Changes without any born or dead cell are ignored.
+        :param born: (x, y) coordinates of the cells that came to life
+        :param died: (x, y) coordinates of the cells that died
+        """
+        if not born and not died:
+            return
+        entry = (self.__encode(born), self.__encode(died))
+        for (b, d) in self.__redo:
+            self.__size -= self.__bytes(b, d)
+        self.__redo = []
+        self.__undo.append(entry)
+        self.__size += self.__bytes(*entry)
+        # the newest change is always kept, even when it alone exceeds the budget
+        while self.__size > self.__max_bytes and len(self.__undo) > 1:
+            self.__size -= self.__bytes(*self.__undo.popleft())
+
+    def undo(self) -> ([(int, int)], [(int, int)]):
+        """
+        :return: (born, died) coordinates of the most recent change, which the caller reverts by killing the born
+            cells and reviving the dead ones; None if there is nothing to undo
+        """
+        if not self.__undo:
+            return None
+        entry = self.__undo.pop()
+        self.__redo.append(entry)
+        return self.__coordinates(*entry)
+
+    def redo(self) -> ([(int, int)], [(int, int)]):
+        """
+        :return: (born, died) coordinates of the most recently undone change, which the caller applies again;
+            None if there is nothing to redo
+        """
+        if not self.__redo:
+            return None
+        entry = self.__redo.pop()
+        self.__undo.append(entry)
+        return self.__coordinates(*entry)
+
+    def clear(self):
+        """ Forgets every change. """
+        self.__undo = deque()
+        self.__redo = []
+        self.__size = 0
+
+    def can_undo(self) -> bool:
+        """
+        :return: True if there is a change to undo
+        """
+        return len(self.__undo) > 0
+
+    def can_redo(self) -> bool:
+        """
+        :return: True if there is a change to redo
+        """
+        return len(self.__redo) > 0
+
+    def get_size(self) -> int:
+        """
+        :return: the number of bytes held by the index arrays of the stored changes
+        """
+        return self.__size
+
+    def __encode(self, cells: [(int, int)]) -> array:
+        """
+        :param cells: (x, y) coordinates of cells
+        :return: row-major indices of the cells; interleaved x, y coordinates if a cell lies outside the board
+        """
+        width = self.__width
+        if all(0 <= x < width and y >= 0 for (x, y) in cells):
+            return array('I', [y * width + x for (x, y) in cells])
+        return array('i', [c for cell in cells for c in cell])
+
+    def __coordinates(self, born: array, died: array) -> ([(int, int)], [(int, int)]):
+        """
+        :param born: encoded born cells
+        :param died: encoded dead cells
+        :return: (born, died) lists of (x, y) coordinates
+        """
+        return self.__decode(born), self.__decode(died)
+
+    def __decode(self, cells: array) -> [(int, int)]:
+        """
+        :param cells: row-major indices or interleaved x, y coordinates of cells
+        :return: list of (x, y) coordinates
+        """
+        if cells.typecode == 'i':
+            return list(zip(cells[0::2], cells[1::2]))
+        width = self.__width
+        return [(i % width, i // width) for i in cells]
+
+    @staticmethod
+    def __bytes(born: array, died: array) -> int:
+        """
+        :return: the number of bytes held by the arrays of a change
+        """
+        return len(born) * born.itemsize + len(died) * died.itemsize
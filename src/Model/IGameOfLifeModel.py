@@ -12,6 +12,9 @@ class IGameOfLifeModel(abc.ABC):
         Living cells that are surrounded by <2 or >3 living cells die.
         Dead cells that are surrounded by exactly 3 living cells are born.
 
+    step(n):
+        updates the game model by n iterations of the game in a single call
+
     get_width():
         returns the width of the game grid
 
@@ -21,11 +24,44 @@ class IGameOfLifeModel(abc.ABC):
     get_grid():
         returns a copy of the game grid
 
+    get_grid_view():
+        returns a read-only view of the game grid which may share memory with the model
+
     toggle_cell(x, y):
         changes the cells with the coordinates, x and y, from dead to alive or from alive to dead
 
+    clear():
+        kills every cell of the grid
+
+    set_cells(coordinates, value):
+        sets the state of several cells at once
+
+    stamp(pattern, x, y):
+        brings the cells of a pattern to life with the pattern's top left corner at x, y
+
+    population():
+        returns the number of living cells
+
+    bounding_box():
+        returns the smallest rectangle holding all living cells
+
+    live_cells():
+        returns the coordinates of the living cells
+
+    track_changes(enabled):
+        starts or stops recording the cells changed by every update
+
+    get_changes():
+        returns the cells born and the cells that died during the last update (None unless the model tracks them)
+
+    get_cycle():
+        returns the period of the board if it repeats a recent state (None unless the model tracks its states)
+
     """
 
+    # no instance dictionary of its own, so that models declaring __slots__ do not get one either
+    __slots__ = ()
+
     @abc.abstractmethod
     def update_state(self):
         """
@@ -35,6 +71,17 @@ class IGameOfLifeModel(abc.ABC):
         """
         pass
 
+    def step(self, n: int):
+        """
+        updates the game model by n iterations of the game.
+        Implementations are expected to override this with a loop that avoids per-generation overhead.
+        :param n: number of iterations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        for i in range(n):
+            self.update_state()
+
     @abc.abstractmethod
     def get_width(self) -> int:
         """
@@ -56,6 +103,15 @@ class IGameOfLifeModel(abc.ABC):
         """
         pass
 
+    def get_grid_view(self):
+        """
+        Read-only access to the grid for callers which only iterate or index it (view[y][x] is truthy for living
+        cells). Implementations return a view that is not copied, so it must not be modified and may change
+        with the model; this default falls back to a copy.
+        :return: read-only view of the grid
+        """
+        return self.get_grid()
+
     @abc.abstractmethod
     def toggle_cell(self, x: int, y: int):
         """
@@ -64,3 +120,104 @@ class IGameOfLifeModel(abc.ABC):
         :param y: y coordinate of cell to toggle
         """
         pass
+
+    def clear(self):
+        """
+        Kills every cell of the grid.
+        Implementations are expected to override this with a single write instead of toggling cell by cell.
+        """
+        grid = self.get_grid()
+        for y in range(len(grid)):
+            for x in range(len(grid[y])):
+                if grid[y][x]:
+                    self.toggle_cell(x, y)
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells at once. All coordinates are validated before any cell is changed.
+        Implementations are expected to override this with a single vectorized write.
+        :param coordinates: list of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        width = self.get_width()
+        height = self.get_height()
+        cells = set()
+        for (x, y) in coordinates:
+            if x is None or y is None or x < 0 or y < 0 or x >= width or y >= height:
+                raise ValueError('Invalid Cell Coordinates!')
+            cells.add((x, y))
+        grid = self.get_grid()
+        for (x, y) in cells:
+            if bool(grid[y][x]) != bool(value):
+                self.toggle_cell(x, y)
+
+    def stamp(self, pattern: [(int, int)], x: int, y: int):
+        """
+        Brings the cells of a pattern to life; cells outside the pattern keep their state.
+        :param pattern: list of (x, y) coordinates of the living cells of the pattern (as in the structure library)
+        :param x: x coordinate of the top left corner of the pattern in the grid
+        :param y: y coordinate of the top left corner of the pattern in the grid
+        """
+        if x is None or y is None:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.set_cells([(c[0] + x, c[1] + y) for c in pattern], True)
+
+    def population(self) -> int:
+        """
+        Implementations are expected to override this with a count maintained as cells change.
+        :return: the number of living cells
+        """
+        return sum(1 for row in self.get_grid_view() for cell in row if cell)
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        Implementations are expected to override this with a box maintained as cells change.
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        rows = []
+        columns = set()
+        for y, row in enumerate(self.get_grid_view()):
+            cells = [x for x, cell in enumerate(row) if cell]
+            if cells:
+                rows.append(y)
+                columns.update(cells)
+        if not rows:
+            return None
+        return min(columns), rows[0], max(columns), rows[-1]
+
+    def track_changes(self, enabled: bool = True):
+        """
+        Models which know the cells they flip only record them while tracking is enabled (e.g. while a history is
+        attached), so that plain play does not pay for the changes. Tracking starts disabled; models which do not
+        report their changes ignore this.
+        :param enabled: True to record the changes of every later update_state or step call, False to stop
+        """
+        pass
+
+    def live_cells(self) -> [(int, int)]:
+        """
+        Only the bounding box of the living cells is read. Models whose cells may lie outside the grid (on an
+        unbounded plane) are expected to override this.
+        :return: list of (x, y) coordinates of the living cells
+        """
+        box = self.bounding_box()
+        if box is None:
+            return []
+        grid = self.get_grid_view()
+        return [(x, y) for y in range(box[1], box[3] + 1) for x in range(box[0], box[2] + 1) if grid[y][x]]
+
+    def get_changes(self) -> ([(int, int)], [(int, int)]):
+        """
+        Models which know the cells they flip report the changes of the last update_state or step call here
+        (a cell which changed back within a step call is not reported). Edits of the user are not included.
+        :return: (born, died) lists of (x, y) coordinates; None if the model does not track its changes or tracking
+            is disabled (see track_changes)
+        """
+        return None
+
+    def get_cycle(self) -> (int, int):
+        """
+        Models which hash their states report repeating boards here.
+        :return: (period, generation) if the current board repeats one of the recent boards; None otherwise
+        """
+        return None
@@ -0,0 +1,315 @@
+from array import array
+from Model.CycleDetector import CycleDetector
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.PopulationTracker import PopulationTracker
+from Model.Rule import Rule
+
+
+class IncrementalGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model with persistent neighbour counts.
+    Every birth or death (including toggles made by the user) adjusts the counts of the eight surrounding cells
+    only, and the cells whose state or count changed form the frontier which is the only part of the board
+    evaluated in the next generation. Every cell outside the frontier is known to keep its state.
+    Cells outside the board are always dead (same edge rule as GameOfLifeModel). Rules with B0 are not supported,
+    since dead cells with no living neighbours would change without ever entering the frontier.
+
+    Parameters
+    ----------
+    __cells: row-major bytearray of cell states (1 alive, 0 dead)
+    __rows: read-only memoryviews of the rows of __cells handed out by get_grid_view
+    __counts: row-major bytearray holding the number of living neighbours of every cell
+    __frontier: set of indices of the cells that need to be evaluated in the next generation
+    __width: width of the game grid (in cells)
+    __height: height of the game grid (in cells)
+    __table: lookup table of the rule indexed by 9 * state + neighbours
+    __rule: the rule of the game
+    __cycles: CycleDetector hashing the states of the grid; None when cycle detection is disabled
+    __tracker: PopulationTracker counting the living cells and keeping their bounding box
+    __changes: array('I') of the row-major indices of the cells flipped by the last update_state or step call;
+        None while change tracking is disabled
+
+    Methods
+    -------
+    __init__(width, height, rule, cycle_history):
+        Constructor which initializes the IncrementalGameOfLifeModel Object with a specified grid width and height
+
+    toggle_cell(x, y):
+        switches the status of the specified cell
+
+    clear():
+        kills every cell of the grid in place
+
+    set_cells(coordinates, value):
+        sets the state of several cells, flipping only the cells which change
+
+    update_state():
+        updates the state of the game based on the Game of Life Rules
+
+    step(n):
+        updates the state of the game n times
+
+    get_width():
+        returns width of game grid
+
+    get_height():
+        returns height of the game grid
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the game grid
+
+    get_grid_view():
+        returns a read-only view of the game grid which is not copied
+
+    population():
+        returns the number of living cells
+
+    bounding_box():
+        returns the smallest rectangle holding all living cells
+
+    track_changes(enabled):
+        starts or stops recording the cells changed by every update
+
+    get_changes():
+        returns the cells born and the cells that died during the last update (None unless tracking is enabled)
+
+
+    get_rule():
+        returns the rulestring of the game
+
+    get_frontier_size():
+        returns the number of cells that will be evaluated in the next generation
+
+    get_cycle():
+        returns the period of the grid if it repeats one of the recent states
+
+    __flip(index):
+        switches the state of a cell and updates the counts of its neighbours and the frontier
+    """
+
+    def __init__(self, width: int, height: int, rule: str = 'B3/S23', cycle_history: int = 0):
+        """
+        Initializes the IncrementalGameOfLifeModel Object
+        :param width: width of the game grid
+        :param height: height of the game grid
+        :param rule: rulestring in B/S notation (rules with B0 are not supported)
+        :param cycle_history: number of recent states searched for repetitions (0 disables cycle detection)
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        self.__rule = Rule(rule)
+        if self.__rule.get_birth()[0]:
+            raise ValueError('Invalid Rule!')
+        self.__table = self.__rule.get_table()
+        self.__width = width
+        self.__height = height
+        self.__cells = bytearray(width * height)
+        cells = memoryview(self.__cells).toreadonly()
+        self.__rows = tuple(cells[y * width:(y + 1) * width] for y in range(height))
+        self.__counts = bytearray(width * height)
+        self.__frontier = set()
+        self.__cycles = CycleDetector(width, height, cycle_history) if cycle_history else None
+        self.__tracker = PopulationTracker(width, height)
+        self.__changes = None
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.__flip(y * self.__width + x)
+        if self.__cycles is not None:
+            self.__cycles.forget()
+
+    def clear(self):
+        """
+        Kills every cell of the grid. The cells and the neighbour counts are zeroed in place, so that grid views
+        stay valid; only the living cells are visited, to take them out of the cycle hash.
+        """
+        if self.__cycles is not None:
+            cells = self.__cells
+            i = cells.find(1)
+            while i >= 0:
+                self.__cycles.flip(i)
+                i = cells.find(1, i + 1)
+            self.__cycles.forget()
+        self.__cells[:] = bytes(len(self.__cells))
+        self.__counts[:] = bytes(len(self.__counts))
+        self.__frontier = set()
+        self.__tracker.clear()
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells at once. All coordinates are validated before any cell is changed, and
+        only the cells whose state changes are flipped (with their neighbour counts), without reading the grid.
+        :param coordinates: list of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        width = self.__width
+        height = self.__height
+        indices = set()
+        for (x, y) in coordinates:
+            if x is None or y is None or x < 0 or y < 0 or x >= width or y >= height:
+                raise ValueError('Invalid Cell Coordinates!')
+            indices.add(y * width + x)
+        state = 1 if value else 0
+        cells = self.__cells
+        for i in indices:
+            if cells[i] != state:
+                self.__flip(i)
+        if self.__cycles is not None:
+            self.__cycles.forget()
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        cells = self.__cells
+        counts = self.__counts
+        table = self.__table
+        toggle_list = []
+        for i in self.__frontier:
+            alive = cells[i]
+            if table[9 * alive + counts[i]] != alive:
+                toggle_list.append(i)
+        self.__frontier = set()
+        for i in toggle_list:
+            self.__flip(i)
+        if self.__cycles is not None:
+            self.__cycles.record()
+        if self.__changes is not None:
+            self.__changes = array('I', toggle_list)
+
+    def step(self, n: int):
+        """
+        Updates the state of the game n times. The cells flipped by the generations are combined, so that
+        get_changes reports the difference between the first and the last board.
+        :param n: number of generations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        if self.__changes is None:
+            for i in range(n):
+                self.update_state()
+            return
+        changes = set()
+        for i in range(n):
+            self.update_state()
+            changes.symmetric_difference_update(self.__changes)
+        self.__changes = array('I', changes)
+
+    def __flip(self, index: int):
+        """
+        Switches the state of a cell, adjusts the counts of its neighbours and adds them to the frontier.
+        :param index: row-major index of the cell
+        """
+        width = self.__width
+        alive = self.__cells[index] ^ 1
+        self.__cells[index] = alive
+        if self.__cycles is not None:
+            self.__cycles.flip(index)
+        x = index % width
+        y = index // width
+        self.__tracker.flip(x, y, alive)
+        start_x = x - 1 if x > 0 else x
+        end_x = x + 1 if x < width - 1 else x
+        start_y = y - 1 if y > 0 else y
+        end_y = y + 1 if y < self.__height - 1 else y
+        counts = self.__counts
+        frontier = self.__frontier
+        for row in range(start_y * width, end_y * width + 1, width):
+            for i in range(row + start_x, row + end_x + 1):
+                frontier.add(i)
+                if i != index:
+                    if alive:
+                        counts[i] += 1
+                    else:
+                        counts[i] -= 1
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the grid
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the grid
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual grid
+        :return: copy of the array as a list of list of booleans
+        """
+        cells = self.__cells
+        width = self.__width
+        return [[c == 1 for c in cells[y * width:(y + 1) * width]] for y in range(self.__height)]
+
+    def get_grid_view(self) -> (memoryview,):
+        """
+        The rows share memory with the cells: they are not copied and reflect every later change.
+        :return: tuple of read-only memoryviews of the rows, holding 1 for living and 0 for dead cells
+        """
+        return self.__rows
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (kept up to date as cells change, no scan of the grid)
+        """
+        return self.__tracker.get_population()
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        return self.__tracker.get_bounding_box()
+
+    def track_changes(self, enabled: bool = True):
+        """
+        The changes are only recorded while tracking is enabled, so that plain play does not pay for them.
+        :param enabled: True to record the changes of every later update_state or step call, False to stop
+        """
+        self.__changes = array('I') if enabled else None
+
+    def get_changes(self) -> ([(int, int)], [(int, int)]):
+        """
+        :return: (born, died) lists of (x, y) coordinates of the cells changed by the last update_state or step call;
+            None while change tracking is disabled
+        """
+        if self.__changes is None:
+            return None
+        width = self.__width
+        born = []
+        died = []
+        for i in self.__changes:
+            (born if self.__cells[i] else died).append((i % width, i // width))
+        return born, died
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
+
+    def get_frontier_size(self) -> int:
+        """
+        :return: the number of cells which will be evaluated in the next generation
+        """
+        return len(self.__frontier)
+
+    def get_cycle(self) -> (int, int):
+        """
+        Only available when the model was created with a cycle history.
+        :return: (period, generation) if the grid repeats one of the recent states; None otherwise
+        """
+        if self.__cycles is None:
+            return None
+        return self.__cycles.get_cycle()
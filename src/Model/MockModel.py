@@ -24,6 +24,10 @@ class MockModel(IGameOfLifeModel):
         self.__call_log += "update_state called;"
         return
 
+    def step(self, n: int):
+        self.__call_log += "step called (n:" + str(n) + ");"
+        return
+
     def get_width(self):
         self.__call_log += "get_width called;"
         return self.__width
@@ -42,10 +46,41 @@ class MockModel(IGameOfLifeModel):
             grid.append(row)
         return grid
 
+    def get_grid_view(self):
+        self.__call_log += "get_grid_view called;"
+        return [[False] * self.__width for i in range(self.__height)]
 
     def toggle_cell(self, x: int, y: int):
         self.__call_log += "toggle_cell called (x:" + str(x) + ", y:" + str(y) + ");"
         return
 
+    def clear(self):
+        self.__call_log += "clear called;"
+        return
+
+    def set_cells(self, coordinates, value: bool = True):
+        self.__call_log += "set_cells called;"
+        return
+
+    def stamp(self, pattern, x: int, y: int):
+        self.__call_log += "stamp called (x:" + str(x) + ", y:" + str(y) + ");"
+        return
+
+    def population(self):
+        self.__call_log += "population called;"
+        return 0
+
+    def bounding_box(self):
+        self.__call_log += "bounding_box called;"
+        return None
+
+    def get_changes(self):
+        self.__call_log += "get_changes called;"
+        return None
+
+    def get_cycle(self):
+        self.__call_log += "get_cycle called;"
+        return None
+
     def get_call_log(self):
         return self.__call_log
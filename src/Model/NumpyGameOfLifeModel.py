@@ -0,0 +1,421 @@
+import numpy as np
+from Model.CycleDetector import CycleDetector
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.Rule import Rule
+
+
+def count_neighbors(padded: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Sums the eight shifted views of a zero-padded grid into out. Leading axes are treated as a stack of
+    independent grids.
+    :param padded: (height + 2) x (width + 2) array of 0/1 cells surrounded by a border of dead cells
+    :param out: height x width array of unsigned integers that receives the neighbour counts
+    :return: out
+    """
+    h = padded.shape[-2] - 2
+    w = padded.shape[-1] - 2
+    np.add(padded[..., 0:h, 0:w], padded[..., 0:h, 1:w + 1], out=out)
+    out += padded[..., 0:h, 2:w + 2]
+    out += padded[..., 1:h + 1, 0:w]
+    out += padded[..., 1:h + 1, 2:w + 2]
+    out += padded[..., 2:h + 2, 0:w]
+    out += padded[..., 2:h + 2, 1:w + 1]
+    out += padded[..., 2:h + 2, 2:w + 2]
+    return out
+
+
+def wrap_edges(padded: np.ndarray) -> np.ndarray:
+    """
+    Fills the border of a padded grid with the opposite edges of the grid, which joins it into a torus.
+    Leading axes are treated as a stack of independent grids.
+    :param padded: (height + 2) x (width + 2) array whose inner region holds the grid
+    :return: padded
+    """
+    padded[..., 0, 1:-1] = padded[..., -2, 1:-1]
+    padded[..., -1, 1:-1] = padded[..., 1, 1:-1]
+    # columns are copied after the rows so that the corners receive the diagonally opposite cells
+    padded[..., 0] = padded[..., -2]
+    padded[..., -1] = padded[..., 1]
+    return padded
+
+
+def cell_indices(coordinates, width: int, height: int) -> (np.ndarray, np.ndarray):
+    """
+    Converts a list (or n x 2 array) of (x, y) cell coordinates into index arrays, validating all of them at once.
+    :param coordinates: the coordinates of the cells
+    :param width: width of the grid
+    :param height: height of the grid
+    :return: (ys, xs) arrays of row and column indices
+    """
+    try:
+        cells = np.asarray(coordinates, dtype=np.int64).reshape(-1, 2)
+    except (TypeError, ValueError):
+        raise ValueError('Invalid Cell Coordinates!')
+    xs = cells[:, 0]
+    ys = cells[:, 1]
+    if len(cells) and (xs.min() < 0 or ys.min() < 0 or xs.max() >= width or ys.max() >= height):
+        raise ValueError('Invalid Cell Coordinates!')
+    return ys, xs
+
+
+def grid_bounds(cells: np.ndarray) -> (int, int, int, int):
+    """
+    Finds the bounding box of the living cells with two reductions instead of visiting every cell in Python.
+    :param cells: 2d array of cells (non-zero alive)
+    :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+    """
+    rows = np.flatnonzero(cells.any(axis=1))
+    if len(rows) == 0:
+        return None
+    columns = np.flatnonzero(cells[rows[0]:rows[-1] + 1].any(axis=0))
+    return int(columns[0]), int(rows[0]), int(columns[-1]), int(rows[-1])
+
+
+def cell_keys(salt: int, count: int) -> np.ndarray:
+    """
+    Derives the Zobrist keys of the cells of a CycleDetector at once: splitmix64(index ^ salt) for every index, with
+    the multiplications wrapping around in uint64 arithmetic.
+    :param salt: the salt of the detector
+    :param count: number of cells
+    :return: array of the count uint64 keys in row-major order
+    """
+    z = np.arange(count, dtype=np.uint64)
+    z ^= np.uint64(salt)
+    z += np.uint64(0x9E3779B97F4A7C15)
+    z ^= z >> np.uint64(30)
+    z *= np.uint64(0xBF58476D1CE4E5B9)
+    z ^= z >> np.uint64(27)
+    z *= np.uint64(0x94D049BB133111EB)
+    z ^= z >> np.uint64(31)
+    return z
+
+
+def apply_rule(rule: Rule, neighbors: np.ndarray, cells: np.ndarray, out: np.ndarray, kept: np.ndarray,
+               scratch: np.ndarray) -> np.ndarray:
+    """
+    Computes the next state of cells from their neighbour counts with one comparison per neighbour count of the
+    rule that leads to a living cell. out may be the cells array itself: the terms which depend on the current
+    state of the cells are evaluated before out is written.
+    :param rule: the rule of the game
+    :param neighbors: array of neighbour counts
+    :param cells: array of 0/1 cells of the same shape
+    :param out: uint8 array of the same shape that receives the next state
+    :param kept: scratch array of booleans of the same shape
+    :param scratch: scratch array of booleans of the same shape
+    :return: out
+    """
+    independent = []
+    has_kept = False
+    for (n, born, survives) in rule.get_minterms():
+        if born and survives:
+            independent.append(n)
+            continue
+        target = scratch if has_kept else kept
+        np.equal(neighbors, n, out=target)
+        if survives:
+            np.logical_and(target, cells, out=target)
+        else:
+            # the count matches and the cell is dead
+            np.greater(target, cells, out=target)
+        if has_kept:
+            np.logical_or(kept, scratch, out=kept)
+        has_kept = True
+    if independent:
+        np.equal(neighbors, independent[0], out=out)
+        for n in independent[1:]:
+            np.equal(neighbors, n, out=scratch)
+            np.logical_or(out, scratch, out=out)
+        if has_kept:
+            np.logical_or(out, kept, out=out)
+    elif has_kept:
+        np.copyto(out, kept)
+    else:
+        out.fill(0)
+    return out
+
+
+class NumpyGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model on top of a NumPy array.
+    Neighbour counts are computed for the whole grid at once by summing shifted views of a grid which is
+    surrounded by a one cell border, and the rule is applied with one comparison per neighbour count of its
+    lookup table. On a bounded grid the border stays dead (same edge rule as GameOfLifeModel);
+    on a torus it is refilled from the opposite edges before every generation.
+
+    Parameters
+    ----------
+    __padded: (height + 2) x (width + 2) array of uint8 cells; the outer ring is the border of the grid
+    __grid: view of the inner height x width region of __padded
+    __view: read-only view of __grid handed out by get_grid_view
+    __neighbors: preallocated height x width buffer holding neighbour counts
+    __kept: preallocated height x width buffer of booleans
+    __scratch: preallocated height x width buffer of booleans
+    __width: width of the game grid (in cells)
+    __height: height of the game grid (in cells)
+    __topology: 'bounded' or 'torus'
+    __rule: the rule of the game
+    __cycles: CycleDetector hashing the states of the grid; None when cycle detection is disabled
+    __keys: height x width array of the Zobrist keys of the cells (only with cycle detection)
+    __previous: copy of the previous generation (only with cycle detection)
+    __changed: height x width buffer marking the cells that changed (only with cycle detection)
+    __start: copy of the grid before the last update_state or step call (only while changes are tracked)
+    __changes: uint32 array of the row-major indices of the cells changed by the last update_state or step call;
+        None while change tracking is disabled
+
+    Methods
+    -------
+    __init__(width, height, topology, rule, cycle_history):
+        Constructor which initializes the NumpyGameOfLifeModel Object with a specified grid width, height, topology
+        and rule
+
+    toggle_cell(x, y):
+        switches the status of the specified cell
+
+    update_state():
+        updates the state of the game based on the Game of Life Rules
+
+    step(n):
+        updates the state of the game n times reusing the preallocated buffers
+
+    get_width():
+        returns width of game grid
+
+    get_height():
+        returns height of the game grid
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the game grid
+
+    get_grid_view():
+        returns a read-only view of the game grid which is not copied
+
+    clear():
+        kills every cell of the grid with a single write
+
+    set_cells(coordinates, value):
+        sets the state of several cells with a single vectorized write
+
+    stamp(pattern, x, y):
+        brings the cells of a pattern to life at the given offset
+
+    population():
+        returns the number of living cells
+
+    bounding_box():
+        returns the smallest rectangle holding all living cells
+
+    track_changes(enabled):
+        starts or stops recording the cells changed by every update
+
+    get_changes():
+        returns the cells born and the cells that died during the last update (None unless tracking is enabled)
+
+    get_topology():
+        returns the name of the topology of the grid
+
+    get_rule():
+        returns the rulestring of the game
+
+    get_cycle():
+        returns the period of the grid if it repeats one of the recent states
+    """
+
+    def __init__(self, width: int, height: int, topology: str = 'bounded', rule: str = 'B3/S23',
+                 cycle_history: int = 0):
+        """
+        Initializes the NumpyGameOfLifeModel Object
+        :param width: width of the game grid
+        :param height: height of the game grid
+        :param topology: 'bounded' for a grid surrounded by dead cells or 'torus' for a grid whose edges wrap around
+        :param rule: rulestring in B/S notation
+        :param cycle_history: number of recent states searched for repetitions (0 disables cycle detection)
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        if topology not in ('bounded', 'torus'):
+            raise ValueError('Invalid Topology!')
+        self.__width = width
+        self.__height = height
+        self.__topology = topology
+        self.__rule = Rule(rule)
+        self.__padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        self.__grid = self.__padded[1:height + 1, 1:width + 1]
+        self.__view = self.__grid.view()
+        self.__view.flags.writeable = False
+        self.__neighbors = np.zeros((height, width), dtype=np.uint8)
+        self.__kept = np.zeros((height, width), dtype=bool)
+        self.__scratch = np.zeros((height, width), dtype=bool)
+        self.__cycles = CycleDetector(width, height, cycle_history) if cycle_history else None
+        if self.__cycles is not None:
+            self.__keys = cell_keys(self.__cycles.get_salt(), width * height).reshape(height, width)
+            self.__previous = np.zeros((height, width), dtype=np.uint8)
+            self.__changed = np.zeros((height, width), dtype=bool)
+        self.__start = None
+        self.__changes = None
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.__grid[y, x] ^= 1
+        if self.__cycles is not None:
+            self.__cycles.flip(y * self.__width + x)
+            self.__cycles.forget()
+
+    def clear(self):
+        """ Kills every cell of the grid. """
+        if self.__cycles is not None:
+            self.__cycles.apply(int(np.bitwise_xor.reduce(self.__keys[self.__grid == 1])))
+            self.__cycles.forget()
+        self.__grid.fill(0)
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells with one fancy-indexed write. All coordinates are validated first.
+        :param coordinates: list (or n x 2 array) of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        ys, xs = cell_indices(coordinates, self.__width, self.__height)
+        if self.__cycles is not None:
+            # duplicated coordinates must only flip a key once
+            indices = np.unique(ys * self.__width + xs)
+            changed = indices[self.__grid[indices // self.__width, indices % self.__width] != value]
+            self.__cycles.apply(int(np.bitwise_xor.reduce(self.__keys.ravel()[changed])))
+            self.__cycles.forget()
+        self.__grid[ys, xs] = value
+
+    def stamp(self, pattern: [(int, int)], x: int, y: int):
+        """
+        Brings the cells of a pattern to life; cells outside the pattern keep their state.
+        :param pattern: list of (x, y) coordinates of the living cells of the pattern (as in the structure library)
+        :param x: x coordinate of the top left corner of the pattern in the grid
+        :param y: y coordinate of the top left corner of the pattern in the grid
+        """
+        if x is None or y is None:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.set_cells(np.asarray(pattern, dtype=np.int64).reshape(-1, 2) + (x, y), True)
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        self.step(1)
+
+    def step(self, n: int):
+        """
+        Updates the state of the game n times. Every generation is computed in place in preallocated buffers.
+        :param n: number of generations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        torus = self.__topology == 'torus'
+        cycles = self.__cycles
+        if self.__changes is not None:
+            np.copyto(self.__start, self.__grid)
+        for i in range(n):
+            if torus:
+                wrap_edges(self.__padded)
+            count_neighbors(self.__padded, self.__neighbors)
+            if cycles is not None:
+                np.copyto(self.__previous, self.__grid)
+            apply_rule(self.__rule, self.__neighbors, self.__grid, self.__grid, self.__kept, self.__scratch)
+            if cycles is not None:
+                # the keys of all flipped cells are folded into the hash at once
+                np.not_equal(self.__previous, self.__grid, out=self.__changed)
+                cycles.apply(int(np.bitwise_xor.reduce(self.__keys[self.__changed])))
+                cycles.record()
+        if self.__changes is not None:
+            # one comparison with the first board, so a step call costs a single mask whatever its length
+            self.__changes = np.flatnonzero(self.__start != self.__grid).astype(np.uint32)
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the grid
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the grid
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual grid
+        :return: copy of the array as a list of list of booleans
+        """
+        return self.__grid.astype(bool).tolist()
+
+    def get_grid_view(self) -> np.ndarray:
+        """
+        The view shares memory with the grid: it is not copied and reflects every later change.
+        :return: read-only height x width array of uint8 cells (1 alive, 0 dead)
+        """
+        return self.__view
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (one vectorized count)
+        """
+        return int(np.count_nonzero(self.__grid))
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        return grid_bounds(self.__grid)
+
+    def track_changes(self, enabled: bool = True):
+        """
+        The changes are only recorded while tracking is enabled, so that plain play does not pay for them; the copy
+        of the grid they are computed from is only allocated meanwhile.
+        :param enabled: True to record the changes of every later update_state or step call, False to stop
+        """
+        if enabled:
+            if self.__start is None:
+                self.__start = np.zeros((self.__height, self.__width), dtype=np.uint8)
+            self.__changes = np.zeros(0, dtype=np.uint32)
+        else:
+            self.__start = None
+            self.__changes = None
+
+    def get_changes(self) -> ([(int, int)], [(int, int)]):
+        """
+        :return: (born, died) lists of (x, y) coordinates of the cells changed by the last update_state or step call;
+            None while change tracking is disabled
+        """
+        if self.__changes is None:
+            return None
+        ys, xs = np.divmod(self.__changes, self.__width)
+        alive = self.__grid[ys, xs] != 0
+        return (list(zip(xs[alive].tolist(), ys[alive].tolist())),
+                list(zip(xs[~alive].tolist(), ys[~alive].tolist())))
+
+    def get_topology(self) -> str:
+        """
+        :return: 'bounded' or 'torus'
+        """
+        return self.__topology
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
+
+    def get_cycle(self) -> (int, int):
+        """
+        Only available when the model was created with a cycle history.
+        :return: (period, generation) if the grid repeats one of the recent states; None otherwise
+        """
+        if self.__cycles is None:
+            return None
+        return self.__cycles.get_cycle()
@@ -0,0 +1,311 @@
+import multiprocessing
+import os
+import weakref
+from multiprocessing import shared_memory
+import numpy as np
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.NumpyGameOfLifeModel import apply_rule, cell_indices, count_neighbors, grid_bounds
+from Model.Rule import Rule
+
+
+def strip_worker(names: [str], width: int, height: int, rulestring: str, first_row: int, last_row: int, barrier,
+                 connection):
+    """
+    Body of a worker process which advances the rows [first_row, last_row) of a grid held in shared memory.
+    Each command received on the connection is a tuple (source buffer index, generation count); the worker
+    answers with the index of the buffer holding the result. Between generations all workers meet at the
+    barrier, so that the rows bordering a strip (its one row halo) are complete before they are read.
+    A command of None stops the worker.
+    """
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    buffers = [np.ndarray((height + 2, width + 2), dtype=np.uint8, buffer=b.buf) for b in blocks]
+    rows = last_row - first_row
+    neighbors = np.zeros((rows, width), dtype=np.uint8)
+    kept = np.zeros((rows, width), dtype=bool)
+    scratch = np.zeros((rows, width), dtype=bool)
+    rule = Rule(rulestring)
+    try:
+        while True:
+            command = connection.recv()
+            if command is None:
+                break
+            current, generations = command
+            for i in range(generations):
+                source = buffers[current][first_row:last_row + 2]
+                target = buffers[1 - current][first_row + 1:last_row + 1, 1:width + 1]
+                count_neighbors(source, neighbors)
+                apply_rule(rule, neighbors, source[1:-1, 1:-1], target, kept, scratch)
+                barrier.wait()
+                current = 1 - current
+            connection.send(current)
+    finally:
+        del buffers
+        for b in blocks:
+            try:
+                b.close()
+            except BufferError:
+                pass
+
+
+def stop_workers(processes: [], connections: [], blocks: []):
+    """ Stops the worker processes and releases the shared memory blocks. """
+    for c in connections:
+        try:
+            c.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+    for p in processes:
+        p.join(timeout=5)
+        if p.is_alive():
+            p.terminate()
+    for b in blocks:
+        try:
+            b.close()
+        except BufferError:
+            # views of the block are still alive, the mapping goes away with the process
+            pass
+        b.unlink()
+
+
+class ParallelGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model with one worker process per horizontal strip of the grid.
+    The grid lives in two shared memory buffers which are used alternately as the source and the target of a
+    generation; every worker reads its strip plus the row above and below it from the source and writes its
+    strip into the target, so results are identical to GameOfLifeModel (cells outside the board are dead).
+    The first buffer is the front buffer: a step ending in the second one copies the result back, so the current
+    generation always lives in the same array between calls and grid views follow it.
+
+    Parameters
+    ----------
+    __blocks: the two shared memory blocks holding the (height + 2) x (width + 2) grids
+    __buffers: NumPy views of the shared memory blocks; the first one holds the current generation between calls
+    __view: read-only view of the inner region of the front buffer handed out by get_grid_view
+    __processes: worker processes (one per strip)
+    __connections: pipes used to send commands to the workers
+    __width: width of the game grid (in cells)
+    __height: height of the game grid (in cells)
+    __rule: the rule of the game
+
+    Methods
+    -------
+    __init__(width, height, workers, rule):
+        Constructor which initializes the model and starts the worker processes
+
+    toggle_cell(x, y):
+        switches the status of the specified cell
+
+    clear():
+        kills every cell of the grid with a single write
+
+    set_cells(coordinates, value):
+        sets the state of several cells with a single vectorized write
+
+    stamp(pattern, x, y):
+        brings the cells of a pattern to life at the given offset
+
+    update_state():
+        updates the state of the game based on the Game of Life Rules
+
+    step(n):
+        updates the state of the game n times with a single round trip to the workers
+
+    get_width():
+        returns width of game grid
+
+    get_height():
+        returns height of the game grid
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the game grid
+
+    get_grid_view():
+        returns a read-only array view of the front buffer
+
+    population():
+        returns the number of living cells with one vectorized count
+
+    bounding_box():
+        returns the bounding box of the living cells with two vectorized reductions
+
+    __front_view():
+        creates the read-only view of the front buffer
+
+    get_rule():
+        returns the rulestring of the game
+
+    get_worker_count():
+        returns the number of worker processes
+
+    close():
+        stops the worker processes and releases the shared memory
+    """
+
+    def __init__(self, width: int, height: int, workers: int = None, rule: str = 'B3/S23'):
+        """
+        Initializes the ParallelGameOfLifeModel Object
+        :param width: width of the game grid
+        :param height: height of the game grid
+        :param workers: number of worker processes (defaults to the number of CPUs, at most one per row)
+        :param rule: rulestring in B/S notation
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError('Invalid Worker Count!')
+        workers = min(workers, height)
+        self.__width = width
+        self.__height = height
+        self.__rule = Rule(rule)
+        size = (height + 2) * (width + 2)
+        self.__blocks = [shared_memory.SharedMemory(create=True, size=size) for i in range(2)]
+        self.__buffers = [np.ndarray((height + 2, width + 2), dtype=np.uint8, buffer=b.buf) for b in self.__blocks]
+        for b in self.__buffers:
+            b.fill(0)
+        self.__view = self.__front_view()
+
+        context = multiprocessing.get_context()
+        barrier = context.Barrier(workers)
+        self.__processes = []
+        self.__connections = []
+        names = [b.name for b in self.__blocks]
+        for i in range(workers):
+            first_row = i * height // workers
+            last_row = (i + 1) * height // workers
+            parent, child = context.Pipe()
+            p = context.Process(target=strip_worker, daemon=True,
+                                args=(names, width, height, str(self.__rule), first_row, last_row, barrier, child))
+            p.start()
+            self.__processes.append(p)
+            self.__connections.append(parent)
+        self.__finalizer = weakref.finalize(self, stop_workers, self.__processes, self.__connections, self.__blocks)
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.__buffers[0][y + 1, x + 1] ^= 1
+
+    def clear(self):
+        """ Kills every cell of the grid. """
+        self.__buffers[0].fill(0)
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells with one fancy-indexed write into the shared buffer. All coordinates are
+        validated first.
+        :param coordinates: list (or n x 2 array) of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        ys, xs = cell_indices(coordinates, self.__width, self.__height)
+        self.__buffers[0][ys + 1, xs + 1] = value
+
+    def stamp(self, pattern: [(int, int)], x: int, y: int):
+        """
+        Brings the cells of a pattern to life; cells outside the pattern keep their state.
+        :param pattern: list of (x, y) coordinates of the living cells of the pattern (as in the structure library)
+        :param x: x coordinate of the top left corner of the pattern in the grid
+        :param y: y coordinate of the top left corner of the pattern in the grid
+        """
+        if x is None or y is None:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.set_cells(np.asarray(pattern, dtype=np.int64).reshape(-1, 2) + (x, y), True)
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        self.step(1)
+
+    def step(self, n: int):
+        """
+        Updates the state of the game n times. The workers synchronize among themselves between generations.
+        :param n: number of generations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        if not self.__finalizer.alive:
+            raise RuntimeError('Model Is Closed!')
+        if n == 0:
+            return
+        for c in self.__connections:
+            c.send((0, n))
+        current = 0
+        for c in self.__connections:
+            current = c.recv()
+        if current:
+            np.copyto(self.__buffers[0], self.__buffers[1])
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the grid
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the grid
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual grid
+        :return: copy of the array as a list of list of booleans
+        """
+        return self.__view.astype(bool).tolist()
+
+    def get_grid_view(self) -> np.ndarray:
+        """
+        The view shares memory with the front buffer: it is not copied and reflects every later change (until the
+        model is closed, after which a new view has to be requested).
+        :return: read-only height x width array of uint8 cells (1 alive, 0 dead)
+        """
+        return self.__view
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (one vectorized count)
+        """
+        return int(np.count_nonzero(self.__view))
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        return grid_bounds(self.__view)
+
+    def __front_view(self) -> np.ndarray:
+        """
+        :return: read-only view of the cells of the front buffer (without the padding)
+        """
+        view = self.__buffers[0][1:self.__height + 1, 1:self.__width + 1].view()
+        view.flags.writeable = False
+        return view
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
+
+    def get_worker_count(self) -> int:
+        """
+        :return: the number of worker processes
+        """
+        return len(self.__processes)
+
+    def close(self):
+        """ Stops the worker processes and releases the shared memory. """
+        self.__buffers = [b.copy() for b in self.__buffers]
+        self.__view = self.__front_view()
+        self.__finalizer()
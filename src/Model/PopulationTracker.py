@@ -0,0 +1,103 @@
+class PopulationTracker:
+    """
+    A class keeping the number of living cells and their bounding box up to date as cells change state.
+    Models report every flipped cell, so the population is known without scanning the grid. The tracker also
+    counts the living cells of every row and column: a birth only widens the box, and a death can only shrink it
+    when it empties a row or column on its edge, in which case the box is rebuilt from the counts (width + height
+    steps instead of width * height) the next time it is asked for.
+
+    Parameters
+    ----------
+    __row_counts: number of living cells in every row
+    __column_counts: number of living cells in every column
+    __population: number of living cells
+    __box: (min x, min y, max x, max y) of the living cells; None if there are none
+    __stale: True if a death may have shrunk the box since it was last computed
+
+    Methods
+    -------
+    __init__(width, height):
+        Creates a tracker for an empty board of the given size.
+
+    flip(x, y, alive):
+        records that a cell changed state
+
+    clear():
+        records that every cell died
+
+    get_population():
+        returns the number of living cells
+
+    get_bounding_box():
+        returns the smallest rectangle holding all living cells
+    """
+
+    def __init__(self, width: int, height: int):
+        """
+        Creates a tracker for an empty board.
+        :param width: width of the board
+        :param height: height of the board
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        self.__row_counts = [0] * height
+        self.__column_counts = [0] * width
+        self.__population = 0
+        self.__box = None
+        self.__stale = False
+
+    def flip(self, x: int, y: int, alive: bool):
+        """
+        Records that a cell changed state.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        :param alive: the new state of the cell (True if it was born, False if it died)
+        """
+        if alive:
+            self.__population += 1
+            self.__row_counts[y] += 1
+            self.__column_counts[x] += 1
+            box = self.__box
+            if self.__stale:
+                return
+            if box is None:
+                self.__box = (x, y, x, y)
+            elif x < box[0] or y < box[1] or x > box[2] or y > box[3]:
+                self.__box = (min(x, box[0]), min(y, box[1]), max(x, box[2]), max(y, box[3]))
+        else:
+            self.__population -= 1
+            self.__row_counts[y] -= 1
+            self.__column_counts[x] -= 1
+            box = self.__box
+            if self.__stale or box is None:
+                return
+            if (self.__row_counts[y] == 0 and (y == box[1] or y == box[3])) or \
+                    (self.__column_counts[x] == 0 and (x == box[0] or x == box[2])):
+                self.__stale = True
+
+    def clear(self):
+        """ Records that every cell died. """
+        self.__row_counts = [0] * len(self.__row_counts)
+        self.__column_counts = [0] * len(self.__column_counts)
+        self.__population = 0
+        self.__box = None
+        self.__stale = False
+
+    def get_population(self) -> int:
+        """
+        :return: the number of living cells
+        """
+        return self.__population
+
+    def get_bounding_box(self) -> (int, int, int, int):
+        """
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        if self.__stale:
+            self.__box = None
+            if self.__population:
+                rows = [y for y, count in enumerate(self.__row_counts) if count]
+                columns = [x for x, count in enumerate(self.__column_counts) if count]
+                self.__box = (columns[0], rows[0], columns[-1], rows[-1])
+            self.__stale = False
+        return self.__box
@@ -0,0 +1,207 @@
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.Rule import Rule
+
+
+def pair_count_equals(pairs: int, s0: int, s1: int, s2: int) -> int:
+    """
+    Selects the cells whose four weight-2 carries add up to pairs.
+    :param pairs: number of set carries (0 to 4)
+    :param s0, s1, s2: bits of the binary sum of the carries (s2 is only set when all four are)
+    :return: bitset of the matching cells (may be negative; callers mask it)
+    """
+    if pairs == 0:
+        return ~(s0 | s1 | s2)
+    if pairs == 1:
+        return s0 & ~s1
+    if pairs == 2:
+        return s1 & ~s0
+    if pairs == 3:
+        return s0 & s1
+    return s2
+
+
+class RowBitsetGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model without third party dependencies.
+    Every row is stored as a single Python int (cell x in bit x), and the neighbour counts of a whole row are
+    computed at once with shifts and bit-sliced adders over the row above, the row itself and the row below.
+    The rule is evaluated from its bit-sliced plan (see Rule.get_bitsliced_plan), the same way as in the
+    BitboardGameOfLifeModel.
+    On a bounded grid cells outside the board are dead (same edge rule as GameOfLifeModel); on a torus the rows
+    above the first and below the last one wrap around, and so do the first and last bits of every row.
+
+    Parameters
+    ----------
+    __rows: list of ints, one bitset per row
+    __mask: int with the lowest width bits set
+    __width: width of the game grid (in cells)
+    __height: height of the game grid (in cells)
+    __topology: 'bounded' or 'torus'
+    __rule: the rule of the game
+    __plan: bit-sliced plan of the rule
+
+    Methods
+    -------
+    __init__(width, height, topology, rule):
+        Constructor which initializes the RowBitsetGameOfLifeModel Object with a specified grid width, height,
+        topology and rule
+
+    toggle_cell(x, y):
+        switches the status of the specified cell
+
+    update_state():
+        updates the state of the game based on the rule of the game
+
+    get_width():
+        returns width of game grid
+
+    get_height():
+        returns height of the game grid
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the game grid
+
+    population():
+        returns the number of living cells
+
+    bounding_box():
+        returns the smallest rectangle holding all living cells
+
+
+    get_topology():
+        returns the name of the topology of the grid
+
+    get_rule():
+        returns the rulestring of the game
+    """
+
+    def __init__(self, width: int, height: int, topology: str = 'bounded', rule: str = 'B3/S23'):
+        """
+        Initializes the RowBitsetGameOfLifeModel Object
+        :param width: width of the game grid
+        :param height: height of the game grid
+        :param topology: 'bounded' for a grid surrounded by dead cells or 'torus' for a grid whose edges wrap around
+        :param rule: rulestring in B/S notation
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        if topology not in ('bounded', 'torus'):
+            raise ValueError('Invalid Topology!')
+        self.__width = width
+        self.__height = height
+        self.__topology = topology
+        self.__rule = Rule(rule)
+        self.__plan = self.__rule.get_bitsliced_plan()
+        self.__mask = (1 << width) - 1
+        self.__rows = [0] * height
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.__rows[y] ^= 1 << x
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        mask = self.__mask
+        rows = self.__rows
+        if self.__topology == 'torus':
+            last = self.__width - 1
+            padded = [rows[-1]] + rows + [rows[0]]
+            west = [((r << 1) & mask) | (r >> last) for r in padded]
+            east = [(r >> 1) | ((r & 1) << last) for r in padded]
+        else:
+            padded = [0] + rows + [0]
+            west = [(r << 1) & mask for r in padded]
+            east = [r >> 1 for r in padded]
+        # every row is the row above or below two other rows: its three cell sum is computed once
+        ones = [w ^ r ^ e for w, r, e in zip(west, padded, east)]
+        twos = [(w & r) | (e & (w ^ r)) for w, r, e in zip(west, padded, east)]
+
+        plan = self.__plan
+        updated = []
+        for y in range(self.__height):
+            alive = padded[y + 1]
+            up = ones[y]
+            down = ones[y + 2]
+            mid = west[y + 1] ^ east[y + 1]
+            # weight-1 bit of the count and the four weight-2 carries
+            bit = up ^ down ^ mid
+            c1 = (up & down) | (mid & (up ^ down))
+            c2 = west[y + 1] & east[y + 1]
+            c3 = twos[y]
+            c4 = twos[y + 2]
+            # binary sum of the carries
+            partial = c1 ^ c2 ^ c3
+            k1 = (c1 & c2) | (c3 & (c1 ^ c2))
+            s0 = partial ^ c4
+            k2 = partial & c4
+            s1 = k1 ^ k2
+            s2 = k1 & k2
+
+            functions = (0, mask, bit, bit ^ mask)
+            row = 0
+            for (pairs, dead, live) in plan:
+                row |= pair_count_equals(pairs, s0, s1, s2) & \
+                    ((functions[dead] & ~alive) | (functions[live] & alive))
+            updated.append(row & mask)
+        self.__rows = updated
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the grid
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the grid
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual grid
+        :return: copy of the array as a list of list of booleans
+        """
+        width = self.__width
+        return [[c == '1' for c in reversed(format(row, '0' + str(width) + 'b'))] for row in self.__rows]
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (one bit count per row)
+        """
+        return sum(row.bit_count() for row in self.__rows)
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        rows = [y for y, row in enumerate(self.__rows) if row]
+        if not rows:
+            return None
+        columns = 0
+        for row in self.__rows:
+            columns |= row
+        return (columns & -columns).bit_length() - 1, rows[0], columns.bit_length() - 1, rows[-1]
+
+    def get_topology(self) -> str:
+        """
+        :return: 'bounded' or 'torus'
+        """
+        return self.__topology
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
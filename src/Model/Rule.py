@@ -0,0 +1,138 @@
+# functions of the ones bit used by the bit-sliced plan of a rule
+ZERO = 0
+ONE = 1
+ONES = 2
+NOT_ONES = 3
+
+
+class Rule:
+    """
+    A class representing an outer-totalistic Life-like rule written in B/S notation (e.g. 'B3/S23' for Conway's
+    Game of Life or 'B36/S23' for HighLife).
+    The rule is compiled into lookup tables indexed by the number of living neighbours. Engines either index the
+    tables directly or derive their vectorized or bit-sliced inner loop from them once, so an arbitrary rule
+    costs the same as the hard-coded B3/S23 rule it replaces.
+
+    Parameters
+    ----------
+    __birth: tuple of 9 booleans; __birth[n] is True if a dead cell with n living neighbours is born
+    __survival: tuple of 9 booleans; __survival[n] is True if a living cell with n living neighbours survives
+    __table: tuple of 18 ints (0 or 1) giving the next state of a cell at index 9 * state + neighbours
+
+    Methods
+    -------
+    __init__(rulestring):
+        Parses a rulestring ('B3/S23', 'S23/B3' or the older '23/3' survival/birth form).
+
+    get_birth():
+        returns the birth lookup table
+
+    get_survival():
+        returns the survival lookup table
+
+    get_table():
+        returns the combined 18 entry lookup table
+
+    get_minterms():
+        returns the neighbour counts that lead to a living cell
+
+    get_bitsliced_plan():
+        returns the rule split by the weight-2 part of the neighbour count, for bit-sliced engines
+
+    next_state(alive, neighbors):
+        returns the next state of a single cell
+    """
+
+    def __init__(self, rulestring: str = 'B3/S23'):
+        """
+        Creates a rule from its rulestring.
+        :param rulestring: rule in B/S notation, case insensitive
+        """
+        if rulestring is None:
+            raise ValueError('Invalid Rule!')
+        parts = rulestring.strip().upper().split('/')
+        if len(parts) != 2:
+            raise ValueError('Invalid Rule!')
+        if parts[0][:1] in ('B', 'S') and parts[1][:1] in ('B', 'S') and parts[0][:1] != parts[1][:1]:
+            digits = {p[0]: p[1:] for p in parts}
+            birth, survival = digits['B'], digits['S']
+        elif parts[0][:1] not in ('B', 'S') and parts[1][:1] not in ('B', 'S'):
+            survival, birth = parts
+        else:
+            raise ValueError('Invalid Rule!')
+        self.__birth = self.__parse_counts(birth)
+        self.__survival = self.__parse_counts(survival)
+        self.__table = tuple(int(b) for b in self.__birth) + tuple(int(s) for s in self.__survival)
+
+    @staticmethod
+    def __parse_counts(digits: str) -> (bool,):
+        """
+        :param digits: string of neighbour counts between 0 and 8
+        :return: tuple of 9 booleans marking the counts present in the string
+        """
+        if not all(d in '012345678' for d in digits):
+            raise ValueError('Invalid Rule!')
+        return tuple(str(n) in digits for n in range(9))
+
+    def get_birth(self) -> (bool,):
+        """
+        :return: tuple of 9 booleans; entry n is True if a dead cell with n living neighbours is born
+        """
+        return self.__birth
+
+    def get_survival(self) -> (bool,):
+        """
+        :return: tuple of 9 booleans; entry n is True if a living cell with n living neighbours survives
+        """
+        return self.__survival
+
+    def get_table(self) -> (int,):
+        """
+        :return: tuple of 18 ints; entry 9 * state + neighbours is the next state of a cell
+        """
+        return self.__table
+
+    def get_minterms(self) -> [(int, bool, bool)]:
+        """
+        Used by vectorized engines which build the rule out of comparisons against the neighbour count.
+        :return: list of (neighbours, dead cells are born, living cells survive) for every count leading to a
+            living cell
+        """
+        return [(n, self.__birth[n], self.__survival[n]) for n in range(9) if self.__birth[n] or self.__survival[n]]
+
+    def get_bitsliced_plan(self) -> [(int, int, int)]:
+        """
+        Bit-sliced engines add the eight neighbours into a ones bit and four weight-2 carries whose sum is pairs,
+        so that neighbours = 2 * pairs + ones. For a given value of pairs the next state only depends on the ones
+        bit and the state of the cell, and is described by two functions of the ones bit (one for dead cells and
+        one for living cells), each encoded as ZERO, ONE, ONES (the ones bit) or NOT_ONES (its complement).
+        :return: list of (pairs, function for dead cells, function for living cells) for every value of pairs
+            that can lead to a living cell
+        """
+        plan = []
+        for pairs in range(5):
+            functions = []
+            for table in (self.__birth, self.__survival):
+                even = table[2 * pairs]
+                odd = 2 * pairs + 1 < 9 and table[2 * pairs + 1]
+                functions.append([[ZERO, ONES], [NOT_ONES, ONE]][even][odd])
+            if functions != [ZERO, ZERO]:
+                plan.append((pairs, functions[0], functions[1]))
+        return plan
+
+    def next_state(self, alive: bool, neighbors: int) -> bool:
+        """
+        :param alive: current state of the cell
+        :param neighbors: number of living neighbours of the cell
+        :return: the state of the cell in the next generation
+        """
+        if alive:
+            return self.__survival[neighbors]
+        return self.__birth[neighbors]
+
+    def __str__(self) -> str:
+        """
+        :return: the normalized rulestring, e.g. 'B3/S23'
+        """
+        return 'B' + ''.join(str(n) for n in range(9) if self.__birth[n]) + \
+               '/S' + ''.join(str(n) for n in range(9) if self.__survival[n])
@@ -0,0 +1,262 @@
+from Model.CycleDetector import CycleDetector
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.Rule import Rule
+
+
+class SparseGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model for mostly empty boards.
+    Only the coordinates of living cells are stored, and each generation neighbour counts are accumulated for
+    the living cells and their neighbours, so the cost of a step grows with the population instead of the area.
+    Cells outside the board are always dead (same edge rule as GameOfLifeModel). Rules with B0 are not supported,
+    since every dead cell far from the population would be born.
+
+    Parameters
+    ----------
+    __live: set of (x, y) coordinates of the living cells
+    __changes: set of (x, y) coordinates of the cells flipped by the last update_state or step call; None while
+        change tracking is disabled
+    __width: width of the game grid (in cells)
+    __height: height of the game grid (in cells)
+    __rule: the rule of the game
+    __cycles: CycleDetector hashing the states of the grid; None when cycle detection is disabled
+
+    Methods
+    -------
+    __init__(width, height, rule, cycle_history):
+        Constructor which initializes the SparseGameOfLifeModel Object with a specified grid width and height
+
+    toggle_cell(x, y):
+        switches the status of the specified cell
+
+    update_state():
+        updates the state of the game based on the Game of Life Rules
+
+    step(n):
+        updates the state of the game n times
+
+    get_width():
+        returns width of game grid
+
+    get_height():
+        returns height of the game grid
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the game grid
+
+    clear():
+        kills every cell of the grid
+
+    set_cells(coordinates, value):
+        sets the state of several cells with a single set operation
+
+    population():
+        returns the number of living cells
+
+    bounding_box():
+        returns the smallest rectangle holding all living cells
+
+
+    track_changes(enabled):
+        starts or stops recording the cells changed by every update
+
+    get_changes():
+        returns the cells born and the cells that died during the last update (None unless tracking is enabled)
+
+
+    get_rule():
+        returns the rulestring of the game
+
+    get_cycle():
+        returns the period of the grid if it repeats one of the recent states
+    """
+
+    def __init__(self, width: int, height: int, rule: str = 'B3/S23', cycle_history: int = 0):
+        """
+        Initializes the SparseGameOfLifeModel Object
+        :param width: width of the game grid
+        :param height: height of the game grid
+        :param rule: rulestring in B/S notation (rules with B0 are not supported)
+        :param cycle_history: number of recent states searched for repetitions (0 disables cycle detection)
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        self.__rule = Rule(rule)
+        if self.__rule.get_birth()[0]:
+            raise ValueError('Invalid Rule!')
+        self.__width = width
+        self.__height = height
+        self.__live = set()
+        self.__changes = None
+        self.__cycles = CycleDetector(width, height, cycle_history) if cycle_history else None
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        cell = (x, y)
+        if cell in self.__live:
+            self.__live.remove(cell)
+        else:
+            self.__live.add(cell)
+        if self.__cycles is not None:
+            self.__cycles.flip(y * self.__width + x)
+            self.__cycles.forget()
+
+    def clear(self):
+        """ Kills every cell of the grid. """
+        if self.__cycles is not None:
+            for (x, y) in self.__live:
+                self.__cycles.flip(y * self.__width + x)
+            self.__cycles.forget()
+        self.__live = set()
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells with a single set operation. All coordinates are validated first.
+        :param coordinates: list of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        width = self.__width
+        height = self.__height
+        cells = set()
+        for (x, y) in coordinates:
+            if x is None or y is None or x < 0 or y < 0 or x >= width or y >= height:
+                raise ValueError('Invalid Cell Coordinates!')
+            cells.add((x, y))
+        changed = cells - self.__live if value else cells & self.__live
+        if self.__cycles is not None:
+            for (x, y) in changed:
+                self.__cycles.flip(y * width + x)
+            self.__cycles.forget()
+        if value:
+            self.__live |= changed
+        else:
+            self.__live -= changed
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        max_x = self.__width - 1
+        max_y = self.__height - 1
+        counts = {}
+        for (x, y) in self.__live:
+            for ny in range(max(0, y - 1), min(max_y, y + 1) + 1):
+                for nx in range(max(0, x - 1), min(max_x, x + 1) + 1):
+                    if nx != x or ny != y:
+                        cell = (nx, ny)
+                        counts[cell] = counts.get(cell, 0) + 1
+        live = self.__live
+        birth = self.__rule.get_birth()
+        survival = self.__rule.get_survival()
+        if survival[0]:
+            # isolated cells have no count but may survive
+            for cell in live:
+                if cell not in counts:
+                    counts[cell] = 0
+        self.__live = set(cell for cell, n in counts.items() if (survival[n] if cell in live else birth[n]))
+        if self.__changes is None and self.__cycles is None:
+            return
+        changes = live.symmetric_difference(self.__live)
+        if self.__changes is not None:
+            self.__changes = changes
+        if self.__cycles is not None:
+            for (x, y) in changes:
+                self.__cycles.flip(y * self.__width + x)
+            self.__cycles.record()
+
+    def step(self, n: int):
+        """
+        Updates the state of the game n times. The cells flipped by the generations are combined, so that
+        get_changes reports the difference between the first and the last board.
+        :param n: number of generations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        if self.__changes is None:
+            for i in range(n):
+                self.update_state()
+            return
+        changes = set()
+        for i in range(n):
+            self.update_state()
+            changes ^= self.__changes
+        self.__changes = changes
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the grid
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the grid
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual grid
+        :return: copy of the array as a list of list of booleans
+        """
+        grid = [[False] * self.__width for i in range(self.__height)]
+        for (x, y) in self.__live:
+            grid[y][x] = True
+        return grid
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (the size of the set)
+        """
+        return len(self.__live)
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        Only the living cells are visited, so the cost does not depend on the size of the board.
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        if not self.__live:
+            return None
+        xs = [x for (x, y) in self.__live]
+        ys = [y for (x, y) in self.__live]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def track_changes(self, enabled: bool = True):
+        """
+        The changes are only recorded while tracking is enabled, so that plain play does not pay for them.
+        :param enabled: True to record the changes of every later update_state or step call, False to stop
+        """
+        self.__changes = set() if enabled else None
+
+    def get_changes(self) -> ([(int, int)], [(int, int)]):
+        """
+        :return: (born, died) lists of (x, y) coordinates of the cells changed by the last update_state or step call;
+            None while change tracking is disabled
+        """
+        if self.__changes is None:
+            return None
+        return list(self.__changes & self.__live), list(self.__changes - self.__live)
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
+
+    def get_cycle(self) -> (int, int):
+        """
+        Only available when the model was created with a cycle history.
+        :return: (period, generation) if the grid repeats one of the recent states; None otherwise
+        """
+        if self.__cycles is None:
+            return None
+        return self.__cycles.get_cycle()
@@ -0,0 +1,258 @@
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.NumpyGameOfLifeModel import apply_rule, cell_indices, count_neighbors, grid_bounds, wrap_edges
+from Model.Rule import Rule
+
+
+class ThreadedGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model with the vectorized neighbour computation split into row bands.
+    The bands are processed concurrently by a thread pool; the NumPy kernels release the GIL while they run, so
+    the threads execute in parallel without the start-up and shared memory costs of worker processes.
+    The grid is double-buffered so bands never read rows that another band has already advanced. The generations
+    of a step call alternate between the buffers and the last one is copied back into the front buffer, so the
+    current generation always lives in the same array between calls and grid views follow it.
+    On a bounded grid cells outside the board are dead (same edge rule as GameOfLifeModel); on a torus the border
+    of the source buffer is refilled from the opposite edges before the bands of a generation are submitted.
+
+    Parameters
+    ----------
+    __buffers: two (height + 2) x (width + 2) arrays of uint8 cells used alternately; the outer ring is the border.
+        The first one is the front buffer, which holds the current generation between calls
+    __view: read-only view of the inner region of the front buffer handed out by get_grid_view
+    __bands: list of (first row, last row, neighbour buffer, scratch buffers) for every band
+    __executor: the thread pool processing the bands
+    __width: width of the game grid (in cells)
+    __height: height of the game grid (in cells)
+    __topology: 'bounded' or 'torus'
+    __rule: the rule of the game
+
+    Methods
+    -------
+    __init__(width, height, threads, topology, rule):
+        Constructor which initializes the ThreadedGameOfLifeModel Object with a specified grid width and height
+
+    toggle_cell(x, y):
+        switches the status of the specified cell
+
+    update_state():
+        updates the state of the game based on the Game of Life Rules
+
+    step(n):
+        updates the state of the game n times
+
+    get_width():
+        returns width of game grid
+
+    get_height():
+        returns height of the game grid
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the game grid
+
+    get_grid_view():
+        returns a read-only view of the game grid which is not copied
+
+    clear():
+        kills every cell of the grid with a single write
+
+    set_cells(coordinates, value):
+        sets the state of several cells with a single vectorized write
+
+    stamp(pattern, x, y):
+        brings the cells of a pattern to life at the given offset
+
+    population():
+        returns the number of living cells
+
+    bounding_box():
+        returns the smallest rectangle holding all living cells
+
+
+    get_topology():
+        returns the name of the topology of the grid
+
+    get_rule():
+        returns the rulestring of the game
+
+    get_thread_count():
+        returns the number of threads (and bands)
+
+    close():
+        shuts the thread pool down
+    """
+
+    def __init__(self, width: int, height: int, threads: int = None, topology: str = 'bounded',
+                 rule: str = 'B3/S23'):
+        """
+        Initializes the ThreadedGameOfLifeModel Object
+        :param width: width of the game grid
+        :param height: height of the game grid
+        :param threads: number of threads (defaults to the number of CPUs, at most one per row)
+        :param topology: 'bounded' for a grid surrounded by dead cells or 'torus' for a grid whose edges wrap around
+        :param rule: rulestring in B/S notation
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        if topology not in ('bounded', 'torus'):
+            raise ValueError('Invalid Topology!')
+        if threads is None:
+            threads = os.cpu_count() or 1
+        if threads <= 0:
+            raise ValueError('Invalid Thread Count!')
+        threads = min(threads, height)
+        self.__width = width
+        self.__height = height
+        self.__topology = topology
+        self.__rule = Rule(rule)
+        self.__buffers = [np.zeros((height + 2, width + 2), dtype=np.uint8) for i in range(2)]
+        self.__view = self.__buffers[0][1:height + 1, 1:width + 1].view()
+        self.__view.flags.writeable = False
+        self.__bands = []
+        for i in range(threads):
+            first_row = i * height // threads
+            last_row = (i + 1) * height // threads
+            rows = last_row - first_row
+            self.__bands.append((first_row, last_row, np.zeros((rows, width), dtype=np.uint8),
+                                 np.zeros((rows, width), dtype=bool), np.zeros((rows, width), dtype=bool)))
+        self.__executor = ThreadPoolExecutor(max_workers=threads)
+        weakref.finalize(self, self.__executor.shutdown, wait=False)
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.__buffers[0][y + 1, x + 1] ^= 1
+
+    def clear(self):
+        """ Kills every cell of the grid. """
+        self.__buffers[0].fill(0)
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells with one fancy-indexed write. All coordinates are validated first.
+        :param coordinates: list (or n x 2 array) of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        ys, xs = cell_indices(coordinates, self.__width, self.__height)
+        self.__buffers[0][ys + 1, xs + 1] = value
+
+    def stamp(self, pattern: [(int, int)], x: int, y: int):
+        """
+        Brings the cells of a pattern to life; cells outside the pattern keep their state.
+        :param pattern: list of (x, y) coordinates of the living cells of the pattern (as in the structure library)
+        :param x: x coordinate of the top left corner of the pattern in the grid
+        :param y: y coordinate of the top left corner of the pattern in the grid
+        """
+        if x is None or y is None:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.set_cells(np.asarray(pattern, dtype=np.int64).reshape(-1, 2) + (x, y), True)
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        self.step(1)
+
+    def step(self, n: int):
+        """
+        Updates the state of the game n times. Every generation waits for all bands before the next one starts.
+        After an odd number of generations the result is copied into the front buffer, so that a call costs at
+        most one copy of the grid whatever the number of generations.
+        :param n: number of generations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        front, back = self.__buffers
+        for i in range(n):
+            source, target = (front, back) if i % 2 == 0 else (back, front)
+            if self.__topology == 'torus':
+                wrap_edges(source)
+            futures = [self.__executor.submit(self.__advance_band, source, target, band) for band in self.__bands]
+            for f in futures:
+                f.result()
+        if n % 2:
+            np.copyto(front, back)
+
+    def __advance_band(self, source: np.ndarray, target: np.ndarray, band: ()):
+        """
+        Computes the next state of the rows of a band.
+        :param source: padded buffer holding the current generation
+        :param target: padded buffer receiving the next generation
+        :param band: (first row, last row, neighbour buffer, scratch buffers) of the band
+        """
+        first_row, last_row, neighbors, kept, scratch = band
+        rows = source[first_row:last_row + 2]
+        count_neighbors(rows, neighbors)
+        apply_rule(self.__rule, neighbors, rows[1:-1, 1:-1], target[first_row + 1:last_row + 1, 1:self.__width + 1],
+                   kept, scratch)
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the grid
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the grid
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual grid
+        :return: copy of the array as a list of list of booleans
+        """
+        return self.__view.astype(bool).tolist()
+
+    def get_grid_view(self) -> np.ndarray:
+        """
+        The view shares memory with the front buffer: it is not copied and reflects every later change.
+        :return: read-only height x width array of uint8 cells (1 alive, 0 dead)
+        """
+        return self.__view
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (one vectorized count)
+        """
+        return int(np.count_nonzero(self.__view))
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        return grid_bounds(self.__view)
+
+    def get_topology(self) -> str:
+        """
+        :return: 'bounded' or 'torus'
+        """
+        return self.__topology
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
+
+    def get_thread_count(self) -> int:
+        """
+        :return: the number of threads processing the bands
+        """
+        return len(self.__bands)
+
+    def close(self):
+        """ Shuts the thread pool down. """
+        self.__executor.shutdown()
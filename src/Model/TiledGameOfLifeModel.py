@@ -0,0 +1,243 @@
+import numpy as np
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.NumpyGameOfLifeModel import apply_rule, cell_indices, count_neighbors, grid_bounds
+from Model.Rule import Rule
+
+
+def dilate_tiles(tiles: np.ndarray) -> np.ndarray:
+    """
+    :param tiles: 2d array of booleans marking tiles
+    :return: new array marking the marked tiles and the eight tiles around each of them
+    """
+    padded = np.pad(tiles, 1)
+    rows = padded[:-2] | padded[1:-1] | padded[2:]
+    return rows[:, :-2] | rows[:, 1:-1] | rows[:, 2:]
+
+
+class TiledGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model on a grid split into square tiles.
+    A tile is only evaluated while it is awake. A tile falls asleep when neither its contents nor its one cell
+    halo (the bordering cells of the surrounding tiles) changed in the previous generation, since its next state
+    is then guaranteed to be identical to its current one. Editing a cell wakes its tile and the surrounding ones.
+    Cells outside the board are always dead (same edge rule as GameOfLifeModel). Under a rule with B0 empty tiles
+    change too, so every tile starts awake.
+
+    Parameters
+    ----------
+    __padded: (height + 2) x (width + 2) array of uint8 cells; the outer ring is always dead
+    __grid: view of the inner height x width region of __padded
+    __view: read-only view of __grid handed out by get_grid_view
+    __awake: tile_rows x tile_columns array of booleans marking the tiles evaluated in the next generation
+    __tile_size: side length of a tile (in cells)
+    __width: width of the game grid (in cells)
+    __height: height of the game grid (in cells)
+    __rule: the rule of the game
+
+    Methods
+    -------
+    __init__(width, height, tile_size, rule):
+        Constructor which initializes the TiledGameOfLifeModel Object with a specified grid width and height
+
+    toggle_cell(x, y):
+        switches the status of the specified cell
+
+    update_state():
+        updates the state of the game based on the Game of Life Rules
+
+    get_width():
+        returns width of game grid
+
+    get_height():
+        returns height of the game grid
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the game grid
+
+    get_grid_view():
+        returns a read-only view of the game grid which is not copied
+
+    clear():
+        kills every cell of the grid with a single write
+
+    set_cells(coordinates, value):
+        sets the state of several cells with a single vectorized write
+
+    stamp(pattern, x, y):
+        brings the cells of a pattern to life at the given offset
+
+    population():
+        returns the number of living cells
+
+    bounding_box():
+        returns the smallest rectangle holding all living cells
+
+
+    get_rule():
+        returns the rulestring of the game
+
+    get_awake_tiles():
+        returns the number of tiles which will be evaluated in the next generation
+
+    get_tile_count():
+        returns the total number of tiles
+    """
+
+    def __init__(self, width: int, height: int, tile_size: int = 32, rule: str = 'B3/S23'):
+        """
+        Initializes the TiledGameOfLifeModel Object
+        :param width: width of the game grid
+        :param height: height of the game grid
+        :param tile_size: side length of the tiles the grid is split into
+        :param rule: rulestring in B/S notation
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        if tile_size is None or tile_size <= 0:
+            raise ValueError('Invalid Tile Size!')
+        self.__width = width
+        self.__height = height
+        self.__tile_size = tile_size
+        self.__rule = Rule(rule)
+        self.__padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        self.__grid = self.__padded[1:height + 1, 1:width + 1]
+        self.__view = self.__grid.view()
+        self.__view.flags.writeable = False
+        self.__awake = np.full(((height + tile_size - 1) // tile_size, (width + tile_size - 1) // tile_size),
+                               self.__rule.get_birth()[0], dtype=bool)
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell. From living to dead or from dead to living.
+        :param x: x coordinate of the cell
+        :param y: y coordinate of the cell
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.__grid[y, x] ^= 1
+        tile_y = y // self.__tile_size
+        tile_x = x // self.__tile_size
+        self.__awake[max(0, tile_y - 1):tile_y + 2, max(0, tile_x - 1):tile_x + 2] = True
+
+    def clear(self):
+        """ Kills every cell of the grid and wakes every tile. """
+        self.__grid.fill(0)
+        self.__awake.fill(True)
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells with one fancy-indexed write and wakes the tiles around them.
+        All coordinates are validated first.
+        :param coordinates: list (or n x 2 array) of (x, y) coordinates of the cells
+        :param value: the new state of the cells (True for alive)
+        """
+        ys, xs = cell_indices(coordinates, self.__width, self.__height)
+        self.__grid[ys, xs] = value
+        edited = np.zeros(self.__awake.shape, dtype=bool)
+        edited[ys // self.__tile_size, xs // self.__tile_size] = True
+        self.__awake |= dilate_tiles(edited)
+
+    def stamp(self, pattern: [(int, int)], x: int, y: int):
+        """
+        Brings the cells of a pattern to life; cells outside the pattern keep their state.
+        :param pattern: list of (x, y) coordinates of the living cells of the pattern (as in the structure library)
+        :param x: x coordinate of the top left corner of the pattern in the grid
+        :param y: y coordinate of the top left corner of the pattern in the grid
+        """
+        if x is None or y is None:
+            raise ValueError('Invalid Cell Coordinates!')
+        self.set_cells(np.asarray(pattern, dtype=np.int64).reshape(-1, 2) + (x, y), True)
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        size = self.__tile_size
+        padded = self.__padded
+        neighbors = np.empty((size, size), dtype=np.uint8)
+        kept = np.empty((size, size), dtype=bool)
+        scratch = np.empty((size, size), dtype=bool)
+        updates = []
+        for (tile_y, tile_x) in zip(*np.nonzero(self.__awake)):
+            y0 = tile_y * size
+            x0 = tile_x * size
+            y1 = min(y0 + size, self.__height)
+            x1 = min(x0 + size, self.__width)
+            # the tile together with its halo, read before any tile of this generation is written back
+            region = padded[y0:y1 + 2, x0:x1 + 2]
+            shape = (y1 - y0, x1 - x0)
+            n = count_neighbors(region, neighbors[:shape[0], :shape[1]])
+            old = region[1:-1, 1:-1]
+            new = np.empty(shape, dtype=np.uint8)
+            apply_rule(self.__rule, n, old, new, kept[:shape[0], :shape[1]], scratch[:shape[0], :shape[1]])
+            if not np.array_equal(new, old):
+                updates.append((tile_y, tile_x, new))
+
+        changed = np.zeros(self.__awake.shape, dtype=bool)
+        for (tile_y, tile_x, new) in updates:
+            y0 = tile_y * size + 1
+            x0 = tile_x * size + 1
+            padded[y0:y0 + new.shape[0], x0:x0 + new.shape[1]] = new
+            changed[tile_y, tile_x] = True
+
+        # a tile stays awake if it or any of the eight tiles around it changed
+        self.__awake = dilate_tiles(changed)
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the grid
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the grid
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual grid
+        :return: copy of the array as a list of list of booleans
+        """
+        return self.__grid.astype(bool).tolist()
+
+    def get_grid_view(self) -> np.ndarray:
+        """
+        The view shares memory with the grid: it is not copied and reflects every later change.
+        :return: read-only height x width array of uint8 cells (1 alive, 0 dead)
+        """
+        return self.__view
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells (one vectorized count)
+        """
+        return int(np.count_nonzero(self.__grid))
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        :return: (min x, min y, max x, max y) of the living cells (inclusive); None if no cell is alive
+        """
+        return grid_bounds(self.__grid)
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
+
+    def get_awake_tiles(self) -> int:
+        """
+        :return: the number of tiles which will be evaluated in the next generation
+        """
+        return int(np.count_nonzero(self.__awake))
+
+    def get_tile_count(self) -> int:
+        """
+        :return: the total number of tiles the grid is split into
+        """
+        return self.__awake.size
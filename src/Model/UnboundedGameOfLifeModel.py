@@ -0,0 +1,377 @@
+from Model.CycleDetector import CycleDetector
+from Model.IGameOfLifeModel import IGameOfLifeModel
+from Model.Rule import Rule
+
+PLANE_MASK = (1 << 32) - 1
+
+
+def plane_index(x: int, y: int) -> int:
+    """
+    Numbers the cells of the plane for the cycle detector, which keys the cells by an index instead of a position.
+    :param x: plane x coordinate of the cell
+    :param y: plane y coordinate of the cell
+    :return: 64 bit index packing the lowest 32 bits of both coordinates (unique within 2^32 cells of the origin)
+    """
+    return ((x & PLANE_MASK) << 32) | (y & PLANE_MASK)
+
+
+class UnboundedGameOfLifeModel(IGameOfLifeModel):
+    """
+    A class implementing the game of life Model on an infinite plane.
+    Only the coordinates of living cells are stored, so memory grows with the population and not with the area
+    the pattern has travelled through. The width and height describe a window onto the plane: the cells are
+    addressed in window coordinates, and the window can be moved to follow a pattern. clear, population and
+    bounding_box cover the whole plane and not only the window.
+    Rules with B0 are not supported, since they would fill the infinite plane.
+    Cycle detection hashes the whole plane, so a pattern that repeats itself in a different place (a glider) is not
+    reported, while a board that died out or settled into still lifes and oscillators is.
+
+    Parameters
+    ----------
+    __live: set of (x, y) plane coordinates of the living cells
+    __changes: set of plane coordinates of the cells flipped by the last update_state or step call; None while
+        change tracking is disabled
+    __cycles: CycleDetector hashing the states of the plane; None when cycle detection is disabled
+    __box: cached bounding box (min x, min y, max x, max y) of the living cells in plane coordinates; None when it
+        needs recomputing
+    __origin_x: plane x coordinate of the left column of the window
+    __origin_y: plane y coordinate of the top row of the window
+    __width: width of the window (in cells)
+    __height: height of the window (in cells)
+    __rule: the rule of the game
+
+    Methods
+    -------
+    __init__(width, height, origin_x, origin_y, rule, cycle_history):
+        Constructor which initializes the UnboundedGameOfLifeModel Object with a window of the specified size
+
+    toggle_cell(x, y):
+        switches the status of the specified cell of the window
+
+    update_state():
+        updates the state of the game based on the Game of Life Rules
+
+    step(n):
+        updates the state of the game n times
+
+    clear():
+        kills every living cell of the plane
+
+    set_cells(coordinates, value):
+        sets the state of several cells at once; the cells may lie outside the window
+
+    stamp(pattern, x, y):
+        brings the cells of a pattern to life; the pattern may reach past the edges of the window
+
+    population():
+        returns the number of living cells on the plane
+
+    bounding_box():
+        returns the bounding box of the living cells of the plane in window coordinates
+
+    live_cells():
+        returns the window coordinates of every living cell of the plane
+
+    track_changes(enabled):
+        starts or stops recording the cells changed by every update
+
+    get_changes():
+        returns the cells born and the cells that died during the last update (None unless tracking is enabled)
+
+    get_width():
+        returns width of the window
+
+    get_height():
+        returns height of the window
+
+    get_grid():
+        returns the list of list of booleans representing a copy of the window
+
+    set_window_origin(x, y):
+        moves the window so that its top left cell is the plane cell (x, y)
+
+    get_window_origin():
+        returns the plane coordinates of the top left cell of the window
+
+    get_rule():
+        returns the rulestring of the game
+
+    get_cycle():
+        returns the period of the plane if it repeats one of the recent states
+    """
+
+    def __init__(self, width: int, height: int, origin_x: int = 0, origin_y: int = 0, rule: str = 'B3/S23',
+                 cycle_history: int = 0):
+        """
+        Initializes the UnboundedGameOfLifeModel Object
+        :param width: width of the window
+        :param height: height of the window
+        :param origin_x: plane x coordinate of the left column of the window
+        :param origin_y: plane y coordinate of the top row of the window
+        :param rule: rulestring in B/S notation (rules with B0 are not supported)
+        :param cycle_history: number of recent states searched for repetitions (0 disables cycle detection)
+        """
+        if width is None or height is None or width <= 0 or height <= 0:
+            raise ValueError('Invalid Grid Parameters!')
+        self.__rule = Rule(rule)
+        if self.__rule.get_birth()[0]:
+            raise ValueError('Invalid Rule!')
+        self.__width = width
+        self.__height = height
+        self.__origin_x = origin_x
+        self.__origin_y = origin_y
+        self.__live = set()
+        self.__box = None
+        self.__changes = None
+        self.__cycles = CycleDetector(width, height, cycle_history) if cycle_history else None
+
+    def toggle_cell(self, x: int, y: int):
+        """
+        Switches the status of the specified cell of the window. From living to dead or from dead to living.
+        :param x: x coordinate of the cell in the window
+        :param y: y coordinate of the cell in the window
+        """
+        if x is None or y is None or x < 0 or y < 0 or x >= self.__width or y >= self.__height:
+            raise ValueError('Invalid Cell Coordinates!')
+        cell = (x + self.__origin_x, y + self.__origin_y)
+        if cell in self.__live:
+            self.__kill({cell})
+        else:
+            self.__revive({cell})
+
+    def update_state(self):
+        """
+        updates the state of the game based on the rule of the game (by default the Game of Life Rules):
+        1. If a dead cell has exactly 3 living cells around it, it becomes alive
+        2. If a living cell has 4 or more living cells around it, it dies.
+        3. If a living cell has less than 2 living cells around it, it dies.
+        """
+        counts = {}
+        for (x, y) in self.__live:
+            for cell in ((x - 1, y - 1), (x, y - 1), (x + 1, y - 1), (x - 1, y),
+                         (x + 1, y), (x - 1, y + 1), (x, y + 1), (x + 1, y + 1)):
+                counts[cell] = counts.get(cell, 0) + 1
+        live = self.__live
+        birth = self.__rule.get_birth()
+        survival = self.__rule.get_survival()
+        if survival[0]:
+            # isolated cells have no count but may survive
+            for cell in live:
+                if cell not in counts:
+                    counts[cell] = 0
+        self.__live = set(cell for cell, n in counts.items() if (survival[n] if cell in live else birth[n]))
+        self.__box = None
+        if self.__changes is None and self.__cycles is None:
+            return
+        changes = live.symmetric_difference(self.__live)
+        if self.__changes is not None:
+            self.__changes = changes
+        if self.__cycles is not None:
+            for (x, y) in changes:
+                self.__cycles.flip(plane_index(x, y))
+            self.__cycles.record()
+
+    def step(self, n: int):
+        """
+        Updates the state of the game n times. The cells flipped by the generations are combined, so that
+        get_changes reports the difference between the first and the last board.
+        :param n: number of generations (non-negative)
+        """
+        if n is None or n < 0:
+            raise ValueError('Invalid Step Count!')
+        if self.__changes is None:
+            for i in range(n):
+                self.update_state()
+            return
+        changes = set()
+        for i in range(n):
+            self.update_state()
+            changes ^= self.__changes
+        self.__changes = changes
+
+    def clear(self):
+        """
+        Kills every living cell of the plane, including the cells outside of the window.
+        """
+        if self.__cycles is not None:
+            for (x, y) in self.__live:
+                self.__cycles.flip(plane_index(x, y))
+            self.__cycles.forget()
+        self.__live = set()
+        self.__box = None
+
+    def set_cells(self, coordinates: [(int, int)], value: bool = True):
+        """
+        Sets the state of several cells at once. The coordinates are relative to the window but, since the plane
+        has no edges, may lie outside of it (e.g. to restore cells returned by live_cells). All coordinates are
+        validated before any cell is changed.
+        :param coordinates: list of (x, y) coordinates of the cells in window coordinates
+        :param value: the new state of the cells (True for alive)
+        """
+        cells = set()
+        for (x, y) in coordinates:
+            if x is None or y is None:
+                raise ValueError('Invalid Cell Coordinates!')
+            cells.add((x + self.__origin_x, y + self.__origin_y))
+        if value:
+            self.__revive(cells - self.__live)
+        else:
+            self.__kill(cells & self.__live)
+
+    def stamp(self, pattern: [(int, int)], x: int, y: int):
+        """
+        Brings the cells of a pattern to life; cells outside the pattern keep their state. The pattern may reach
+        past the edges of the window, since the plane has none.
+        :param pattern: list of (x, y) coordinates of the living cells of the pattern (as in the structure library)
+        :param x: x coordinate of the top left corner of the pattern in the window
+        :param y: y coordinate of the top left corner of the pattern in the window
+        """
+        if x is None or y is None:
+            raise ValueError('Invalid Cell Coordinates!')
+        x += self.__origin_x
+        y += self.__origin_y
+        self.__revive(set((c[0] + x, c[1] + y) for c in pattern) - self.__live)
+
+    def population(self) -> int:
+        """
+        :return: the number of living cells on the plane
+        """
+        return len(self.__live)
+
+    def bounding_box(self) -> (int, int, int, int):
+        """
+        The box covers the whole plane, so it may reach past the edges of the window (with negative coordinates
+        left of and above it). It is cached and only recomputed after a generation or after a cell on its border
+        died.
+        :return: (min x, min y, max x, max y) of the living cells in window coordinates; None if there are none
+        """
+        if self.__box is None and self.__live:
+            xs = [c[0] for c in self.__live]
+            ys = [c[1] for c in self.__live]
+            self.__box = (min(xs), min(ys), max(xs), max(ys))
+        if self.__box is None:
+            return None
+        return (self.__box[0] - self.__origin_x, self.__box[1] - self.__origin_y,
+                self.__box[2] - self.__origin_x, self.__box[3] - self.__origin_y)
+
+    def live_cells(self) -> [(int, int)]:
+        """
+        :return: list of the window coordinates of every living cell of the plane (they may lie outside the window)
+        """
+        return [(x - self.__origin_x, y - self.__origin_y) for (x, y) in self.__live]
+
+    def track_changes(self, enabled: bool = True):
+        """
+        The changes are only recorded while tracking is enabled, so that plain play does not pay for them.
+        :param enabled: True to record the changes of every later update_state or step call, False to stop
+        """
+        self.__changes = set() if enabled else None
+
+    def get_changes(self) -> ([(int, int)], [(int, int)]):
+        """
+        :return: (born, died) lists of the window coordinates of the cells changed by the last update_state or step
+            call (they may lie outside the window); None while change tracking is disabled
+        """
+        if self.__changes is None:
+            return None
+        ox = self.__origin_x
+        oy = self.__origin_y
+        born = [(x - ox, y - oy) for (x, y) in self.__changes if (x, y) in self.__live]
+        died = [(x - ox, y - oy) for (x, y) in self.__changes if (x, y) not in self.__live]
+        return born, died
+
+    def __revive(self, cells: {(int, int)}):
+        """
+        Brings dead cells to life and grows the cached bounding box around them.
+        :param cells: set of plane coordinates of dead cells
+        """
+        if not cells:
+            return
+        box = self.__box
+        if box is not None or not self.__live:
+            xs = [c[0] for c in cells]
+            ys = [c[1] for c in cells]
+            box = (min(xs), min(ys), max(xs), max(ys)) if box is None else \
+                (min(box[0], min(xs)), min(box[1], min(ys)), max(box[2], max(xs)), max(box[3], max(ys)))
+            self.__box = box
+        self.__live |= cells
+        self.__edited(cells)
+
+    def __kill(self, cells: {(int, int)}):
+        """
+        Kills living cells; the cached bounding box is forgotten if one of them was on its border.
+        :param cells: set of plane coordinates of living cells
+        """
+        self.__live -= cells
+        box = self.__box
+        if box is not None and any(c[0] in (box[0], box[2]) or c[1] in (box[1], box[3]) for c in cells):
+            self.__box = None
+        self.__edited(cells)
+
+    def __edited(self, cells: {(int, int)}):
+        """
+        Hashes cells flipped by the user; the recorded states are forgotten, since the plane no longer follows them.
+        :param cells: set of plane coordinates of the flipped cells
+        """
+        if self.__cycles is None or not cells:
+            return
+        for (x, y) in cells:
+            self.__cycles.flip(plane_index(x, y))
+        self.__cycles.forget()
+
+    def get_width(self) -> int:
+        """
+        :return: the width of the window
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        :return: the height of the window
+        """
+        return self.__height
+
+    def get_grid(self) -> [[bool]]:
+        """
+        does not allow for the mutation of the actual plane
+        :return: copy of the window as a list of list of booleans
+        """
+        grid = [[False] * self.__width for i in range(self.__height)]
+        for (x, y) in self.__live:
+            x -= self.__origin_x
+            y -= self.__origin_y
+            if 0 <= x < self.__width and 0 <= y < self.__height:
+                grid[y][x] = True
+        return grid
+
+    def set_window_origin(self, x: int, y: int):
+        """
+        Moves the window over the plane.
+        :param x: plane x coordinate of the left column of the window
+        :param y: plane y coordinate of the top row of the window
+        """
+        if x is None or y is None:
+            raise ValueError('Invalid Window Origin!')
+        self.__origin_x = x
+        self.__origin_y = y
+
+    def get_window_origin(self) -> (int, int):
+        """
+        :return: plane coordinates of the top left cell of the window
+        """
+        return self.__origin_x, self.__origin_y
+
+    def get_rule(self) -> str:
+        """
+        :return: the rulestring of the game in B/S notation
+        """
+        return str(self.__rule)
+
+    def get_cycle(self) -> (int, int):
+        """
+        Only available when the model was created with a cycle history.
+        :return: (period, generation) if the plane repeats one of the recent states; None otherwise
+        """
+        if self.__cycles is None:
+            return None
+        return self.__cycles.get_cycle()
@@ -0,0 +1,263 @@
+import functools
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import numpy as np
+from Model.Census import Census, MAX_PERIOD
+from Model.EnsembleGameOfLifeModel import EnsembleGameOfLifeModel
+
+# number of generations after which the stabilized boards of a batch are taken out of its ensemble
+ROUND = 100
+
+# structure library whose patterns are named in the census
+LIBRARY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Resources', 'resources.txt')
+
+
+def main():
+    """
+    Headless random soup search.
+    Seeded random soups are run to stabilization in batches on a pool of worker processes and the census of the
+    objects left on the stabilized boards (named by Model.Census) is aggregated in a JSON file. The file is
+    rewritten after every finished batch, so a search which is interrupted continues where it stopped when it is
+    started again with the same census file. Finished batches are stored as the number of batches finished from the
+    first one on, plus the few batches which finished ahead of an unfinished one, so the file does not grow with
+    the search.
+    Command line arguments:
+        -soups: total number of soups to search (default 10000)
+        -size: width and height of the random square in the middle of the board (default 16)
+        -width, -height: dimensions of the board (default 64 x 64)
+        -density: probability of a cell of the soup to be alive (default 0.5)
+        -seed: seed of the search; soup i of a search is always the same soup (default 0)
+        -rule: rulestring in B/S notation (default B3/S23)
+        -batch: number of soups simulated together by a worker (default 200)
+        -generations: number of generations after which a soup is counted as unsettled (default 5000)
+        -workers: number of worker processes (defaults to the number of CPUs)
+        -census: path of the census file (default census.json)
+    """
+    args = sys.argv
+    parameters = {
+        'size': read_argument(args, '-size', 16),
+        'width': read_argument(args, '-width', 64),
+        'height': read_argument(args, '-height', 64),
+        'density': read_argument(args, '-density', 0.5, float),
+        'seed': read_argument(args, '-seed', 0),
+        'rule': read_argument(args, '-rule', 'B3/S23', str),
+        'batch': read_argument(args, '-batch', 200),
+        'generations': read_argument(args, '-generations', 5000),
+    }
+    soups = read_argument(args, '-soups', 10000)
+    workers = read_argument(args, '-workers', None)
+    path = read_argument(args, '-census', 'census.json', str)
+
+    census = search(path, parameters, soups, workers, report=print)
+    for (key, count) in sorted(census['census'].items(), key=lambda item: -item[1]):
+        print(f'{key}: {count}')
+
+
+def search(path: str, parameters: {}, soups: int, workers: int = None, report=None) -> {}:
+    """
+    Searches the soups which are missing from a census file and writes the census after every finished batch.
+    :param path: path of the census file; it is created if it does not exist
+    :param parameters: dictionary of the search parameters (size, width, height, density, seed, rule, batch and
+        generations); they must be equal to the parameters stored in an existing census file
+    :param soups: total number of soups to search (rounded up to whole batches)
+    :param workers: number of worker processes (defaults to the number of CPUs)
+    :param report: function called with a progress line (soups searched and soups per second); None for silence
+    :return: the census: dictionary with the parameters, the finished batches ('completed': batches 0 to
+        completed - 1 are finished; 'finished': sorted list of the later finished batches), the number of searched
+        soups and the number of times every object was found
+    """
+    if soups is None or soups < 0:
+        raise ValueError('Invalid Soup Count!')
+    if parameters['batch'] is None or parameters['batch'] <= 0:
+        raise ValueError('Invalid Batch Size!')
+    if parameters['size'] is None or parameters['size'] <= 0 or \
+            parameters['size'] > min(parameters['width'], parameters['height']):
+        raise ValueError('Invalid Soup Size!')
+    census = read_census(path, parameters)
+    finished = set(census['finished'])
+    pending = deque(b for b in range(census['completed'], -(-soups // parameters['batch'])) if b not in finished)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    start = time.perf_counter()
+    searched = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # only a few batches per worker are queued, so a search of millions of soups does not create millions of
+        # futures up front
+        queued = set()
+        while pending or queued:
+            while pending and len(queued) < 2 * workers:
+                queued.add(executor.submit(search_batch, pending.popleft(), parameters))
+            done, queued = wait(queued, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch, counts = future.result()
+                merge_census(census, batch, counts, parameters['batch'])
+                searched += parameters['batch']
+            write_census(path, census)
+            if report is not None:
+                elapsed = time.perf_counter() - start
+                rate = searched / elapsed if elapsed > 0 else float('inf')
+                report(f'{census["soups"]} soups ({rate:.1f} soups/s)')
+    return census
+
+
+def search_batch(batch: int, parameters: {}) -> (int, {}):
+    """
+    Runs the soups of a batch to stabilization (in a worker process).
+    :param batch: index of the batch; it holds the soups batch * batch size to (batch + 1) * batch size - 1
+    :param parameters: dictionary of the search parameters
+    :return: (batch, census of the batch)
+    """
+    count = parameters['batch']
+    cells = np.stack([soup(batch * count + i, parameters) for i in range(count)])
+    return batch, settle(cells, parameters)
+
+
+def settle(cells: np.ndarray, parameters: {}) -> {}:
+    """
+    Runs boards to stabilization on an ensemble and counts the objects they leave behind.
+    The ensemble is advanced in rounds; after every round the stabilized boards are counted and only the others
+    are moved to a smaller ensemble, so the few slow soups of a batch do not keep all of its boards running.
+    The ensemble remembers the hashes of MAX_PERIOD generations, so that oscillators with long periods, such as the
+    pentadecathlon, are recognized as stabilized as well.
+    :param cells: count x height x width array of the boards
+    :param parameters: dictionary of the search parameters
+    :return: census of the objects left on the boards once they stabilized; boards which did not stabilize within
+        the generation limit are counted as 'unsettled'
+    """
+    census = census_table(parameters['rule'])
+    counts = {}
+    generation = 0
+    while len(cells) and generation < parameters['generations']:
+        ensemble = EnsembleGameOfLifeModel(len(cells), parameters['width'], parameters['height'],
+                                           rule=parameters['rule'], cycle_history=MAX_PERIOD)
+        ensemble.set_boards(cells)
+        generation += ensemble.run(min(ROUND, parameters['generations'] - generation))
+        periods = ensemble.get_periods()
+        settled = periods > 0
+        if settled.any():
+            for (board, footprint) in zip(ensemble.get_grid_view()[settled], footprints(ensemble, settled)):
+                for (key, n) in census.count(board, footprint).items():
+                    counts[key] = counts.get(key, 0) + n
+        cells = ensemble.get_grid_view()[~settled].copy()
+    if len(cells):
+        counts['unsettled'] = counts.get('unsettled', 0) + len(cells)
+    return counts
+
+
+def footprints(ensemble: EnsembleGameOfLifeModel, settled: np.ndarray) -> np.ndarray:
+    """
+    Follows the settled boards of an ensemble through their periods on a separate ensemble.
+    :param ensemble: the ensemble
+    :param settled: array of booleans marking the boards which stabilized
+    :return: array holding for every settled board the cells which are alive in any phase of its period
+    """
+    cells = ensemble.get_grid_view()[settled]
+    # the phases are only followed, not searched for repetitions
+    phases = EnsembleGameOfLifeModel(len(cells), ensemble.get_width(), ensemble.get_height(),
+                                     rule=ensemble.get_rule(), cycle_history=1)
+    phases.set_boards(cells)
+    union = cells.copy()
+    for i in range(int(ensemble.get_periods()[settled].max()) - 1):
+        phases.update_state()
+        union |= phases.get_grid_view()
+    return union
+
+
+@functools.lru_cache(maxsize=None)
+def census_table(rule: str) -> Census:
+    """
+    Builds the table of known objects once per worker process.
+    :param rule: rulestring in B/S notation
+    :return: the census of the built-in objects and of the structure library
+    """
+    return Census(rule, LIBRARY)
+
+
+def soup(index: int, parameters: {}) -> np.ndarray:
+    """
+    :param index: index of the soup in the search
+    :param parameters: dictionary of the search parameters
+    :return: height x width board of uint8 cells with the random square of the soup in its middle
+    """
+    size = parameters['size']
+    width = parameters['width']
+    height = parameters['height']
+    rng = np.random.default_rng([parameters['seed'], index])
+    board = np.zeros((height, width), dtype=np.uint8)
+    top = (height - size) // 2
+    left = (width - size) // 2
+    board[top:top + size, left:left + size] = rng.random((size, size)) < parameters['density']
+    return board
+
+
+def read_census(path: str, parameters: {}) -> {}:
+    """
+    :param path: path of the census file
+    :param parameters: dictionary of the search parameters
+    :return: the census stored in the file; an empty census if the file does not exist
+    """
+    if not os.path.exists(path):
+        return {'parameters': dict(parameters), 'completed': 0, 'finished': [], 'soups': 0, 'census': {}}
+    with open(path) as f:
+        census = json.load(f)
+    if census['parameters'] != parameters:
+        raise ValueError('Invalid Census File!')
+    return census
+
+
+def merge_census(census: {}, batch: int, counts: {str: int}, size: int):
+    """
+    Adds the census of a finished batch to the total census. The count of batches finished from the first one on
+    moves past the batch and past the later batches which already finished.
+    :param census: the total census
+    :param batch: index of the finished batch
+    :param counts: census of the batch
+    :param size: number of soups in a batch
+    """
+    finished = set(census['finished'])
+    finished.add(batch)
+    while census['completed'] in finished:
+        finished.remove(census['completed'])
+        census['completed'] += 1
+    census['finished'] = sorted(finished)
+    census['soups'] += size
+    for (key, n) in counts.items():
+        census['census'][key] = census['census'].get(key, 0) + n
+
+
+def write_census(path: str, census: {}):
+    """
+    Writes the census to a temporary file which then replaces the census file, so an interrupted write never
+    leaves a truncated census behind.
+    :param path: path of the census file
+    :param census: the census
+    """
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as f:
+        json.dump(census, f, indent=4, sort_keys=True)
+    os.replace(temporary, path)
+
+
+def read_argument(args: [str], key: str, default, convert=int):
+    """
+    Searches through a list of arguments and identifies the value of a parameter with the provided key.
+    :param args: list of string arguments through which to parse
+    :param key: the string which indicates the parameter that needs to be identified
+    :param default: the value returned when the parameter is not present
+    :param convert: function converting the string value
+    :return: the value of the parameter if present; default if parameter is not present
+    """
+    i = 0
+    while i < len(args) - 1:
+        if args[i] == key:
+            return convert(args[i + 1])
+        i += 1
+    return default
+
+
+if __name__ == '__main__':
+    main()
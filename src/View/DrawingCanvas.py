@@ -65,7 +65,7 @@ class DrawingCanvas(IDrawingCanvas):
 
     def initialize_cells(self):
         """ Draws dead cells in the background to create a grid."""
-        grid = self.__model.get_grid()
+        grid = self.__model.get_grid_view()
         outer_idx = 0
         while outer_idx < len(grid):
             inner_idx = 0
@@ -77,7 +77,7 @@ class DrawingCanvas(IDrawingCanvas):
     def draw_game(self):
         """ Draws the living cells above the dead cells."""
         self.__remove_surface()
-        grid = self.__model.get_grid()
+        grid = self.__model.get_grid_view()
         outer_idx = 0
         while outer_idx < len(grid):
             inner_idx = 0
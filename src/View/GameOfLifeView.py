@@ -18,12 +18,16 @@ class GameOfLifeView(IGameOfLifeView):
     __canvas: where the cell of the game are displayed
     __button_frame: widget which will house the buttons within the view
     __button_next: button which the user can press to update the state of the game
+    __button_skip: button which the user can press to update the state of the game by several generations
     __button_start: button that starts and stops the automatic progression of the game
     __button_exit: button that exits and terminates the game
     __button_reset: button that is used to reset the game; clean grid
+    __button_undo: button that reverts the most recent change of the grid
+    __button_redo: button that applies the most recently reverted change of the grid again
     __speed_slider: scale used to control the speed at which the game automatically advances
     __view_mode_frame: frame which houses the options to change the coloring style of the grid
     __generate_structure_frame: frame which houses the options to populate the grid with a specific pattern
+    __cycle_label: label reporting that the board stopped changing or repeats periodically
 
     Methods
     -------
@@ -50,6 +54,12 @@ class GameOfLifeView(IGameOfLifeView):
     update_struct_options(controller):
         Updates the structure option menu after changes to the library have been made.
 
+    toggle_start_stop_button(boolean):
+        shows whether the game is playing on the start button
+
+    show_cycle(cycle):
+        reports a static or periodic board (or clears the report)
+
     __initialize_buttons():
         place the interactive components of the view into the window
 
@@ -85,11 +95,16 @@ class GameOfLifeView(IGameOfLifeView):
         self.__speed_slider = tkinter.Frame(self.__button_frame, padx=20)
         # widget for managing structures
         self.__manage_frame = tkinter.Frame(self, pady=5)
+        # widget reporting static and periodic boards
+        self.__cycle_label = tkinter.Label(self.__manage_frame, text='', font=("Arial", 15), padx=20)
 
         self.__button_next = None
+        self.__button_skip = None
         self.__button_start = None
         self.__button_exit = None
         self.__button_reset = None
+        self.__button_undo = None
+        self.__button_redo = None
         self.__button_manage = None
         self.__button_add = None
 
@@ -143,6 +158,16 @@ class GameOfLifeView(IGameOfLifeView):
         # next button
         self.__button_next = tkinter.Button(self.__button_frame, text='Next',
                                             command=lambda c='next': controller.action_performed(c))
+        # skip button
+        self.__button_skip = tkinter.Button(self.__button_frame, text='Skip 10',
+                                            command=lambda c='fast forward': controller.action_performed(c, 10))
+        # undo and redo buttons (also bound to Ctrl+Z and Ctrl+Y)
+        self.__button_undo = tkinter.Button(self.__button_frame, text='Undo',
+                                            command=lambda c='undo': controller.action_performed(c))
+        self.__button_redo = tkinter.Button(self.__button_frame, text='Redo',
+                                            command=lambda c='redo': controller.action_performed(c))
+        self.bind('<Control-z>', lambda event, c='undo': controller.action_performed(c))
+        self.bind('<Control-y>', lambda event, c='redo': controller.action_performed(c))
         # clicking on grid to toggle cells state
         self.__canvas.bind("<Button-1>", lambda event, c='toggle cell': controller.action_performed(c, event))
 
@@ -181,18 +206,34 @@ class GameOfLifeView(IGameOfLifeView):
         else:
             self.__button_start['text'] = 'Start'
 
+    def show_cycle(self, cycle: (int, int)):
+        """
+        Reports that the board repeats itself.
+        :param cycle: (period, generation) reported by the model; None clears the report
+        """
+        if cycle is None:
+            self.__cycle_label['text'] = ''
+        elif cycle[0] == 1:
+            self.__cycle_label['text'] = 'Static since generation ' + str(cycle[1] - 1)
+        else:
+            self.__cycle_label['text'] = 'Period ' + str(cycle[0]) + ' detected at generation ' + str(cycle[1])
+
     def __initialize_buttons(self):
         """ Place the interactive components of the view into the window. """
         self.__button_exit.pack(side='left')
         self.__button_reset.pack(side='left')
         self.__button_next.pack(side='left')
+        self.__button_skip.pack(side='left')
         self.__button_start.pack(side='left')
+        self.__button_undo.pack(side='left')
+        self.__button_redo.pack(side='left')
         self.__view_mode_frame.pack(side='left')
         self.__speed_slider.pack(side='left')
         self.__generate_structure_frame.pack(side='right')
         self.__button_frame.pack(side='top')
         self.__button_add.pack(side='left')
         self.__button_manage.pack(side='right')
+        self.__cycle_label.pack(side='right')
         self.__manage_frame.pack(side='bottom')
 
     def change_style(self, style_name: str):
@@ -29,6 +29,9 @@ class IGameOfLifeView(tkinter.Tk, abc.ABC):
 
     update_struct_options(controller):
         Updates the structure option menu after changes to the library have been made.
+
+    show_cycle(cycle):
+        reports that the board repeats itself (or clears the report)
     """
 
     @abc.abstractmethod
@@ -72,3 +75,11 @@ class IGameOfLifeView(tkinter.Tk, abc.ABC):
         :param controller: controller which will listen to commands from the user
         """
         pass
+
+    @abc.abstractmethod
+    def show_cycle(self, cycle: (int, int)):
+        """
+        Reports that the board repeats itself, after which the controller stopped playing.
+        :param cycle: (period, generation) reported by the model; None clears the report
+        """
+        pass
@@ -32,5 +32,11 @@ class MockView(GameOfLifeView):
     def update_struct_options(self, controller: IController):
         self.__call_log += "update_struct_options called; "
 
+    def toggle_start_stop_button(self, boolean: bool):
+        self.__call_log += "toggle_start_stop_button called: " + str(boolean) + "; "
+
+    def show_cycle(self, cycle):
+        self.__call_log += "show_cycle called: " + str(cycle) + "; "
+
     def get_call_log(self):
         return self.__call_log